@@ -38,6 +38,9 @@ class AnnotationAgent:
         self.llm = llm
         self.schema_dir = schema_dir
         self.json_schema_loader: HedJsonSchemaLoader | None = None
+        self._vocabularies: dict[str, tuple[list[str], list[str]]] = {}
+        # Hint-free system prompts keyed by (schema_version, no_extend)
+        self._system_prompts: dict[tuple[str, bool], str] = {}
 
     def _load_json_schema(self, schema_version: str) -> HedJsonSchemaLoader | None:
         """Load JSON schema for given version.
@@ -87,15 +90,13 @@ class AnnotationAgent:
         if not tag_suggestions:
             return ""
 
-        lines = ["\nSuggested VALID HED tag replacements for invalid tags:"]
-        for invalid_tag, suggestions in tag_suggestions.items():
-            if suggestions:
-                lines.append(f"  Instead of '{invalid_tag}', use: {', '.join(suggestions[:3])}")
-            else:
-                lines.append(
-                    f"  '{invalid_tag}' has no direct match; check the HED schema vocabulary"
-                )
-        return "\n".join(lines)
+        lines = "\n".join(
+            f"  Instead of '{invalid_tag}', use: {', '.join(suggestions[:3])}"
+            if suggestions
+            else f"  '{invalid_tag}' has no direct match; check the HED schema vocabulary"
+            for invalid_tag, suggestions in tag_suggestions.items()
+        )
+        return f"\nSuggested VALID HED tag replacements for invalid tags:\n{lines}"
 
     def _build_user_prompt(
         self,
@@ -140,18 +141,25 @@ Fix these errors and generate a corrected HED annotation for:
 
 CRITICAL: Output ONLY the raw HED annotation string."""
 
-    async def annotate(self, state: HedAnnotationState) -> dict:
-        """Generate or refine a HED annotation.
+    def load_vocabulary(self, schema_version: str) -> tuple[list[str], list[str]]:
+        """Load the tag vocabulary used in the system prompt.
+
+        The result is cached per schema version. Loading is blocking, so the
+        workflow can run it in a thread while other preprocessing is underway.
 
         Args:
-            state: Current annotation workflow state
+            schema_version: HED schema version
 
         Returns:
-            State update with new annotation
+            Tuple of (vocabulary, extendable_tags)
         """
+        cached = self._vocabularies.get(schema_version)
+        if cached is not None:
+            return cached
+
         # Load JSON schema (if schema_dir provided) or use HED library
         if self.json_schema_loader is None:
-            self.json_schema_loader = self._load_json_schema(state["schema_version"])
+            self.json_schema_loader = self._load_json_schema(schema_version)
 
         # Get vocabulary and extensionAllowed tags
         if self.json_schema_loader is not None:
@@ -163,20 +171,59 @@ CRITICAL: Output ONLY the raw HED annotation string."""
             from src.utils.schema_loader import get_schema_loader
 
             schema_loader = get_schema_loader()
-            schema = schema_loader.load_schema(state["schema_version"])
+            schema = schema_loader.load_schema(schema_version)
             vocabulary = schema_loader.get_schema_vocabulary(schema)
             # Without JSON schema, we don't know which tags are extendable
             # Use empty list - LLM will still generate valid annotations
             extendable_tags = []
 
-        # Build prompts with complete HED rules (including semantic hints if available)
-        semantic_hints = state.get("semantic_hints", [])
-        no_extend = state.get("no_extend", False)
+        self._vocabularies[schema_version] = (vocabulary, extendable_tags)
+        return vocabulary, extendable_tags
+
+    def get_system_prompt(
+        self,
+        schema_version: str,
+        semantic_hints: list[dict] | None = None,
+        no_extend: bool = False,
+    ) -> str:
+        """Get the system prompt with complete HED rules for a schema version.
+
+        Prompts without semantic hints depend only on the schema version and
+        no_extend, so they are built once and reused by later calls.
+
+        Args:
+            schema_version: HED schema version
+            semantic_hints: Optional semantic search results with relevant tags
+            no_extend: If True, prohibit tag extensions
+
+        Returns:
+            System prompt string
+        """
+        key = (schema_version, no_extend)
+        if not semantic_hints and key in self._system_prompts:
+            return self._system_prompts[key]
+
+        vocabulary, extendable_tags = self.load_vocabulary(schema_version)
         system_prompt = self._build_system_prompt(
-            vocabulary,
-            extendable_tags,
-            semantic_hints if semantic_hints else None,
-            no_extend,
+            vocabulary, extendable_tags, semantic_hints or None, no_extend
+        )
+        if not semantic_hints:
+            self._system_prompts[key] = system_prompt
+        return system_prompt
+
+    async def annotate(self, state: HedAnnotationState) -> dict:
+        """Generate or refine a HED annotation.
+
+        Args:
+            state: Current annotation workflow state
+
+        Returns:
+            State update with new annotation
+        """
+        system_prompt = self.get_system_prompt(
+            state["schema_version"],
+            state.get("semantic_hints", []),
+            state.get("no_extend", False),
         )
 
         # Build user prompt with any feedback (use augmented errors with remediation for LLM)
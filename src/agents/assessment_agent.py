@@ -119,5 +119,5 @@ Provide brief assessment in the specified format."""
         return {
             "assessment_feedback": feedback,
             "is_complete": is_complete,
-            "messages": state.get("messages", []) + messages + [response],
+            "messages": messages + [response],  # Appended by the add_messages reducer
         }
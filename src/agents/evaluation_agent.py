@@ -4,6 +4,8 @@ This agent evaluates how faithfully a HED annotation captures
 the original natural language event description.
 """
 
+import logging
+from collections import OrderedDict
 from pathlib import Path
 
 from langchain_core.language_models import BaseChatModel
@@ -12,6 +14,11 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from src.agents.state import HedAnnotationState
 from src.utils.json_schema_loader import HedJsonSchemaLoader, load_latest_schema
 
+logger = logging.getLogger(__name__)
+
+# Number of recent (description, annotation) evaluations kept per agent
+EVALUATION_CACHE_SIZE = 64
+
 
 class EvaluationAgent:
     """Agent that evaluates the faithfulness of HED annotations.
@@ -31,6 +38,8 @@ class EvaluationAgent:
         self.llm = llm
         self.schema_dir = schema_dir
         self.json_schema_loader: HedJsonSchemaLoader | None = None
+        # Refinements often regenerate an annotation that was already evaluated
+        self._evaluation_cache: OrderedDict[tuple[str, str], tuple[str, bool]] = OrderedDict()
 
     def _build_system_prompt(self) -> str:
         """Build the system prompt for evaluation.
@@ -136,14 +145,23 @@ Provide a thorough evaluation following the specified format."""
             state: Current annotation workflow state
 
         Returns:
-            State update with evaluation feedback
+            State update with evaluation feedback (without messages when an
+            earlier evaluation of the same annotation is reused)
         """
+        annotation = state["current_annotation"]
+        cache_key = (state["input_description"], annotation)
+        cached = self._evaluation_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Reusing evaluation of unchanged annotation")
+            self._evaluation_cache.move_to_end(cache_key)
+            feedback, is_faithful = cached
+            return {"evaluation_feedback": feedback, "is_faithful": is_faithful, "messages": []}
+
         # Load schema if needed (only if schema_dir provided)
         if self.json_schema_loader is None and self.schema_dir is not None:
             self.json_schema_loader = load_latest_schema(self.schema_dir)
 
         # Check for potentially invalid tags and suggest matches
-        annotation = state["current_annotation"]
         suggestions = self._check_tags_and_suggest(annotation)
 
         # Build prompts
@@ -170,11 +188,15 @@ Provide a thorough evaluation following the specified format."""
         # Parse decision with multiple fallbacks
         is_faithful = self._parse_decision(feedback)
 
+        self._evaluation_cache[cache_key] = (feedback, is_faithful)
+        if len(self._evaluation_cache) > EVALUATION_CACHE_SIZE:
+            self._evaluation_cache.popitem(last=False)
+
         # Update state
         return {
             "evaluation_feedback": feedback,
             "is_faithful": is_faithful,
-            "messages": state.get("messages", []) + messages + [response],
+            "messages": messages + [response],  # Appended by the add_messages reducer
         }
 
     def _parse_decision(self, feedback: str) -> bool:
@@ -241,7 +263,7 @@ Provide a thorough evaluation following the specified format."""
                 continue
 
             # Check if tag or its base (before /) is in vocabulary
-            base_tag = tag.split("/")[0]
+            base_tag = tag.partition("/")[0]
             if base_tag not in vocabulary:
                 # Find closest matches
                 matches = self.json_schema_loader.find_closest_match(base_tag)
@@ -268,7 +268,7 @@ class FeedbackTriageAgent:
 
             return json.loads(content)
         except json.JSONDecodeError:
-            logger.warning(f"Failed to parse classification response: {content}")
+            logger.warning("Failed to parse classification response: %s", content)
             return {
                 "category": "noise",
                 "severity": "low",
@@ -318,7 +318,7 @@ class FeedbackTriageAgent:
 
             return json.loads(content)
         except json.JSONDecodeError:
-            logger.warning(f"Failed to parse similarity response: {content}")
+            logger.warning("Failed to parse similarity response: %s", content)
             return {"has_similar": False, "similar_number": None, "similarity_score": 0.0}
 
     async def generate_issue_content(
@@ -360,7 +360,7 @@ class FeedbackTriageAgent:
 
             return json.loads(content)
         except json.JSONDecodeError:
-            logger.warning(f"Failed to parse issue content response: {content}")
+            logger.warning("Failed to parse issue content response: %s", content)
             return {
                 "title": f"[Feedback] {classification.get('summary', 'User feedback')}",
                 "body": f"## User Feedback\n\n{feedback.to_summary()}",
@@ -385,7 +385,7 @@ class FeedbackTriageAgent:
         """
         # Step 1: Classify feedback
         classification = await self.classify_feedback(feedback)
-        logger.info(f"Classification: {classification}")
+        logger.info("Classification: %s", classification)
 
         # If not actionable, archive
         if not classification.get("actionable", True) or classification.get("category") == "noise":
@@ -409,7 +409,7 @@ class FeedbackTriageAgent:
 
         if existing_items:
             similarity_result = await self.find_similar_items(feedback, existing_items)
-            logger.info(f"Similarity result: {similarity_result}")
+            logger.info("Similarity result: %s", similarity_result)
 
             if (
                 similarity_result.get("has_similar")
@@ -496,11 +496,11 @@ class FeedbackTriageAgent:
             try:
                 existing_items = await self.github_client.get_all_open_items()
             except Exception as e:
-                logger.warning(f"Failed to fetch GitHub items: {e}")
+                logger.warning("Failed to fetch GitHub items: %s", e)
 
         # Perform triage
         result = await self.triage(feedback, existing_items)
-        logger.info(f"Triage result: {result}")
+        logger.info("Triage result: %s", result)
 
         output = {
             "action": result.action,
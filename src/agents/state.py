@@ -4,7 +4,8 @@ This module defines the state structure that flows through the
 multi-agent annotation pipeline.
 """
 
-from typing import Annotated, Literal
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph import add_messages
@@ -78,6 +79,39 @@ class HedAnnotationState(TypedDict):
     no_extend: bool  # If True, prohibit tag extensions (use only existing vocabulary)
 
 
+@lru_cache(maxsize=64)
+def _proto_state(
+    schema_version: str,
+    max_validation_attempts: int,
+    max_total_iterations: int,
+    run_assessment: bool,
+    no_extend: bool,
+) -> tuple[tuple[str, Any], ...]:
+    """Build the immutable part of an initial state for one configuration.
+
+    Mutable containers are left out so each run gets fresh lists and dicts.
+
+    Returns:
+        Tuple of (key, value) pairs shared by all runs with this configuration
+    """
+    return (
+        ("current_annotation", ""),
+        ("validation_status", "pending"),
+        ("validation_attempts", 0),
+        ("total_iterations", 0),
+        ("evaluation_feedback", ""),
+        ("assessment_feedback", ""),
+        ("is_valid", False),
+        ("is_faithful", False),
+        ("is_complete", False),
+        ("max_validation_attempts", max_validation_attempts),
+        ("max_total_iterations", max_total_iterations),
+        ("schema_version", schema_version),
+        ("run_assessment", run_assessment),
+        ("no_extend", no_extend),
+    )
+
+
 def create_initial_state(
     input_description: str,
     schema_version: str = "8.4.0",
@@ -103,28 +137,24 @@ def create_initial_state(
     Returns:
         Initial HedAnnotationState
     """
-    return HedAnnotationState(
+    state = dict(
+        _proto_state(
+            schema_version,
+            max_validation_attempts,
+            max_total_iterations,
+            run_assessment,
+            no_extend,
+        )
+    )
+    state.update(
         messages=[],
         input_description=input_description,
-        current_annotation="",
-        validation_status="pending",
         validation_errors=[],
         validation_warnings=[],
         validation_errors_augmented=[],
         validation_warnings_augmented=[],
-        validation_attempts=0,
-        total_iterations=0,
-        evaluation_feedback="",
-        assessment_feedback="",
-        is_valid=False,
-        is_faithful=False,
-        is_complete=False,
-        max_validation_attempts=max_validation_attempts,
-        max_total_iterations=max_total_iterations,
-        schema_version=schema_version,
-        run_assessment=run_assessment,
         extracted_keywords=extracted_keywords or [],
         semantic_hints=semantic_hints or [],
         tag_suggestions={},
-        no_extend=no_extend,
     )
+    return state  # type: ignore[return-value]
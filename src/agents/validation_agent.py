@@ -7,10 +7,18 @@ it uses hed-lsp CLI to suggest valid alternatives.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
+from hed import HedString
+from hed.schema import load_schema_version
+
 from src.agents.state import HedAnnotationState
 from src.utils.error_remediation import get_remediator
 from src.utils.schema_loader import HedSchemaLoader
@@ -26,11 +34,34 @@ from src.validation.hed_validator import (
 logger = logging.getLogger(__name__)
 
 
+# Number of recent validation outcomes kept per agent. Agents are shared by
+# all workflows with the same validator settings, so this spans many runs.
+RESULT_CACHE_SIZE = 256
+
+# Number of hed-lsp suggestion lists kept per agent, keyed by (tag, schema_version).
+# Tags come from LLM output, so the key space is open-ended.
+SUGGESTION_CACHE_SIZE = 1024
+
+# Error codes reported when the validator itself failed (setup errors, Node.js
+# worker crashes and timeouts), not the annotation; such outcomes are not cached
+VALIDATOR_FAILURE_CODES = frozenset(
+    {"VALIDATOR_INIT_ERROR", "VALIDATOR_ERROR", "VALIDATION_ERROR", "TIMEOUT", "PARSE_ERROR"}
+)
+
+# Characters that separate tags in a HED string
+HED_DELIMITERS = frozenset(",()")
+
+# Potential extended tags (word/word patterns): a capitalized base tag
+# followed by one or more /Segment parts
+_EXTENDED_TAG_PATTERN = re.compile(r"\b([A-Z][a-zA-Z-]*(?:/[A-Za-z][a-zA-Z-]*)+)")
+
+
 def strip_extensions(annotation: str, extended_tags: list[str]) -> str:
     """Strip extensions from an annotation, replacing with base tags.
 
     For each extended tag like 'Animal/Marmoset', replaces with just 'Animal'.
-    Handles both simple replacements and preserves HED structure.
+    The annotation is scanned once, splitting on HED delimiters, so parentheses,
+    commas, and whitespace around each tag are preserved exactly.
 
     Args:
         annotation: The HED annotation string
@@ -39,23 +70,55 @@ def strip_extensions(annotation: str, extended_tags: list[str]) -> str:
     Returns:
         Annotation with extensions stripped
     """
-    result = annotation
+    # Map "Animal/Marmoset" -> "Animal"; tags without an extension are ignored
+    base_map = {tag: tag.partition("/")[0] for tag in extended_tags if "/" in tag}
+    if not base_map:
+        return annotation
 
-    for extended_tag in extended_tags:
-        if "/" not in extended_tag:
-            continue
+    parts: list[str] = []
+    token_start = 0
+    for i, char in enumerate(annotation):
+        if char in HED_DELIMITERS:
+            parts.append(_strip_token(annotation[token_start:i], base_map))
+            parts.append(char)
+            token_start = i + 1
+    parts.append(_strip_token(annotation[token_start:], base_map))
 
-        # Split into base and extension: "Animal/Marmoset" -> ("Animal", "Marmoset")
-        parts = extended_tag.split("/", 1)
-        base_tag = parts[0]
+    return "".join(parts)
 
-        # Replace the extended tag with just the base
-        # Use word boundaries to avoid partial matches
-        # Handle cases like (Animal/Marmoset, ...) or Animal/Marmoset,
-        pattern = re.escape(extended_tag)
-        result = re.sub(pattern, base_tag, result)
 
-    return result
+def _strip_token(token: str, base_map: dict[str, str]) -> str:
+    """Replace a single delimited token with its base tag if it is extended.
+
+    Args:
+        token: Text between two HED delimiters, including surrounding whitespace
+        base_map: Mapping of extended tags to their base tags
+
+    Returns:
+        The token with the extended tag replaced, whitespace preserved
+    """
+    tag = token.strip()
+    base_tag = base_map.get(tag)
+    if base_tag is None:
+        return token
+    return token.replace(tag, base_tag, 1)
+
+
+@lru_cache(maxsize=1024)
+def _clean_tag_name(tag: str) -> str:
+    """Reduce a reported tag to its last meaningful path segment.
+
+    Value placeholders are stripped first (e.g. "Duration/#" -> "Duration").
+
+    Args:
+        tag: Tag as reported by the validator
+
+    Returns:
+        Last path segment of the tag, or an empty string
+    """
+    parent, sep, last = tag.rpartition("/")
+    clean_tag = parent if sep and last.startswith("#") else tag
+    return clean_tag.rstrip("/").rpartition("/")[2].strip()
 
 
 class ValidationAgent:
@@ -67,13 +130,30 @@ class ValidationAgent:
     """
 
     # Error codes that indicate invalid or extended tags
-    TAG_ERROR_CODES = [
-        "TAG_INVALID",
-        "TAG_EXTENSION_INVALID",
-        "TAG_NOT_UNIQUE",
-        "TAG_REQUIRES_CHILD",
-        "TAG_NAMESPACE_PREFIX_INVALID",
-    ]
+    TAG_ERROR_CODES: frozenset[str] = frozenset(
+        {
+            "TAG_INVALID",
+            "TAG_EXTENSION_INVALID",
+            "TAG_NOT_UNIQUE",
+            "TAG_REQUIRES_CHILD",
+            "TAG_NAMESPACE_PREFIX_INVALID",
+        }
+    )
+
+    # Fixed attribute layout: attributes are read on every validate() call
+    __slots__ = (
+        "schema_loader",
+        "use_javascript",
+        "validator_path",
+        "error_remediator",
+        "use_hed_lsp",
+        "_validators",
+        "_validator_lock",
+        "_extension_allowed_cache",
+        "_suggestion_cache",
+        "_suggestion_cache_lock",
+        "_result_cache",
+    )
 
     def __init__(
         self,
@@ -98,15 +178,30 @@ class ValidationAgent:
         self.error_remediator = get_remediator(tests_json_path)
         self.use_hed_lsp = use_hed_lsp and is_hed_lsp_available()
 
-        # Validator is lazily initialized on first use via _get_or_create_validator
-        self._validator: HedJavaScriptValidator | HedPythonValidator | None = None
-        self._cached_schema_version: str | None = None
+        # Validators keyed by schema version, created on first use via _get_or_create_validator
+        self._validators: dict[str, HedJavaScriptValidator | HedPythonValidator] = {}
+        # warm_up creates validators in a worker thread while requests may
+        # create them on the event loop; only one of them may build each
+        self._validator_lock = threading.Lock()
+
+        # Whether a base tag allows extension, keyed by (id(schema), base_tag).
+        # Loaded schemas are cached and immutable, so entries never go stale.
+        self._extension_allowed_cache: dict[tuple[int, str], bool] = {}
+
+        # hed-lsp suggestions keyed by (tag, schema_version), reused across retries, LRU-bounded
+        self._suggestion_cache: OrderedDict[tuple[str, str], list[str]] = OrderedDict()
+        # Validations run in worker threads, so cache updates are serialized
+        self._suggestion_cache_lock = threading.Lock()
 
-        # Direct JS validator creation when use_javascript=True
+        # Validation outcomes keyed by (schema_version, no_extend, annotation), LRU-bounded
+        self._result_cache: OrderedDict[tuple[str, bool, str], dict] = OrderedDict()
+
+        # Direct JS validator creation when use_javascript=True (checks the installation)
         if use_javascript:
             if validator_path is None:
                 raise ValueError("validator_path required when use_javascript=True")
-            self._validator = HedJavaScriptValidator(validator_path)
+            validator = HedJavaScriptValidator(validator_path)
+            self._validators[validator.schema_version] = validator
 
     def _extract_problematic_tags(self, errors: list, warnings: list) -> list[str]:
         """Extract problematic tag names from validation errors and warnings.
@@ -118,21 +213,14 @@ class ValidationAgent:
         Returns:
             List of problematic tag names
         """
-        problematic_tags = []
-
-        for issue in errors + warnings:
-            # Check if this is a tag-related error
-            if issue.code in self.TAG_ERROR_CODES:
-                if issue.tag:
-                    # Strip value placeholders (e.g. "Duration/#" -> "Duration")
-                    # before extracting the last meaningful path segment
-                    clean_tag = re.sub(r"/#[^/]*$", "", issue.tag).rstrip("/")
-                    tag_name = clean_tag.split("/")[-1] if "/" in clean_tag else clean_tag
-                    tag_name = tag_name.strip()
-                    if tag_name and tag_name not in problematic_tags:
-                        problematic_tags.append(tag_name)
-
-        return problematic_tags
+        tag_error_codes = self.TAG_ERROR_CODES
+        tag_names = (
+            _clean_tag_name(issue.tag)
+            for issue in chain(errors, warnings)
+            if issue.code in tag_error_codes and issue.tag
+        )
+        # dict.fromkeys dedupes while keeping first-seen order
+        return list(dict.fromkeys(name for name in tag_names if name))
 
     def _get_tag_suggestions(
         self, problematic_tags: list[str], schema_version: str
@@ -149,19 +237,41 @@ class ValidationAgent:
         if not self.use_hed_lsp or not problematic_tags:
             return {}
 
-        try:
-            return suggest_tags_for_keywords(
-                problematic_tags,
-                schema_version=schema_version,
-                max_results=5,  # Limit suggestions for clarity
-            )
-        except (RuntimeError, OSError) as e:
-            logger.warning(
-                "Failed to get tag suggestions from hed-lsp for tags %s: %s",
-                problematic_tags,
-                e,
-            )
-            return {}
+        # The same invalid tags tend to recur across retries; only query new ones
+        found: dict[str, list[str]] = {}
+        missing = []
+        with self._suggestion_cache_lock:
+            for tag in problematic_tags:
+                key = (tag, schema_version)
+                cached = self._suggestion_cache.get(key)
+                if cached is None:
+                    missing.append(tag)
+                else:
+                    self._suggestion_cache.move_to_end(key)
+                    found[tag] = cached
+        if missing:
+            try:
+                fetched = suggest_tags_for_keywords(
+                    missing,
+                    schema_version=schema_version,
+                    max_results=5,  # Limit suggestions for clarity
+                )
+            except (RuntimeError, OSError) as e:
+                logger.warning(
+                    "Failed to get tag suggestions from hed-lsp for tags %s: %s",
+                    missing,
+                    e,
+                )
+                fetched = {}
+            with self._suggestion_cache_lock:
+                for tag in missing:
+                    if tag in fetched:
+                        found[tag] = fetched[tag]
+                        self._suggestion_cache[(tag, schema_version)] = fetched[tag]
+                while len(self._suggestion_cache) > SUGGESTION_CACHE_SIZE:
+                    self._suggestion_cache.popitem(last=False)
+
+        return {tag: found[tag] for tag in problematic_tags if tag in found}
 
     async def validate(self, state: HedAnnotationState) -> dict:
         """Validate the current HED annotation.
@@ -176,6 +286,66 @@ class ValidationAgent:
         schema_version = state["schema_version"]
         no_extend = state.get("no_extend", False)
 
+        # Retries often reproduce an earlier annotation; reuse its validation outcome
+        cache_key = (schema_version, no_extend, annotation)
+        outcome = self._result_cache.get(cache_key)
+        if outcome is None:
+            # Validators block (the JavaScript one waits on its Node.js worker);
+            # a worker thread keeps the event loop free for concurrent work
+            outcome = await asyncio.to_thread(
+                self._validate_annotation, annotation, schema_version, no_extend
+            )
+            # A validator failure says nothing about the annotation; retry it next time
+            if not outcome["validator_failed"]:
+                self._result_cache[cache_key] = outcome
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        else:
+            logger.debug("Reusing validation result for unchanged annotation")
+            self._result_cache.move_to_end(cache_key)
+
+        # Determine validation status
+        validation_attempts = state["validation_attempts"] + 1
+        max_attempts = state["max_validation_attempts"]
+        is_valid = outcome["is_valid"]
+
+        if is_valid:
+            validation_status = "valid"
+        elif validation_attempts >= max_attempts:
+            validation_status = "max_attempts_reached"
+        else:
+            validation_status = "invalid"
+
+        # Build result dict (copy cached containers so state updates never share them)
+        result_dict = {
+            "validation_status": validation_status,
+            "validation_errors": list(outcome["validation_errors"]),
+            "validation_warnings": list(outcome["validation_warnings"]),
+            "validation_errors_augmented": list(outcome["validation_errors_augmented"]),
+            "validation_warnings_augmented": list(outcome["validation_warnings_augmented"]),
+            "validation_attempts": validation_attempts,
+            "is_valid": is_valid,
+            "tag_suggestions": dict(outcome["tag_suggestions"]),
+        }
+
+        # If we stripped extensions, update the annotation in the result
+        if "current_annotation" in outcome:
+            result_dict["current_annotation"] = outcome["current_annotation"]
+
+        return result_dict
+
+    def _validate_annotation(self, annotation: str, schema_version: str, no_extend: bool) -> dict:
+        """Validate an annotation and collect the attempt-independent results.
+
+        Args:
+            annotation: HED annotation to validate
+            schema_version: Schema version to validate against
+            no_extend: Whether to strip tag extensions before validating
+
+        Returns:
+            Partial state update without attempt counting or status, plus a
+            validator_failed flag telling whether the validator itself failed
+        """
         # Validate using appropriate validator
         result = self._run_validation(annotation, schema_version)
 
@@ -188,8 +358,17 @@ class ValidationAgent:
 
             if extended_tags:
                 stripped_annotation = strip_extensions(annotation, extended_tags)
-                # Re-validate the stripped annotation
-                result = self._run_validation(stripped_annotation, schema_version)
+                schema = load_schema_version(schema_version)
+                if self._can_reuse_result_after_strip(result, annotation, extended_tags, schema):
+                    # Stripping only drops the extensions; the rest already passed
+                    result = ValidationResult(
+                        is_valid=True,
+                        errors=[],
+                        warnings=[w for w in result.warnings if w.code != "TAG_EXTENDED"],
+                    )
+                else:
+                    # Re-validate the stripped annotation
+                    result = self._run_validation(stripped_annotation, schema_version)
 
         # Extract error and warning messages (raw - for user display)
         raw_errors = [f"[{e.code}] {e.message}" for e in result.errors]
@@ -207,45 +386,84 @@ class ValidationAgent:
             if problematic_tags:
                 tag_suggestions = self._get_tag_suggestions(problematic_tags, schema_version)
 
-        # Determine validation status
-        validation_attempts = state["validation_attempts"] + 1
-        max_attempts = state["max_validation_attempts"]
-
         # IMPORTANT: Safeguard to ensure is_valid is only True when there are NO errors
         # This prevents discrepancies between is_valid flag and actual validation_errors
         is_valid = result.is_valid and len(raw_errors) == 0
 
-        if is_valid:
-            validation_status = "valid"
-        elif validation_attempts >= max_attempts:
-            validation_status = "max_attempts_reached"
-        else:
-            validation_status = "invalid"
-
-        # Build result dict
-        result_dict = {
-            "validation_status": validation_status,
+        outcome = {
             "validation_errors": raw_errors,  # Raw errors for user display
             "validation_warnings": raw_warnings,  # Raw warnings for user display
             "validation_errors_augmented": augmented_errors,  # For LLM feedback
             "validation_warnings_augmented": augmented_warnings,  # For LLM feedback
-            "validation_attempts": validation_attempts,
             "is_valid": is_valid,
             "tag_suggestions": tag_suggestions,  # LSP suggestions as first-class field
+            "validator_failed": any(e.code in VALIDATOR_FAILURE_CODES for e in result.errors),
         }
-
-        # If we stripped extensions, update the annotation in the result
         if stripped_annotation is not None:
-            result_dict["current_annotation"] = stripped_annotation
+            outcome["current_annotation"] = stripped_annotation
 
-        return result_dict
+        return outcome
+
+    @staticmethod
+    def _can_reuse_result_after_strip(
+        result: ValidationResult, annotation: str, extended_tags: list[str], schema: object
+    ) -> bool:
+        """Check whether stripping extensions can skip a second validation pass.
+
+        If the original annotation had no errors, replacing extended tags with
+        their base tags keeps it valid only for plain extensions: each base tag
+        must allow extension and take no value ("Label/Foo" would become a bare
+        "Label"), must be what strip_extensions leaves in place (it keeps the
+        first path segment, so "Item/Object/Foo" becomes "Item", not "Object"),
+        and must not then appear twice (e.g. "Animal/Cat, Animal/Dog" ->
+        "Animal, Animal").
+
+        Args:
+            result: Validation result for the unstripped annotation
+            annotation: The unstripped annotation
+            extended_tags: Extended tags that will be stripped
+            schema: Loaded HED schema the annotation was validated against
+
+        Returns:
+            True if the stripped annotation needs no re-validation
+        """
+        if result.errors:
+            return False
+
+        base_tags = []
+        for extended_tag in extended_tags:
+            parsed = HedString(extended_tag, schema).get_all_tags()  # type: ignore[arg-type]
+            if len(parsed) != 1:
+                return False
+            tag = parsed[0]
+            if (
+                not tag.extension
+                or tag.is_takes_value_tag()
+                or not tag.has_attribute("extensionAllowed")
+            ):
+                return False
+            base_tag = tag.short_base_tag.casefold()
+            if extended_tag.partition("/")[0].strip().casefold() != base_tag:
+                return False
+            base_tags.append(base_tag)
+        if len(set(base_tags)) != len(base_tags):
+            return False
+
+        existing_tags = {
+            tag.short_tag.casefold()
+            for tag in HedString(annotation, schema).get_all_tags()  # type: ignore[arg-type]
+            if not tag.extension
+        }
+        return existing_tags.isdisjoint(base_tags)
 
     def _get_or_create_validator(
         self, schema_version: str
     ) -> HedJavaScriptValidator | HedPythonValidator:
-        """Get or create the appropriate validator.
+        """Get or create the validator for a schema version.
 
-        The validator is cached after first creation.
+        Validators are cached per schema version, so a shared agent validates
+        every request against the version it asked for. Creation is guarded by
+        a lock (checked again inside it), so concurrent first calls build one.
 
         Args:
             schema_version: Schema version for validation
@@ -253,25 +471,47 @@ class ValidationAgent:
         Returns:
             Configured validator instance
         """
-        if self._validator is not None:
-            if (
-                self._cached_schema_version is not None
-                and self._cached_schema_version != schema_version
-            ):
-                logger.warning(
-                    "Validator cached with schema %s, requested %s; reusing cached validator",
-                    self._cached_schema_version,
-                    schema_version,
-                )
-            return self._validator
+        validator = self._validators.get(schema_version)
+        if validator is None:
+            with self._validator_lock:
+                validator = self._validators.get(schema_version)
+                if validator is None:
+                    if self.use_javascript:
+                        validator = HedJavaScriptValidator(
+                            self.validator_path,  # type: ignore[arg-type]
+                            schema_version=schema_version,
+                        )
+                    else:
+                        validator = get_validator(
+                            schema_version=schema_version,
+                            prefer_js=False,
+                            validator_path=self.validator_path,
+                        )
+                    self._validators[schema_version] = validator
+        return validator
+
+    def warm_up(self, schema_version: str) -> None:
+        """Set up the validator and load the schema ahead of the first validation.
+
+        The JavaScript validator's Node.js worker is started and primed with an
+        empty string, so it has loaded its schema by the time the first
+        annotation arrives. This is blocking; the workflow runs it in a thread
+        while the first annotation is being generated.
 
-        self._validator = get_validator(
-            schema_version=schema_version,
-            prefer_js=self.use_javascript,
-            validator_path=self.validator_path,
-        )
-        self._cached_schema_version = schema_version
-        return self._validator
+        Args:
+            schema_version: Schema version for validation
+        """
+        validator = self._get_or_create_validator(schema_version)
+        if isinstance(validator, HedJavaScriptValidator):
+            # The result is irrelevant; the request makes the worker load the schema
+            validator.validate("")
+        load_schema_version(schema_version)
+
+    def close(self) -> None:
+        """Release the validators' resources (the JavaScript validators' Node.js workers)."""
+        for validator in list(self._validators.values()):
+            if isinstance(validator, HedJavaScriptValidator):
+                validator.close()
 
     def _run_validation(self, annotation: str, schema_version: str) -> ValidationResult:
         """Run validation on an annotation string.
@@ -363,9 +603,6 @@ class ValidationAgent:
         Returns:
             List of extended tag strings (e.g., ['Animal/Marmoset'])
         """
-        from hed import HedString
-        from hed.schema import load_schema_version
-
         extended_tags = []
 
         try:
@@ -393,7 +630,9 @@ class ValidationAgent:
 
         return extended_tags
 
-    def _detect_extensions_via_regex(self, annotation: str, schema: object) -> list[str]:
+    def _detect_extensions_via_regex(
+        self, annotation: str, schema: object, max_extensions: int = 32
+    ) -> list[str]:
         """Detect extended tags using regex when HedString parsing fails.
 
         Finds patterns like "Parent/Extension" and checks if Parent is a valid
@@ -402,30 +641,76 @@ class ValidationAgent:
         Args:
             annotation: HED annotation string
             schema: Loaded HED schema object
+            max_extensions: Stop scanning once this many extended tags are found
 
         Returns:
             List of extended tag strings
         """
-        extended_tags = []
+        extended_tags: list[str] = []
 
-        # Find all potential extended tags (word/word patterns)
-        # Match: word characters, then /, then word characters
-        pattern = r"\b([A-Z][a-zA-Z-]*(?:/[A-Za-z][a-zA-Z-]*)+)"
-        matches = re.findall(pattern, annotation)
+        for found in _EXTENDED_TAG_PATTERN.finditer(annotation):
+            if len(extended_tags) >= max_extensions:
+                break
+            match = found.group(1)
 
-        for match in matches:
             # Split into base and extension parts
-            parts = match.split("/")
-            base_tag = parts[0]
+            base_tag = match.partition("/")[0]
 
             # Check if base_tag is a valid HED tag that allows extensions
-            # Get all tags from schema and check if base_tag is extendable
-            try:
-                tag_entry = schema.get_tag_entry(base_tag)  # type: ignore[attr-defined]
-                if tag_entry and tag_entry.has_attribute("extensionAllowed"):
-                    extended_tags.append(match)
-            except Exception as e:
-                # If we can't check the schema, log at warning level (silent in debug is invisible in prod)
-                logger.warning("Could not check if '%s' allows extensions: %s", base_tag, e)
+            cache_key = (id(schema), base_tag)
+            allowed = self._extension_allowed_cache.get(cache_key)
+            if allowed is None:
+                try:
+                    tag_entry = schema.get_tag_entry(base_tag)  # type: ignore[attr-defined]
+                    allowed = bool(tag_entry and tag_entry.has_attribute("extensionAllowed"))
+                except Exception as e:
+                    # If we can't check the schema, log at warning level (silent in debug is invisible in prod)
+                    logger.warning("Could not check if '%s' allows extensions: %s", base_tag, e)
+                    continue
+                self._extension_allowed_cache[cache_key] = allowed
+
+            if allowed:
+                extended_tags.append(match)
 
         return extended_tags
+
+
+# Validation agents shared by workflows, keyed by (use_javascript, validator_path)
+_shared_agents: dict[tuple[bool, str | None], ValidationAgent] = {}
+
+
+def get_shared_validation_agent(
+    use_javascript: bool = True,
+    validator_path: Path | None = None,
+) -> ValidationAgent:
+    """Get the process-wide validation agent for a validator configuration.
+
+    Workflows created per request reuse the same agent, so validator setup
+    and the schema, suggestion and result caches are shared between them.
+
+    Args:
+        use_javascript: Whether to use JavaScript validator
+        validator_path: Path to hed-javascript repository (required if use_javascript=True)
+
+    Returns:
+        Shared ValidationAgent instance
+    """
+    key = (use_javascript, str(validator_path) if validator_path is not None else None)
+    agent = _shared_agents.get(key)
+    if agent is None:
+        agent = ValidationAgent(
+            HedSchemaLoader(),
+            use_javascript=use_javascript,
+            validator_path=validator_path,
+        )
+        _shared_agents[key] = agent
+    return agent
+
+
+def close_shared_validation_agents() -> None:
+    """Close every shared validation agent, stopping their validator workers.
+
+    Called on application shutdown; agents requested afterwards start new workers.
+    """
+    for agent in _shared_agents.values():
+        agent.close()
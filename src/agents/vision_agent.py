@@ -4,6 +4,8 @@ This agent is responsible for analyzing images and generating detailed natural
 language descriptions that can be used for HED annotation.
 """
 
+import asyncio
+
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 
@@ -53,8 +55,9 @@ class VisionAgent:
         Raises:
             ImageProcessingError: If image validation fails
         """
-        # Prepare image and validate
-        data_uri, metadata = prepare_image_for_vision_model(image_data)
+        # Prepare image and validate; decoding a multi-MB image is blocking work,
+        # so keep it off the event loop
+        data_uri, metadata = await asyncio.to_thread(prepare_image_for_vision_model, image_data)
 
         # Use custom prompt or default
         prompt = custom_prompt or self.default_prompt
@@ -4,23 +4,187 @@ This module defines the multi-agent workflow that orchestrates
 annotation, validation, evaluation, and assessment.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import Any, TypeVar
 
 from langchain_core.language_models import BaseChatModel
-from langgraph.graph import END, StateGraph
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langgraph.graph import END, START, StateGraph
 
 from src.agents.annotation_agent import AnnotationAgent
 from src.agents.assessment_agent import AssessmentAgent
 from src.agents.evaluation_agent import EvaluationAgent
 from src.agents.feedback_summarizer import FeedbackSummarizer
 from src.agents.state import HedAnnotationState
-from src.agents.validation_agent import ValidationAgent
-from src.utils.schema_loader import HedSchemaLoader
-from src.validation.hed_lsp import HedLspClient, is_hed_lsp_available
+from src.agents.validation_agent import HED_DELIMITERS, get_shared_validation_agent
+from src.validation.hed_lsp import HedLspClient, get_shared_hed_lsp_client
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Validation feedback at or below these limits goes back to the annotation
+# agent as-is; summarizing it would cost an LLM call for little gain.
+SUMMARY_MAX_ERRORS = 2
+SUMMARY_MIN_ERROR_CHARS = 512
+
+# Run-config key under which each compiled graph finds its workflow instance
+WORKFLOW_CONFIG_KEY = "hed_workflow"
+
+# Validation result containers; cleared in state only when they held something
+_VALIDATION_CONTAINER_KEYS = (
+    "validation_errors",
+    "validation_warnings",
+    "validation_errors_augmented",
+    "validation_warnings_augmented",
+    "tag_suggestions",
+)
+
+# The graph structure only depends on whether semantic search is enabled, so it
+# is compiled once per process; workflows bind themselves via the run config.
+_COMPILED_GRAPHS: dict[bool, Any] = {}
+
+
+def _node(method_name: str) -> Callable[[HedAnnotationState, RunnableConfig], Awaitable[dict]]:
+    """Create a graph node that calls a workflow method on the bound instance.
+
+    Args:
+        method_name: Name of the async HedAnnotationWorkflow node method
+
+    Returns:
+        Node function for StateGraph.add_node
+    """
+
+    async def node(state: HedAnnotationState, config: RunnableConfig) -> dict:
+        workflow = config["configurable"][WORKFLOW_CONFIG_KEY]
+        return await getattr(workflow, method_name)(state)  # type: ignore[no-any-return]
+
+    node.__name__ = method_name
+    return node
+
+
+def _router(method_name: str) -> Callable[[HedAnnotationState, RunnableConfig], str]:
+    """Create a conditional-edge router that calls a workflow method on the bound instance.
+
+    Args:
+        method_name: Name of the HedAnnotationWorkflow routing method
+
+    Returns:
+        Router function for StateGraph.add_conditional_edges
+    """
+
+    def router(state: HedAnnotationState, config: RunnableConfig) -> str:
+        workflow = config["configurable"][WORKFLOW_CONFIG_KEY]
+        return getattr(workflow, method_name)(state)  # type: ignore[no-any-return]
+
+    router.__name__ = method_name
+    return router
+
+
+def _route_entry(state: HedAnnotationState) -> str:
+    """Route from START: only preprocess states that have not been annotated yet.
+
+    Args:
+        state: Initial workflow state
+
+    Returns:
+        Next node name
+    """
+    if state.get("total_iterations", 0) > 0:
+        return "annotate"
+    return "semantic_preprocess"
+
+
+def _route_after_preprocess(state: HedAnnotationState) -> str:
+    """Route after preprocessing: validate an annotation it produced, otherwise annotate.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Next node name
+    """
+    if state.get("total_iterations", 0) > 0:
+        return "validate"
+    return "annotate"
+
+
+def _compile_graph(enable_semantic_search: bool) -> Any:
+    """Build and compile the LangGraph workflow.
+
+    Args:
+        enable_semantic_search: Whether to start with the semantic preprocess node
+
+    Returns:
+        Compiled StateGraph
+    """
+    # Create graph
+    workflow = StateGraph(HedAnnotationState)
+
+    # Add nodes
+    if enable_semantic_search:
+        workflow.add_node("semantic_preprocess", _node("_semantic_preprocess_node"))
+    workflow.add_node("annotate", _node("_annotate_node"))
+    workflow.add_node("validate", _node("_validate_node"))
+    workflow.add_node("summarize_feedback", _node("_summarize_feedback_node"))
+    workflow.add_node("evaluate", _node("_evaluate_node"))
+    workflow.add_node("assess", _node("_assess_node"))
+
+    # Add edges
+    if enable_semantic_search:
+        # Resumed states (total_iterations > 0) already went through preprocessing
+        workflow.add_conditional_edges(
+            START,
+            _route_entry,
+            {"semantic_preprocess": "semantic_preprocess", "annotate": "annotate"},
+        )
+        workflow.add_conditional_edges(
+            "semantic_preprocess",
+            _route_after_preprocess,
+            {"annotate": "annotate", "validate": "validate"},
+        )
+    else:
+        workflow.set_entry_point("annotate")
+
+    # After annotation, always validate
+    workflow.add_edge("annotate", "validate")
+
+    # After validation, route based on result
+    workflow.add_conditional_edges(
+        "validate",
+        _router("_route_after_validation"),
+        {
+            "annotate": "annotate",  # Retry with (summarized) feedback if invalid
+            "evaluate": "evaluate",  # Proceed if valid
+            "summarize_feedback": "summarize_feedback",  # Already evaluated, not faithful
+            "assess": "assess",  # Already evaluated, assessment requested
+            "end": END,  # End if max attempts reached (or already evaluated and done)
+        },
+    )
+
+    # After feedback summarization (evaluation path), go to annotation
+    workflow.add_edge("summarize_feedback", "annotate")
+
+    # After evaluation, route based on faithfulness
+    workflow.add_conditional_edges(
+        "evaluate",
+        _router("_route_after_evaluation"),
+        {
+            "summarize_feedback": "summarize_feedback",  # Summarize feedback if not faithful
+            "annotate": "annotate",  # Refine with raw feedback (fuse_feedback_summary)
+            "assess": "assess",  # Proceed to assessment if needed
+            "end": END,  # Skip assessment if valid and faithful
+        },
+    )
+
+    # After assessment, always end
+    workflow.add_edge("assess", END)
+
+    return workflow.compile()
+
 
 class HedAnnotationWorkflow:
     """Multi-agent workflow for HED annotation generation and validation.
@@ -37,6 +201,14 @@ class HedAnnotationWorkflow:
     9. End: Return final annotation with feedback
     """
 
+    # Next node after evaluation, keyed by (loop finished, run_assessment)
+    _EVALUATION_ROUTES: dict[tuple[bool, bool], str] = {
+        (True, True): "assess",
+        (True, False): "end",
+        (False, True): "summarize_feedback",
+        (False, False): "summarize_feedback",
+    }
+
     def __init__(
         self,
         llm: BaseChatModel,
@@ -47,6 +219,12 @@ class HedAnnotationWorkflow:
         validator_path: Path | None = None,
         use_js_validator: bool = True,
         enable_semantic_search: bool = True,
+        speculative_annotations: int = 1,
+        parallel_first_turn: bool = False,
+        hint_shortcut_score: float | None = None,
+        max_llm_concurrency: int = 8,
+        speculative_evaluation: bool = False,
+        fuse_feedback_summary: bool = False,
     ) -> None:
         """Initialize the workflow.
 
@@ -59,14 +237,35 @@ class HedAnnotationWorkflow:
             validator_path: Path to hed-javascript for validation
             use_js_validator: Whether to use JavaScript validator
             enable_semantic_search: Whether to use hed-lsp CLI for tag suggestions
+            speculative_annotations: Number of annotation candidates sampled
+                concurrently per attempt; the first valid one is kept (1 = no sampling)
+            parallel_first_turn: Draft the first annotation while semantic hints are
+                fetched, keeping the draft if it finishes first and is valid
+            hint_shortcut_score: Minimum hed-lsp score at which the top semantic hint is
+                used as the first annotation without an LLM call (None = disabled)
+            max_llm_concurrency: Maximum agent LLM calls in flight at once across all
+                runs of this workflow (speculative samples, batches, concurrent requests)
+            speculative_evaluation: Evaluate each annotation while it is being validated,
+                discarding the evaluation if validation fails
+            fuse_feedback_summary: Skip the separate feedback summarization LLM call and
+                give the annotation agent the raw feedback, saving one call per retry
         """
         # Store schema directory (None means use HED library to fetch from GitHub)
         self.schema_dir = schema_dir
-        # Enable semantic search only if hed-lsp CLI is available
-        self.enable_semantic_search = enable_semantic_search and is_hed_lsp_available()
-
-        # Initialize legacy schema loader for validation
-        self.schema_loader = HedSchemaLoader()
+        self.speculative_annotations = max(1, speculative_annotations)
+        self.parallel_first_turn = parallel_first_turn
+        self.hint_shortcut_score = hint_shortcut_score
+        self.max_llm_concurrency = max(1, max_llm_concurrency)
+        self.speculative_evaluation = speculative_evaluation
+        self.fuse_feedback_summary = fuse_feedback_summary
+        # Created per event loop on first use (the CLI runs each call in a new loop)
+        self._llm_semaphore: asyncio.Semaphore | None = None
+        self._llm_semaphore_loop: asyncio.AbstractEventLoop | None = None
+        # Enable semantic search only if hed-lsp CLI is available (checked once per process)
+        self.hed_lsp_client: HedLspClient | None = (
+            get_shared_hed_lsp_client() if enable_semantic_search else None
+        )
+        self.enable_semantic_search = self.hed_lsp_client is not None
 
         # Use provided LLMs or default to main llm
         eval_llm = evaluation_llm or llm
@@ -75,131 +274,192 @@ class HedAnnotationWorkflow:
 
         # Initialize agents with JSON schema support and per-agent LLMs
         self.annotation_agent = AnnotationAgent(llm, schema_dir=self.schema_dir)
-        self.validation_agent = ValidationAgent(
-            self.schema_loader,
+        # Shared across workflows: validator setup and caches are reused per request
+        self.validation_agent = get_shared_validation_agent(
             use_javascript=use_js_validator,
             validator_path=validator_path,
         )
+        self.schema_loader = self.validation_agent.schema_loader
         self.evaluation_agent = EvaluationAgent(eval_llm, schema_dir=self.schema_dir)
         self.assessment_agent = AssessmentAgent(assess_llm, schema_dir=self.schema_dir)
         self.feedback_summarizer = FeedbackSummarizer(feed_llm)
-
-        # Initialize hed-lsp client for semantic search
-        self.hed_lsp_client: HedLspClient | None = None
-        if self.enable_semantic_search:
-            try:
-                self.hed_lsp_client = HedLspClient()
-                logger.info("[WORKFLOW] hed-lsp CLI available for semantic tag suggestions")
-            except RuntimeError as e:
-                logger.warning(f"[WORKFLOW] hed-lsp CLI not available: {e}")
-                self.enable_semantic_search = False
+        # Retry feedback is summarized inside the validate node; running it as a
+        # child named like the graph node keeps its events in streamed progress
+        self._summarize_retry_feedback = RunnableLambda(
+            self._summarize_feedback_node, name="summarize_feedback"
+        )
 
         # Build graph
         self.graph = self._build_graph()
 
     def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow.
+        """Bind this workflow to the shared compiled LangGraph workflow.
 
         Returns:
-            Compiled StateGraph
+            Compiled StateGraph whose nodes dispatch to this instance
         """
-        # Create graph
-        workflow = StateGraph(HedAnnotationState)
-
-        # Add nodes
-        if self.enable_semantic_search:
-            workflow.add_node("semantic_preprocess", self._semantic_preprocess_node)
-        workflow.add_node("annotate", self._annotate_node)
-        workflow.add_node("validate", self._validate_node)
-        workflow.add_node("summarize_feedback", self._summarize_feedback_node)
-        workflow.add_node("evaluate", self._evaluate_node)
-        workflow.add_node("assess", self._assess_node)
-
-        # Add edges
-        if self.enable_semantic_search:
-            workflow.set_entry_point("semantic_preprocess")
-            workflow.add_edge("semantic_preprocess", "annotate")
-        else:
-            workflow.set_entry_point("annotate")
+        graph = _COMPILED_GRAPHS.get(self.enable_semantic_search)
+        if graph is None:
+            graph = _compile_graph(self.enable_semantic_search)
+            _COMPILED_GRAPHS[self.enable_semantic_search] = graph
+        return graph.with_config(configurable={WORKFLOW_CONFIG_KEY: self})  # type: ignore[return-value]
 
-        # After annotation, always validate
-        workflow.add_edge("annotate", "validate")
+    async def _limited(self, call: Awaitable[T]) -> T:
+        """Await an agent LLM call while holding one of the workflow's LLM slots.
 
-        # After validation, route based on result
-        workflow.add_conditional_edges(
-            "validate",
-            self._route_after_validation,
-            {
-                "summarize_feedback": "summarize_feedback",  # Summarize feedback if invalid
-                "evaluate": "evaluate",  # Proceed if valid
-                "end": END,  # End if max attempts reached
-            },
-        )
+        Args:
+            call: Agent coroutine (not yet started)
 
-        # After feedback summarization, go to annotation
-        workflow.add_edge("summarize_feedback", "annotate")
+        Returns:
+            Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore is None or self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(self.max_llm_concurrency)
+            self._llm_semaphore_loop = loop
+        try:
+            async with self._llm_semaphore:
+                return await call
+        finally:
+            # Closes the coroutine if cancelled while waiting for a slot
+            call.close()  # type: ignore[attr-defined]
 
-        # After evaluation, route based on faithfulness
-        workflow.add_conditional_edges(
-            "evaluate",
-            self._route_after_evaluation,
-            {
-                "summarize_feedback": "summarize_feedback",  # Summarize feedback if not faithful
-                "assess": "assess",  # Proceed to assessment if needed
-                "end": END,  # Skip assessment if valid and faithful
-            },
+    async def _semantic_preprocess_node(self, state: HedAnnotationState) -> dict:
+        """Semantic preprocessing node: Use hed-lsp CLI to suggest relevant tags.
+
+        This node runs before annotation to provide semantic hints based on
+        the input description. Uses hed-lsp CLI for tag suggestions, while the
+        annotation vocabulary is loaded in parallel. The graph only enters it
+        before the first annotation.
+
+        With parallel_first_turn enabled, a first annotation without hints is
+        drafted at the same time. If the hints arrive first, the draft is
+        cancelled; if the draft finishes first and is valid, it is kept and the
+        graph continues with validation instead of annotation. With
+        hint_shortcut_score set, a top hint scoring at least that much becomes
+        the first annotation directly, also skipping the annotation step.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            State update with extracted_keywords and semantic_hints (plus the
+            draft annotation when it was kept)
+        """
+        logger.info("[WORKFLOW] Entering semantic_preprocess node")
+        # Load the annotation vocabulary while hed-suggest runs, so the
+        # annotate node only has to wait for the LLM
+        vocabulary_task = asyncio.create_task(
+            asyncio.to_thread(self.annotation_agent.load_vocabulary, state["schema_version"])
         )
+        try:
+            if self.parallel_first_turn:
+                update = await self._preprocess_with_draft(state)
+            else:
+                update = await self._suggest_semantic_hints(state["input_description"])
+        finally:
+            # Loading errors resurface (and are reported) in the annotate node
+            await asyncio.gather(vocabulary_task, return_exceptions=True)
 
-        # After assessment, always end
-        workflow.add_edge("assess", END)
+        if "current_annotation" not in update and self.hint_shortcut_score is not None:
+            update.update(self._annotation_from_top_hint(state, update["semantic_hints"]))
+        return update
 
-        return workflow.compile()  # type: ignore[return-value]
+    async def _preprocess_with_draft(self, state: HedAnnotationState) -> dict:
+        """Fetch semantic hints while drafting a first annotation without them.
 
-    async def _semantic_preprocess_node(self, state: HedAnnotationState) -> dict:
-        """Semantic preprocessing node: Use hed-lsp CLI to suggest relevant tags.
+        Args:
+            state: Current workflow state
 
-        This node runs before annotation to provide semantic hints based on
-        the input description. Uses hed-lsp CLI for tag suggestions.
-        Only runs on the first iteration.
+        Returns:
+            Semantic hints update, including the draft if it finished first and
+            is valid
+        """
+        hints_task = asyncio.create_task(self._suggest_semantic_hints(state["input_description"]))
+        draft_task = asyncio.create_task(self._draft_annotation(state))
+        try:
+            await asyncio.wait({hints_task, draft_task}, return_when=asyncio.FIRST_COMPLETED)
+            if draft_task.done() and not draft_task.cancelled() and draft_task.exception() is None:
+                draft, is_valid = draft_task.result()
+                if is_valid:
+                    logger.debug("[WORKFLOW] Keeping valid annotation drafted without hints")
+                    return {**draft, **await hints_task}
+            return await hints_task
+        finally:
+            draft_task.cancel()
+            hints_task.cancel()
+            await asyncio.gather(draft_task, hints_task, return_exceptions=True)
+
+    def _annotation_from_top_hint(
+        self, state: HedAnnotationState, semantic_hints: list[dict]
+    ) -> dict:
+        """Use a high-confidence top hint as the first annotation.
 
         Args:
             state: Current workflow state
+            semantic_hints: Hints from hed-lsp, best first
 
         Returns:
-            State update with extracted_keywords and semantic_hints
+            Annotate-style state update, or an empty dict if the top hint does
+            not qualify
         """
-        # Only run preprocessing on first iteration
-        if state.get("total_iterations", 0) > 0:
-            logger.debug("[WORKFLOW] Skipping semantic preprocessing (not first iteration)")
+        if not semantic_hints or self.hint_shortcut_score is None:
+            return {}
+        top = semantic_hints[0]
+        tag = top["tag"].strip()
+        if top["score"] < self.hint_shortcut_score or not tag or HED_DELIMITERS & set(tag):
             return {}
+        logger.debug(
+            "[WORKFLOW] Using top hint '%s' (score %s) as first annotation", tag, top["score"]
+        )
+        return {
+            "current_annotation": tag,
+            "total_iterations": state.get("total_iterations", 0) + 1,
+        }
 
-        logger.info("[WORKFLOW] Entering semantic_preprocess node")
+    async def _suggest_semantic_hints(self, description: str) -> dict:
+        """Get hed-lsp tag suggestions for a description.
+
+        Args:
+            description: Natural language event description
 
+        Returns:
+            State update with extracted_keywords and semantic_hints
+        """
         # Use hed-lsp CLI to suggest tags from the description
         semantic_hints = []
         keywords: list[str] = []
 
         if self.hed_lsp_client:
             try:
-                # Get tag suggestions directly from the description
-                result = self.hed_lsp_client.suggest(state["input_description"])
+                # One hed-suggest call covers every sentence of the description;
+                # it is a blocking subprocess, so keep it off the event loop
+                result = await asyncio.to_thread(
+                    self.hed_lsp_client.suggest_for_description, description
+                )
                 if result.success:
+                    # One hint per tag (first position, best score) keeps the prompt short
+                    scores: dict[str, float] = {}
+                    for s in result.suggestions:
+                        scores[s.tag] = max(scores.get(s.tag, 0.0), s.score or 0.0)
                     semantic_hints = [
                         {
-                            "tag": s.tag,
+                            "tag": tag,
                             "prefix": "",  # hed-lsp returns full tags
-                            "score": s.score or 0.0,
+                            "score": score,
                             "source": "hed-lsp",
                         }
-                        for s in result.suggestions
+                        for tag, score in scores.items()
                     ]
                     # Extract keywords from the tags for logging
-                    keywords = [s.tag.split("/")[-1] for s in result.suggestions]
+                    keywords = [tag.rpartition("/")[2] for tag in scores]
                     logger.info(
-                        f"[WORKFLOW] hed-lsp suggested {len(semantic_hints)} tags: {keywords[:5]}..."
+                        "[WORKFLOW] hed-lsp suggested %d tags: %s...",
+                        len(semantic_hints),
+                        keywords[:5],
                     )
                 else:
-                    logger.warning(f"[WORKFLOW] hed-lsp suggestion failed: {result.error}")
+                    logger.warning("[WORKFLOW] hed-lsp suggestion failed: %s", result.error)
             except Exception as e:
                 logger.warning("[WORKFLOW] hed-lsp error: %s", e, exc_info=True)
 
@@ -208,6 +468,19 @@ class HedAnnotationWorkflow:
             "semantic_hints": semantic_hints,
         }
 
+    async def _draft_annotation(self, state: HedAnnotationState) -> tuple[dict, bool]:
+        """Annotate without semantic hints and check whether the draft is valid.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            Tuple of (annotate node update, whether the annotation is valid)
+        """
+        draft = await self._annotate_node(state)
+        validation = await self.validation_agent.validate({**state, **draft})
+        return draft, validation["is_valid"]
+
     async def _annotate_node(self, state: HedAnnotationState) -> dict:
         """Annotation node: Generate or refine HED annotation.
 
@@ -218,14 +491,87 @@ class HedAnnotationWorkflow:
             State update
         """
         total_iters = state.get("total_iterations", 0) + 1
-        print(
-            f"[WORKFLOW] Entering annotate node (validation attempt {state['validation_attempts']}, total iteration {total_iters})"
+        logger.debug(
+            "[WORKFLOW] Entering annotate node (validation attempt %s, total iteration %s)",
+            state["validation_attempts"],
+            total_iters,
         )
-        result = await self.annotation_agent.annotate(state)
+        # Set up the validator while the first annotation is being generated
+        warm_up_task: asyncio.Task | None = None
+        if state["validation_attempts"] == 0:
+            warm_up_task = asyncio.create_task(
+                asyncio.to_thread(self.validation_agent.warm_up, state["schema_version"])
+            )
+        try:
+            if self.speculative_annotations > 1:
+                result = await self._annotate_speculatively(state)
+            else:
+                result = await self._limited(self.annotation_agent.annotate(state))
+        finally:
+            if warm_up_task is not None:
+                # Setup errors resurface (and are reported) in the validate node
+                await asyncio.gather(warm_up_task, return_exceptions=True)
         result["total_iterations"] = total_iters  # Increment counter
-        print(f"[WORKFLOW] Annotation generated: {result.get('current_annotation', '')[:100]}...")
+        logger.debug(
+            "[WORKFLOW] Annotation generated: %.100s...", result.get("current_annotation", "")
+        )
         return result
 
+    async def _annotate_speculatively(self, state: HedAnnotationState) -> dict:
+        """Sample several annotations concurrently and keep the first valid one.
+
+        Each candidate is validated as soon as it is generated, independently of
+        the others; the first valid candidate wins and the remaining generation
+        and validation tasks are cancelled. Validation outcomes are cached by the
+        validation agent, so the validate node does not re-run the validator for
+        the chosen candidate.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            Annotation state update of the chosen candidate (the first to finish
+            if none is valid)
+        """
+        tasks = [
+            asyncio.create_task(self._annotate_and_check(state))
+            for _ in range(self.speculative_annotations)
+        ]
+        first_candidate: dict | None = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    candidate, is_valid = await next_done
+                except Exception as e:
+                    logger.warning("[WORKFLOW] Speculative annotation failed: %s", e)
+                    continue
+                if is_valid:
+                    logger.debug("[WORKFLOW] Speculative annotation candidate is valid")
+                    return candidate
+                if first_candidate is None:
+                    first_candidate = candidate
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if first_candidate is None:
+            raise RuntimeError("All speculative annotation attempts failed")
+        return first_candidate
+
+    async def _annotate_and_check(self, state: HedAnnotationState) -> tuple[dict, bool]:
+        """Generate one annotation candidate and validate it.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            Tuple of (annotation state update, whether the annotation is valid)
+        """
+        candidate = await self._limited(self.annotation_agent.annotate(state))
+        validation = await self.validation_agent.validate({**state, **candidate})
+        return candidate, validation["is_valid"]
+
     async def _validate_node(self, state: HedAnnotationState) -> dict:
         """Validation node: Validate HED annotation.
 
@@ -235,13 +581,50 @@ class HedAnnotationWorkflow:
         Returns:
             State update
         """
-        print("[WORKFLOW] Entering validate node")
-        result = await self.validation_agent.validate(state)
-        print(
-            f"[WORKFLOW] Validation result: {result.get('validation_status')}, is_valid: {result.get('is_valid')}"
+        logger.debug("[WORKFLOW] Entering validate node")
+        # Evaluation only reads the description and the annotation, so it can
+        # run while the validator works; it is dropped if validation fails
+        evaluation_task: asyncio.Task | None = None
+        if self.speculative_evaluation:
+            evaluation_task = asyncio.create_task(
+                self._limited(self.evaluation_agent.evaluate(state))
+            )
+
+        try:
+            result = await self.validation_agent.validate(state)
+        except BaseException:
+            if evaluation_task is not None:
+                evaluation_task.cancel()
+            raise
+        logger.debug(
+            "[WORKFLOW] Validation result: %s, is_valid: %s",
+            result.get("validation_status"),
+            result.get("is_valid"),
         )
         if not result.get("is_valid"):
-            print(f"[WORKFLOW] Validation errors: {result.get('validation_errors', [])}")
+            logger.debug("[WORKFLOW] Validation errors: %s", result.get("validation_errors", []))
+
+        # Summarize retry feedback here rather than in a separate graph step
+        if result.get("validation_status") not in ("valid", "max_attempts_reached"):
+            updated_state = {**state, **result}
+            if not self.fuse_feedback_summary and self._errors_need_summary(updated_state):  # type: ignore[arg-type]
+                result.update(await self._summarize_retry_feedback.ainvoke(updated_state))
+
+        # Skip state writes for containers that are empty before and after
+        for key in _VALIDATION_CONTAINER_KEYS:
+            if key in result and not result[key] and not state.get(key):
+                del result[key]
+
+        if evaluation_task is not None:
+            if result.get("validation_status") == "valid":
+                validated_state = {**state, **result}
+                # Stripping extensions changes the annotation; evaluate the final one
+                if validated_state["current_annotation"] != state["current_annotation"]:
+                    evaluation_task.cancel()
+                    evaluation_task = None
+                result.update(await self._evaluate(validated_state, evaluation_task))  # type: ignore[arg-type]
+            else:
+                evaluation_task.cancel()
         return result
 
     async def _evaluate_node(self, state: HedAnnotationState) -> dict:
@@ -253,16 +636,67 @@ class HedAnnotationWorkflow:
         Returns:
             State update
         """
-        print("[WORKFLOW] Entering evaluate node")
-        result = await self.evaluation_agent.evaluate(state)
-        print(f"[WORKFLOW] Evaluation result: is_faithful={result.get('is_faithful')}")
+        logger.debug("[WORKFLOW] Entering evaluate node")
+        return await self._evaluate(state)
 
-        # Set default assessment values if assessment will be skipped
+    async def _evaluate(
+        self, state: HedAnnotationState, evaluation_task: asyncio.Task | None = None
+    ) -> dict:
+        """Evaluate faithfulness, running assessment concurrently when it may follow.
+
+        Args:
+            state: Current workflow state
+            evaluation_task: Evaluation of this state's annotation that is already
+                running (started alongside validation); started here if None
+
+        Returns:
+            State update
+        """
         run_assessment = state.get("run_assessment", False)
-        if not run_assessment:
-            result["is_complete"] = result.get("is_faithful", False) and state.get(
-                "is_valid", False
+        is_valid = state.get("is_valid", False)
+        if evaluation_task is None:
+            evaluation_task = asyncio.create_task(
+                self._limited(self.evaluation_agent.evaluate(state))
             )
+
+        # Assessment only reads the description and the annotation, so it has no
+        # dependency on evaluation output. When it may follow, run both agents
+        # concurrently and keep the assessment only if routing goes to assess.
+        speculative_assessment: asyncio.Task | None = None
+        if run_assessment and is_valid:
+            speculative_assessment = asyncio.create_task(
+                self._limited(self.assessment_agent.assess(state))
+            )
+
+        try:
+            result = await evaluation_task
+        except BaseException:
+            evaluation_task.cancel()
+            if speculative_assessment is not None:
+                speculative_assessment.cancel()
+            raise
+        is_faithful = result.get("is_faithful", False)
+        logger.debug("[WORKFLOW] Evaluation result: is_faithful=%s", is_faithful)
+
+        if speculative_assessment is not None:
+            max_iters = state.get("max_total_iterations", 10)
+            if is_faithful or state.get("total_iterations", 0) >= max_iters:
+                try:
+                    assessment = await speculative_assessment
+                except Exception as e:
+                    # Keep the evaluation; the assess node will run assessment itself
+                    logger.warning("[WORKFLOW] Concurrent assessment failed: %s", e)
+                else:
+                    # Both agents return only their new messages; keep both
+                    evaluation_messages = result["messages"]
+                    result.update(assessment)
+                    result["messages"] = evaluation_messages + assessment["messages"]
+            else:
+                speculative_assessment.cancel()
+
+        # Set default assessment values if assessment will be skipped
+        if not run_assessment:
+            result["is_complete"] = is_faithful and is_valid
             if result["is_complete"]:
                 result["assessment_feedback"] = (
                     "Annotation is valid and faithful to the original description."
@@ -281,7 +715,11 @@ class HedAnnotationWorkflow:
         Returns:
             State update
         """
-        return await self.assessment_agent.assess(state)
+        # Already produced speculatively by the evaluate node
+        if state.get("assessment_feedback"):
+            logger.debug("[WORKFLOW] Using assessment computed during evaluation")
+            return {}
+        return await self._limited(self.assessment_agent.assess(state))
 
     async def _summarize_feedback_node(self, state: HedAnnotationState) -> dict:
         """Summarize feedback node: Condense errors and feedback.
@@ -292,11 +730,14 @@ class HedAnnotationWorkflow:
         Returns:
             State update with summarized feedback
         """
-        print("[WORKFLOW] Entering summarize_feedback node")
-        result = await self.feedback_summarizer.summarize(state)
-        print(
-            f"[WORKFLOW] Feedback summarized: {result.get('validation_errors_augmented', [''])[0][:100] if result.get('validation_errors_augmented') else 'No feedback'}..."
-        )
+        logger.debug("[WORKFLOW] Entering summarize_feedback node")
+        result = await self._limited(self.feedback_summarizer.summarize(state))
+        if logger.isEnabledFor(logging.DEBUG):
+            augmented = result.get("validation_errors_augmented")
+            logger.debug(
+                "[WORKFLOW] Feedback summarized: %.100s...",
+                augmented[0] if augmented else "No feedback",
+            )
         return result
 
     def _route_after_validation(
@@ -311,17 +752,38 @@ class HedAnnotationWorkflow:
         Returns:
             Next node name
         """
-        if state["validation_status"] == "valid":
-            print("[WORKFLOW] Routing to evaluate (validation passed)")
+        status = state["validation_status"]
+        if status == "valid" and self.speculative_evaluation:
+            # Evaluation already ran alongside validation
+            return self._route_after_evaluation(state)
+        elif status == "valid":
+            logger.debug("[WORKFLOW] Routing to evaluate (validation passed)")
             return "evaluate"
-        elif state["validation_status"] == "max_attempts_reached":
-            print("[WORKFLOW] Routing to end (max validation attempts reached)")
+        elif status == "max_attempts_reached":
+            logger.debug("[WORKFLOW] Routing to end (max validation attempts reached)")
             return "end"
         else:
-            print(
-                f"[WORKFLOW] Routing to summarize_feedback (validation failed, attempts: {state['validation_attempts']}/{state['max_validation_attempts']})"
+            logger.debug(
+                "[WORKFLOW] Routing to annotate (validation failed, attempts: %s/%s)",
+                state["validation_attempts"],
+                state["max_validation_attempts"],
             )
-            return "summarize_feedback"
+            return "annotate"
+
+    @staticmethod
+    def _errors_need_summary(state: HedAnnotationState) -> bool:
+        """Check whether validation feedback is large enough to summarize.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            True if the errors should go through the feedback summarizer
+        """
+        errors = state.get("validation_errors_augmented") or []
+        if len(errors) > SUMMARY_MAX_ERRORS:
+            return True
+        return sum(len(error) for error in errors) >= SUMMARY_MIN_ERROR_CHARS
 
     def _route_after_evaluation(
         self,
@@ -329,55 +791,45 @@ class HedAnnotationWorkflow:
     ) -> str:
         """Route after evaluation based on faithfulness.
 
+        A faithful annotation, or one that ran out of iterations, finishes the
+        loop: it goes to assessment when requested and ends otherwise. Anything
+        else is refined with summarized feedback (or raw feedback when
+        fuse_feedback_summary is set).
+
         Args:
             state: Current workflow state
 
         Returns:
             Next node name
         """
-        # Check if max total iterations reached
         total_iters = state.get("total_iterations", 0)
         max_iters = state.get("max_total_iterations", 10)
-        run_assessment = state.get("run_assessment", False)
+        is_faithful = state["is_faithful"]
+        finished = total_iters >= max_iters or is_faithful
+        route = self._EVALUATION_ROUTES[finished, state.get("run_assessment", False)]
+        if route == "summarize_feedback" and self.fuse_feedback_summary:
+            route = "annotate"
+        logger.debug(
+            "[WORKFLOW] Routing to %s after evaluation (faithful=%s, valid=%s, iteration %s/%s)",
+            route,
+            is_faithful,
+            state.get("is_valid"),
+            total_iters,
+            max_iters,
+        )
+        return route
 
-        if total_iters >= max_iters:
-            # Only run assessment at max iterations if explicitly requested
-            if run_assessment:
-                print(f"[WORKFLOW] Routing to assess (max total iterations {max_iters} reached)")
-                return "assess"
-            else:
-                print(
-                    "[WORKFLOW] Skipping assessment (max iterations reached, assessment not requested) - routing to END"
-                )
-                return "end"
+    def warm_up(self, schema_version: str) -> None:
+        """Load the schema-dependent prompt and validator ahead of a run.
 
-        if state["is_faithful"]:
-            # Only run assessment if explicitly requested
-            if state.get("is_valid") and run_assessment:
-                print(
-                    "[WORKFLOW] Routing to assess (annotation is valid and faithful, assessment requested)"
-                )
-                return "assess"
-            elif state.get("is_valid"):
-                print(
-                    "[WORKFLOW] Skipping assessment (annotation is valid and faithful, assessment not requested) - routing to END"
-                )
-                return "end"
-            elif run_assessment:
-                print(
-                    "[WORKFLOW] Routing to assess (annotation is faithful but has validation issues)"
-                )
-                return "assess"
-            else:
-                print(
-                    "[WORKFLOW] Skipping assessment (has validation issues, assessment not requested) - routing to END"
-                )
-                return "end"
-        else:
-            print(
-                f"[WORKFLOW] Routing to summarize_feedback (annotation needs refinement, iteration {total_iters}/{max_iters})"
-            )
-            return "summarize_feedback"
+        This is blocking; callers run it in a thread while they are busy with
+        other work (e.g. describing an image) so the first nodes hit warm caches.
+
+        Args:
+            schema_version: HED schema version the upcoming run will use
+        """
+        self.annotation_agent.get_system_prompt(schema_version)
+        self.validation_agent.warm_up(schema_version)
 
     async def run(
         self,
@@ -419,3 +871,55 @@ class HedAnnotationWorkflow:
         final_state = await self.graph.ainvoke(initial_state, config=config)  # type: ignore[attr-defined]
 
         return final_state  # type: ignore[no-any-return]
+
+    async def arun_batch(
+        self,
+        input_descriptions: list[str],
+        schema_version: str = "8.4.0",
+        max_validation_attempts: int = 5,
+        max_total_iterations: int = 10,
+        run_assessment: bool = False,
+        no_extend: bool = False,
+        max_concurrency: int = 4,
+        config: dict | None = None,
+    ) -> list[HedAnnotationState]:
+        """Run the annotation workflow for several descriptions concurrently.
+
+        All runs share this workflow's compiled graph and agents. At most
+        max_concurrency runs are in flight at once, which keeps provider
+        rate limits in check while overlapping their LLM round trips.
+
+        Args:
+            input_descriptions: Natural language event descriptions
+            schema_version: HED schema version to use
+            max_validation_attempts: Maximum validation retry attempts
+            max_total_iterations: Maximum total iterations to prevent infinite loops
+            run_assessment: Whether to run final assessment (default: False)
+            no_extend: If True, prohibit tag extensions (use only existing vocabulary)
+            max_concurrency: Maximum number of descriptions processed at once
+            config: Optional LangGraph config (e.g., recursion_limit)
+
+        Returns:
+            Final workflow states, in the same order as input_descriptions
+        """
+        from src.agents.state import create_initial_state
+
+        if not input_descriptions:
+            return []
+
+        initial_states = [
+            create_initial_state(
+                description,
+                schema_version,
+                max_validation_attempts,
+                max_total_iterations,
+                run_assessment,
+                no_extend=no_extend,
+            )
+            for description in input_descriptions
+        ]
+        batch_config = {**(config or {}), "max_concurrency": max(1, max_concurrency)}
+
+        final_states = await self.graph.abatch(initial_states, config=batch_config)  # type: ignore[attr-defined]
+
+        return final_states  # type: ignore[no-any-return]
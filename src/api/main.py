@@ -5,26 +5,42 @@ and validation using the multi-agent workflow.
 """
 
 import asyncio
+import base64
 import hashlib
 import json
 import logging
 import os
-import time
+import queue
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Annotated, Any
+from weakref import WeakKeyDictionary
 
+import anyio
+import httpx
+import orjson
 from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
 from langchain_community.chat_models import ChatOllama
+from langchain_core.caches import InMemoryCache
+from pydantic import ValidationError
 
 from src import __version__
+from src.agents.state import create_initial_state
+from src.agents.validation_agent import close_shared_validation_agents
 from src.agents.vision_agent import VisionAgent
 from src.agents.workflow import HedAnnotationWorkflow
 from src.api.models import (
     AnnotationRequest,
     AnnotationResponse,
+    BatchValidationRequest,
+    BatchValidationResponse,
     FeedbackRequest,
     FeedbackResponse,
     HealthResponse,
@@ -33,11 +49,12 @@ from src.api.models import (
     ValidationRequest,
     ValidationResponse,
 )
-from src.api.security import api_key_auth, audit_logger
+from src.api.security import SecurityHeadersMiddleware, api_key_auth, audit_logger
 from src.telemetry import LocalFileStorage, TelemetryCollector, TelemetryEvent
+from src.utils.image_processing import MAX_IMAGE_SIZE_BYTES, MAX_IMAGE_SIZE_MB
 from src.utils.openrouter_llm import create_openrouter_llm, get_model_name
 from src.utils.schema_loader import HedSchemaLoader
-from src.validation.hed_validator import HedPythonValidator
+from src.validation.hed_validator import HedPythonValidator, ValidationResult
 
 # Load environment variables from .env file
 load_dotenv()
@@ -53,6 +70,119 @@ telemetry_collector: TelemetryCollector | None = None
 # Cache for BYOK configuration
 _byok_config: dict = {}
 
+# /validate validators keyed by schema version (schemas are cached and read-only)
+_python_validators: dict[str, HedPythonValidator] = {}
+
+# Environment probes resolved once at import (Docker images mount the app at /app)
+_IS_DOCKER = Path("/app").is_dir()
+_HOME = Path.home()
+
+# Max cached responses shared by a workflow's evaluation/assessment/feedback LLMs
+REVIEW_RESPONSE_CACHE_SIZE = 256
+
+# Agent LLM calls in flight at once per workflow. The default workflow serves
+# every non-BYOK request, so for it this is a server-wide limit.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+
+# Max BYOK/model-override workflows kept for reuse by later requests
+REQUEST_WORKFLOW_CACHE_SIZE = 32
+_request_workflows: OrderedDict[tuple, HedAnnotationWorkflow] = OrderedDict()
+# Settings key of each workflow built by get_openrouter_workflow; weak, so runs
+# keyed on settings never keep an evicted workflow alive
+_request_workflow_keys: WeakKeyDictionary[HedAnnotationWorkflow, tuple] = WeakKeyDictionary()
+
+# /annotate workflow runs in progress, shared by identical concurrent requests
+_inflight_runs: dict[tuple, asyncio.Task] = {}
+
+# Completed /annotate runs reused by identical requests within the TTL; opt-in,
+# since a repeat request would otherwise expect a fresh (differently sampled) run
+ANNOTATION_CACHE_SIZE = int(os.getenv("ANNOTATION_CACHE_SIZE", "0"))
+ANNOTATION_CACHE_TTL_S = float(os.getenv("ANNOTATION_CACHE_TTL_S", "300"))
+_annotation_results: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+
+# Worker threads available to /validate; keeps validation bursts from occupying
+# the default executor used by other offloaded work
+VALIDATION_THREAD_LIMIT = min(32, (os.cpu_count() or 1) * 4)
+_validation_limiter = anyio.CapacityLimiter(VALIDATION_THREAD_LIMIT)
+
+# /validate responses keyed by (schema_version, hed_string); validation is deterministic
+VALIDATION_CACHE_SIZE = 1024
+_validation_results: OrderedDict[tuple[str, str], ValidationResponse] = OrderedDict()
+
+# /health serves a snapshot refreshed by a background probe
+HEALTH_REFRESH_INTERVAL_S = 5.0
+HEALTH_PROBE_TIMEOUT_S = 2.0
+HEALTH_SCHEMA_VERSION = "8.4.0"
+
+
+def _health_body(llm_available: bool, validator_available: bool) -> bytes:
+    """Encode a /health response body.
+
+    Args:
+        llm_available: Whether the LLM backend answered the last probe
+        validator_available: Whether the HED schema could be loaded
+
+    Returns:
+        JSON body matching HealthResponse
+    """
+    status = "healthy" if (llm_available and validator_available) else "degraded"
+    return orjson.dumps(
+        {
+            "status": status,
+            "version": __version__,
+            "llm_available": llm_available,
+            "validator_available": validator_available,
+        }
+    )
+
+
+# Reported until the first probe completes
+_cached_health: bytes = _health_body(False, False)
+
+
+# Response compression: bodies below the minimum are sent as-is; level 5 trades
+# a little ratio for much less CPU than the default 9
+GZIP_MINIMUM_SIZE = 512
+GZIP_COMPRESS_LEVEL = 5
+
+
+# Comment frame sent first so Safari opens the event stream
+SSE_STREAM_OPENED = b": stream opened\n\n"
+
+
+def _sse_event(event_type: str, data: dict) -> bytes:
+    """Encode one Server-Sent Event frame.
+
+    Args:
+        event_type: SSE event name
+        data: JSON-serializable event payload
+
+    Returns:
+        Encoded frame, ready to be written to the response
+    """
+    return b"event: %b\ndata: %b\n\n" % (event_type.encode(), orjson.dumps(data))
+
+
+# Fixed progress frames, encoded once
+SSE_ANNOTATION_STARTED = _sse_event(
+    "progress", {"stage": "starting", "message": "Initializing annotation workflow..."}
+)
+SSE_IMAGE_ANNOTATION_STARTED = _sse_event(
+    "progress", {"stage": "starting", "message": "Initializing image annotation..."}
+)
+SSE_VISION_STARTED = _sse_event(
+    "progress", {"stage": "vision", "message": "Analyzing image with vision model..."}
+)
+
+# Workflow node name to user-friendly (stage, message) for streaming progress
+SSE_NODE_STAGES = {
+    "annotate": ("annotating", "Generating HED annotation..."),
+    "validate": ("validating", "Validating HED annotation..."),
+    "summarize_feedback": ("refining", "Processing validation feedback..."),
+    "evaluate": ("evaluating", "Evaluating annotation faithfulness..."),
+    "assess": ("assessing", "Running final assessment..."),
+}
+
 
 def _derive_user_id(token: str) -> str:
     """Derive a stable user ID from API token for cache optimization.
@@ -132,6 +262,11 @@ def create_openrouter_workflow(
 
     actual_eval_provider = eval_provider or default_eval_provider or None
 
+    # Evaluation, assessment and feedback re-judge identical prompts when an
+    # annotation repeats across attempts or requests; answer those locally.
+    # Annotation is excluded so retries and speculative samples stay diverse.
+    review_cache = InMemoryCache(maxsize=REVIEW_RESPONSE_CACHE_SIZE)
+
     # Create LLMs
     annotation_llm = create_openrouter_llm(
         model=actual_annotation_model,
@@ -146,6 +281,7 @@ def create_openrouter_workflow(
         temperature=actual_temperature,
         provider=actual_eval_provider,
         user_id=actual_user_id,
+        response_cache=review_cache,
     )
     assessment_llm = create_openrouter_llm(
         model=actual_eval_model,
@@ -153,6 +289,7 @@ def create_openrouter_workflow(
         temperature=actual_temperature,
         provider=actual_eval_provider,
         user_id=actual_user_id,
+        response_cache=review_cache,
     )
     feedback_llm = create_openrouter_llm(
         model=actual_eval_model,
@@ -160,6 +297,7 @@ def create_openrouter_workflow(
         temperature=actual_temperature,
         provider=actual_eval_provider,
         user_id=actual_user_id,
+        response_cache=review_cache,
     )
 
     # Create and return workflow
@@ -174,9 +312,38 @@ def create_openrouter_workflow(
         schema_dir=Path(schema_dir) if schema_dir else None,
         validator_path=Path(validator_path) if validator_path else None,
         use_js_validator=actual_use_js,
+        max_llm_concurrency=LLM_MAX_CONCURRENCY,
     )
 
 
+def get_openrouter_workflow(api_key: str, **settings: Any) -> HedAnnotationWorkflow:
+    """Get a workflow for per-request settings, reusing one built earlier.
+
+    Concurrent and repeated requests with the same key and model settings
+    share one workflow: its LLM clients, response caches and LLM concurrency
+    limit are set up once instead of for every request.
+
+    Args:
+        api_key: OpenRouter API key
+        **settings: Keyword arguments for create_openrouter_workflow
+
+    Returns:
+        Configured HedAnnotationWorkflow
+    """
+    cache_key = (hashlib.sha256(api_key.encode()).digest(), *sorted(settings.items()))
+    cached = _request_workflows.get(cache_key)
+    if cached is not None:
+        _request_workflows.move_to_end(cache_key)
+        return cached
+
+    request_workflow = create_openrouter_workflow(api_key=api_key, **settings)
+    _request_workflows[cache_key] = request_workflow
+    _request_workflow_keys[request_workflow] = cache_key
+    if len(_request_workflows) > REQUEST_WORKFLOW_CACHE_SIZE:
+        _request_workflows.popitem(last=False)
+    return request_workflow
+
+
 def create_byok_workflow(
     openrouter_key: str,
     model: str | None = None,
@@ -188,7 +355,7 @@ def create_byok_workflow(
 ) -> HedAnnotationWorkflow:
     """Create a workflow for BYOK mode using the user's OpenRouter key.
 
-    Thin wrapper around create_openrouter_workflow that uses cached server config
+    Thin wrapper around get_openrouter_workflow that uses cached server config
     for schema/validator paths.
 
     Args:
@@ -205,8 +372,8 @@ def create_byok_workflow(
     """
     global _byok_config
 
-    return create_openrouter_workflow(
-        api_key=openrouter_key,
+    return get_openrouter_workflow(
+        openrouter_key,
         annotation_model=model,
         annotation_provider=provider,
         eval_model=eval_model,
@@ -270,6 +437,45 @@ def create_byok_vision_agent(
     return VisionAgent(llm=vision_llm)
 
 
+def _start_agent_log_listener() -> QueueListener:
+    """Route agent logs through a queue so records are written off the event loop.
+
+    Workflow nodes log from coroutines; a QueueHandler only enqueues the record
+    and a background QueueListener thread performs the actual stream write.
+
+    Returns:
+        Started QueueListener (stop it on shutdown to flush pending records)
+    """
+    log_queue: queue.Queue = queue.Queue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    agents_logger = logging.getLogger("src.agents")
+    agents_logger.addHandler(QueueHandler(log_queue))
+    agents_logger.propagate = False
+    log_level = os.getenv("LOG_LEVEL")
+    if log_level:
+        agents_logger.setLevel(log_level.upper())
+
+    listener.start()
+    return listener
+
+
+def _stop_agent_log_listener(listener: QueueListener) -> None:
+    """Flush queued agent logs and detach the queue handler.
+
+    Args:
+        listener: Listener returned by _start_agent_log_listener
+    """
+    listener.stop()
+    agents_logger = logging.getLogger("src.agents")
+    for handler in list(agents_logger.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            agents_logger.removeHandler(handler)
+    agents_logger.propagate = True
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan (startup and shutdown).
@@ -279,7 +485,10 @@ async def lifespan(app: FastAPI):
     """
     global workflow, vision_agent, schema_loader
 
-    # Startup: Initialize workflow
+    # Startup: Move agent log emission off the event loop
+    log_listener = _start_agent_log_listener()
+
+    # Initialize workflow
     print("Initializing HEDit annotation workflow...")
 
     # Auto-detect environment (Docker vs local)
@@ -295,7 +504,7 @@ async def lifespan(app: FastAPI):
             (HED library will fetch from GitHub when None)
         """
         # Check if running in Docker (look for Docker-specific paths)
-        if Path("/app").exists() and Path(docker_path).exists():
+        if _IS_DOCKER and Path(docker_path).exists():
             return docker_path
         # Check if local development path exists
         elif Path(local_path).exists():
@@ -312,7 +521,7 @@ async def lifespan(app: FastAPI):
         "HED_SCHEMA_DIR",
         get_default_path(
             "/app/hed-schemas/schemas_latest_json",  # Docker
-            str(Path.home() / "git/hed-schemas/schemas_latest_json"),  # Local Linux/macOS
+            str(_HOME / "git/hed-schemas/schemas_latest_json"),  # Local Linux/macOS
         ),
     )
 
@@ -321,7 +530,7 @@ async def lifespan(app: FastAPI):
         "HED_VALIDATOR_PATH",
         get_default_path(
             "/app/hed-javascript",  # Docker
-            str(Path.home() / "git/hed-javascript"),  # Local Linux/macOS
+            str(_HOME / "git/hed-javascript"),  # Local Linux/macOS
         ),
     )
 
@@ -337,10 +546,13 @@ async def lifespan(app: FastAPI):
         "use_js_validator": use_js_validator,
     }
 
-    print(f"Environment: {'Docker' if Path('/app').exists() else 'Local'}")
+    print(f"Environment: {'Docker' if _IS_DOCKER else 'Local'}")
     print(f"Schema directory: {schema_dir or 'GitHub (dynamic fetch)'}")
     print(f"Validator path: {validator_path or 'None (using Python validator)'}")
 
+    # Hosted providers are not probed; a local Ollama server is
+    llm_probe_url = None
+
     # Initialize workflow based on provider
     if llm_provider == "openrouter":
         # OpenRouter configuration - use unified workflow creation
@@ -376,6 +588,7 @@ async def lifespan(app: FastAPI):
         )
 
         print(f"Using Ollama: {llm_model} at {llm_base_url}")
+        llm_probe_url = f"{llm_base_url.rstrip('/')}/api/tags"
 
         # Ollama uses same LLM for all agents
         workflow = HedAnnotationWorkflow(
@@ -383,6 +596,7 @@ async def lifespan(app: FastAPI):
             schema_dir=Path(schema_dir) if schema_dir else None,
             validator_path=Path(validator_path) if use_js_validator and validator_path else None,
             use_js_validator=use_js_validator,
+            max_llm_concurrency=LLM_MAX_CONCURRENCY,
         )
 
     # Set global schema_loader from workflow
@@ -391,6 +605,7 @@ async def lifespan(app: FastAPI):
     print("Workflow initialized successfully!")
     print(f"  LLM Provider: {llm_provider} (temperature={llm_temperature})")
     print(f"  JavaScript validator: {use_js_validator}")
+    print(f"  Concurrent LLM calls (server-wide): {LLM_MAX_CONCURRENCY}")
 
     # Initialize vision agent (only for OpenRouter)
     if llm_provider == "openrouter":
@@ -414,7 +629,7 @@ async def lifespan(app: FastAPI):
     # Initialize telemetry collector
     global telemetry_collector
     # Use /app/telemetry in Docker, otherwise use local .hedit/telemetry
-    default_telemetry_dir = "/app/telemetry" if Path("/app").exists() else ".hedit/telemetry"
+    default_telemetry_dir = "/app/telemetry" if _IS_DOCKER else ".hedit/telemetry"
     telemetry_dir = os.getenv("TELEMETRY_DIR", default_telemetry_dir)
     telemetry_storage = LocalFileStorage(storage_dir=telemetry_dir)
     telemetry_collector = TelemetryCollector(
@@ -423,10 +638,17 @@ async def lifespan(app: FastAPI):
     )
     print(f"Telemetry collector initialized (storage: {telemetry_dir})")
 
+    health_task = asyncio.create_task(_health_refresher(llm_probe_url))
+
     yield
 
     # Shutdown
     print("Shutting down HEDit...")
+    health_task.cancel()
+    await asyncio.gather(health_task, return_exceptions=True)
+    # Stop the Node.js validator workers shared by the default and BYOK workflows
+    close_shared_validation_agents()
+    _stop_agent_log_listener(log_listener)
 
 
 # Create FastAPI app
@@ -471,12 +693,21 @@ if extra_origins := os.getenv("EXTRA_CORS_ORIGINS"):
         [origin.strip() for origin in extra_origins.split(",") if origin.strip()]
     )
 
-# Add CORS middleware
+# Compress JSON bodies (annotation feedback text compresses well). Added before CORS
+# so it sits inside it and preflights never reach it; SSE streams are left
+# uncompressed by GZipMiddleware's content-type exclusions, so events are not batched
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL,
+)
+
+# Add CORS middleware (a frozenset makes each origin check a hash lookup)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=frozenset(allowed_origins),
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_methods=["GET", "POST"],  # Every route is GET or POST
     allow_headers=[
         "Content-Type",
         "Authorization",
@@ -491,7 +722,7 @@ app.add_middleware(
         "X-OpenRouter-Eval-Provider",  # BYOK eval provider override
         "X-User-Id",  # Custom user ID for cache optimization
     ],
-    max_age=3600,  # Cache preflight requests for 1 hour
+    max_age=86400,  # Let browsers cache preflights for up to a day
 )
 
 
@@ -499,27 +730,25 @@ app.add_middleware(
 @app.middleware("http")
 async def audit_logging_middleware(request: Request, call_next):
     """Middleware to log all requests and responses for audit trail."""
-    start_time = time.time()
+    # Monotonic loop clock: immune to wall-clock adjustments mid-request
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
 
     # Log incoming request
-    api_key = request.headers.get("x-api-key")
-    api_key_hash = api_key[:8] + "..." if api_key else None
-    audit_logger.log_request(request, api_key_hash=api_key_hash)
+    api_key_hash = None
+    if audit_logger.enabled:
+        api_key = request.headers.get("x-api-key")
+        api_key_hash = api_key[:8] + "..." if api_key else None
+        audit_logger.log_request(request, api_key_hash=api_key_hash)
 
     # Process request
     try:
         response = await call_next(request)
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (loop.time() - start_time) * 1000
 
         # Log response
         audit_logger.log_response(request, response.status_code, processing_time_ms)
 
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
         return response
     except Exception as e:
         # Log error
@@ -527,24 +756,137 @@ async def audit_logging_middleware(request: Request, call_next):
         raise
 
 
+# Security headers (outermost, so every response including CORS preflights gets them)
+app.add_middleware(SecurityHeadersMiddleware)
+
+
+async def _check_health(http_client: httpx.AsyncClient, llm_probe_url: str | None) -> bytes:
+    """Probe the LLM backend and schema loading, and encode the result.
+
+    Args:
+        http_client: Client used for the LLM probe
+        llm_probe_url: URL that answers when the LLM backend is up, or None
+            to only require an initialized workflow (hosted providers)
+
+    Returns:
+        Encoded /health response body
+    """
+    llm_available = workflow is not None
+    if llm_available and llm_probe_url:
+        try:
+            response = await http_client.get(llm_probe_url)
+            llm_available = response.is_success
+        except httpx.HTTPError:
+            llm_available = False
+
+    validator_available = False
+    if schema_loader is not None:
+        try:
+            # Cached by the loader after the first success, so repeat probes are cheap
+            await asyncio.to_thread(schema_loader.load_schema, HEALTH_SCHEMA_VERSION)
+            validator_available = True
+        except Exception:
+            validator_available = False
+
+    return _health_body(llm_available, validator_available)
+
+
+async def _health_refresher(llm_probe_url: str | None) -> None:
+    """Keep _cached_health current until cancelled.
+
+    Args:
+        llm_probe_url: Passed through to _check_health
+    """
+    global _cached_health
+    async with httpx.AsyncClient(timeout=HEALTH_PROBE_TIMEOUT_S) as http_client:
+        while True:
+            _cached_health = await _check_health(http_client, llm_probe_url)
+            await asyncio.sleep(HEALTH_REFRESH_INTERVAL_S)
+
+
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint.
 
+    Serves the latest background probe result, so probes cost no I/O.
+
     Returns:
         Health status and service availability
     """
-    llm_available = workflow is not None
-    validator_available = schema_loader is not None
+    return Response(_cached_health, media_type="application/json")
 
-    status = "healthy" if (llm_available and validator_available) else "degraded"
 
-    return HealthResponse(
-        status=status,
-        version=__version__,
-        llm_available=llm_available,
-        validator_available=validator_available,
+def _finish_workflow_run(key: tuple, task: asyncio.Task) -> None:
+    """Drop a finished run from the in-flight table and cache its result.
+
+    Args:
+        key: Run key built by run_workflow_coalesced
+        task: Finished workflow run
+    """
+    _inflight_runs.pop(key, None)
+    if ANNOTATION_CACHE_SIZE <= 0 or task.cancelled() or task.exception() is not None:
+        return
+    expires_at = asyncio.get_running_loop().time() + ANNOTATION_CACHE_TTL_S
+    _annotation_results[key] = (expires_at, task.result())
+    _annotation_results.move_to_end(key)
+    while len(_annotation_results) > ANNOTATION_CACHE_SIZE:
+        _annotation_results.popitem(last=False)
+
+
+async def run_workflow_coalesced(
+    active_workflow: HedAnnotationWorkflow,
+    request: AnnotationRequest,
+    config: dict,
+) -> dict:
+    """Run an annotation workflow, sharing the run with identical concurrent requests.
+
+    Retries and multi-tab clients often submit the same description at once;
+    while one run is in flight, identical requests for the same workflow settings await
+    its result instead of repeating every LLM call. When ANNOTATION_CACHE_SIZE is
+    set, completed runs are also kept for ANNOTATION_CACHE_TTL_S seconds and
+    returned directly to repeat requests.
+
+    Args:
+        active_workflow: Workflow selected for the request
+        request: Annotation request
+        config: LangGraph config for the run
+
+    Returns:
+        Final workflow state (shared; treat as read-only)
+    """
+    # Request workflows are keyed on their settings so cached results do not keep
+    # them alive; the server workflow lives for the whole process anyway
+    key = (
+        _request_workflow_keys.get(active_workflow, active_workflow),
+        request.description,
+        request.schema_version,
+        request.max_validation_attempts,
+        request.run_assessment,
     )
+    loop = asyncio.get_running_loop()
+    cached = _annotation_results.get(key)
+    if cached is not None:
+        expires_at, final_state = cached
+        if loop.time() < expires_at:
+            _annotation_results.move_to_end(key)
+            return final_state
+        del _annotation_results[key]
+
+    task = _inflight_runs.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            active_workflow.run(
+                input_description=request.description,
+                schema_version=request.schema_version,
+                max_validation_attempts=request.max_validation_attempts,
+                run_assessment=request.run_assessment,
+                config=config,
+            )
+        )
+        _inflight_runs[key] = task
+        task.add_done_callback(lambda done: _finish_workflow_run(key, done))
+    # Shield so one caller going away does not cancel the run for the others
+    return await asyncio.shield(task)
 
 
 @app.post("/annotate", response_model=AnnotationResponse)
@@ -559,6 +901,12 @@ async def annotate(
     - X-API-Key header: Server-level authentication
     - X-OpenRouter-Key header: BYOK mode (uses your OpenRouter key for billing)
 
+    Identical requests that arrive while a run is in progress share that run's
+    result. Completed results are reused only when the server enables it with
+    ANNOTATION_CACHE_SIZE (off by default): identical requests within
+    ANNOTATION_CACHE_TTL_S seconds then return the earlier annotation instead of
+    a new one.
+
     Args:
         request: Annotation request with description and parameters
         req: FastAPI request to extract headers
@@ -616,8 +964,8 @@ async def annotate(
             )
 
         try:
-            active_workflow = create_openrouter_workflow(
-                api_key=server_api_key,
+            active_workflow = get_openrouter_workflow(
+                server_api_key,
                 annotation_model=model_override,
                 annotation_provider=provider_override,
                 eval_model=eval_model_override,
@@ -644,15 +992,10 @@ async def annotate(
         # LangGraph default is 25, increase to 100 for complex workflows
         config = {"recursion_limit": 100}
 
-        start_time = time.time()
-        final_state = await active_workflow.run(
-            input_description=request.description,
-            schema_version=request.schema_version,
-            max_validation_attempts=request.max_validation_attempts,
-            run_assessment=request.run_assessment,
-            config=config,
-        )
-        latency_ms = int((time.time() - start_time) * 1000)
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        final_state = await run_workflow_coalesced(active_workflow, request, config)
+        latency_ms = int((loop.time() - start_time) * 1000)
 
         # Determine overall status
         # IMPORTANT: Ensure is_valid is only True when there are NO validation errors
@@ -688,7 +1031,8 @@ async def annotate(
             )
             await telemetry_collector.collect(event)
 
-        return AnnotationResponse(
+        # Built from trusted workflow output; FastAPI still checks it against response_model
+        return AnnotationResponse.model_construct(
             annotation=final_state["current_annotation"],
             is_valid=is_valid,
             is_faithful=final_state["is_faithful"],
@@ -787,8 +1131,8 @@ async def annotate_from_image(
             )
 
         try:
-            active_workflow = create_openrouter_workflow(
-                api_key=server_api_key,
+            active_workflow = get_openrouter_workflow(
+                server_api_key,
                 annotation_model=model_override,
                 annotation_provider=provider_override,
                 eval_model=eval_model_override,
@@ -827,14 +1171,24 @@ async def annotate_from_image(
         active_vision_agent = vision_agent
 
     try:
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
-        # Step 1: Generate image description using vision model
-        vision_result = await active_vision_agent.describe_image(
-            image_data=request.image,
-            custom_prompt=request.prompt,
+        # Load the schema vocabulary and validator while the vision model works
+        warm_up_task = asyncio.create_task(
+            asyncio.to_thread(active_workflow.warm_up, request.schema_version)
         )
 
+        # Step 1: Generate image description using vision model
+        try:
+            vision_result = await active_vision_agent.describe_image(
+                image_data=request.image,
+                custom_prompt=request.prompt,
+            )
+        finally:
+            # Warm-up failures resurface (and are reported) inside the workflow
+            await asyncio.gather(warm_up_task, return_exceptions=True)
+
         image_description = vision_result["description"]
         image_metadata = vision_result["metadata"]
 
@@ -848,7 +1202,7 @@ async def annotate_from_image(
             run_assessment=request.run_assessment,
             config=config,
         )
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = int((loop.time() - start_time) * 1000)
 
         # Determine overall status
         is_valid = final_state["is_valid"] and len(final_state["validation_errors"]) == 0
@@ -882,7 +1236,7 @@ async def annotate_from_image(
             )
             await telemetry_collector.collect(event)
 
-        return ImageAnnotationResponse(
+        return ImageAnnotationResponse.model_construct(
             image_description=image_description,
             annotation=final_state["current_annotation"],
             is_valid=is_valid,
@@ -904,6 +1258,81 @@ async def annotate_from_image(
         ) from e
 
 
+@app.post("/annotate-from-image/raw", response_model=ImageAnnotationResponse)
+async def annotate_from_image_raw(
+    req: Request,
+    image: Annotated[UploadFile, File(description="Image file (PNG, JPEG, or WEBP)")],
+    prompt: Annotated[str | None, Form()] = None,
+    schema_version: Annotated[str, Form()] = "8.4.0",
+    max_validation_attempts: Annotated[int, Form()] = 5,
+    run_assessment: Annotated[bool, Form()] = False,
+    model: Annotated[str | None, Form()] = None,
+    vision_model: Annotated[str | None, Form()] = None,
+    provider: Annotated[str | None, Form()] = None,
+    temperature: Annotated[float | None, Form()] = None,
+    telemetry_enabled: Annotated[bool, Form()] = True,
+    api_key: str = Depends(api_key_auth),
+) -> ImageAnnotationResponse:
+    """Generate HED annotation from an uploaded image file.
+
+    Multipart variant of /annotate-from-image: the image is sent as raw bytes
+    instead of a base64 string inside JSON, which is about a third smaller on
+    the wire and skips parsing a multi-megabyte JSON string. Form fields match
+    ImageAnnotationRequest.
+
+    Args:
+        req: FastAPI request to extract headers
+        image: Uploaded image file
+        prompt: Optional custom prompt for vision model
+        schema_version: HED schema version to use
+        max_validation_attempts: Maximum validation retry attempts
+        run_assessment: Whether to run final assessment
+        model: Override model for annotation
+        vision_model: Override vision model for image description
+        provider: Override provider preference
+        temperature: Override LLM temperature
+        telemetry_enabled: Allow telemetry collection for this request
+        api_key: Authentication result (injected by dependency)
+
+    Returns:
+        Generated annotation with image description and validation feedback
+
+    Raises:
+        HTTPException: If the image is too large or annotation fails
+    """
+    # Read at most one byte past the limit, so oversized uploads are never loaded whole
+    image_bytes = await image.read(MAX_IMAGE_SIZE_BYTES + 1)
+    if len(image_bytes) > MAX_IMAGE_SIZE_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Image exceeds maximum allowed size ({MAX_IMAGE_SIZE_MB}MB)",
+        )
+
+    # The vision model API takes a data URI, so encode once here
+    mime_type = image.content_type or ""
+    if not mime_type.startswith("image/"):
+        mime_type = "image/png"
+    data_uri = f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('ascii')}"
+
+    try:
+        request = ImageAnnotationRequest(
+            image=data_uri,
+            prompt=prompt,
+            schema_version=schema_version,
+            max_validation_attempts=max_validation_attempts,
+            run_assessment=run_assessment,
+            model=model,
+            vision_model=vision_model,
+            provider=provider,
+            temperature=temperature,
+            telemetry_enabled=telemetry_enabled,
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors()) from e
+
+    return await annotate_from_image(request, req, api_key)
+
+
 @app.post("/annotate/stream")
 async def annotate_stream(
     request: AnnotationRequest,
@@ -929,8 +1358,6 @@ async def annotate_stream(
     Raises:
         HTTPException: If workflow fails or authentication fails
     """
-    from src.agents.state import create_initial_state
-
     # Determine which workflow to use (same logic as /annotate)
     model_override = request.model or req.headers.get("x-openrouter-model")
     provider_override = request.provider or req.headers.get("x-openrouter-provider")
@@ -971,8 +1398,8 @@ async def annotate_stream(
                 detail="Server not configured for model overrides (missing OPENROUTER_API_KEY)",
             )
         try:
-            active_workflow = create_openrouter_workflow(
-                api_key=server_api_key,
+            active_workflow = get_openrouter_workflow(
+                server_api_key,
                 annotation_model=model_override,
                 annotation_provider=provider_override,
                 eval_model=eval_model_override,
@@ -1001,29 +1428,15 @@ async def annotate_stream(
         request.run_assessment,
     )
 
-    # Node name to user-friendly stage mapping
-    node_stage_map = {
-        "annotate": ("annotating", "Generating HED annotation..."),
-        "validate": ("validating", "Validating HED annotation..."),
-        "summarize_feedback": ("refining", "Processing validation feedback..."),
-        "evaluate": ("evaluating", "Evaluating annotation faithfulness..."),
-        "assess": ("assessing", "Running final assessment..."),
-    }
-
     async def event_generator():
         """Generate SSE events for workflow progress using LangGraph streaming."""
 
-        def send_event(event_type: str, data: dict) -> str:
-            return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
-
         # SSE padding comment to force Safari to open the stream
-        yield ": stream opened\n\n"
+        yield SSE_STREAM_OPENED
 
         try:
             # Send initial start event
-            yield send_event(
-                "progress", {"stage": "starting", "message": "Initializing annotation workflow..."}
-            )
+            yield SSE_ANNOTATION_STARTED
 
             # Track state and progress
             current_state = initial_state.copy()
@@ -1039,8 +1452,8 @@ async def annotate_stream(
                 name = event.get("name", "")
 
                 # Handle node start events
-                if event_type == "on_chain_start" and name in node_stage_map:
-                    stage, message = node_stage_map[name]
+                if event_type == "on_chain_start" and name in SSE_NODE_STAGES:
+                    stage, message = SSE_NODE_STAGES[name]
 
                     # Track validation attempts
                     if name == "validate":
@@ -1055,20 +1468,26 @@ async def annotate_stream(
                         }
                         if name == "validate":
                             progress_data["attempt"] = validation_attempt
-                        yield send_event("progress", progress_data)
+                        yield _sse_event("progress", progress_data)
 
                 # Handle node end events to get intermediate state
-                if event_type == "on_chain_end" and name in node_stage_map:
+                if event_type == "on_chain_end" and name in SSE_NODE_STAGES:
                     output = event.get("data", {}).get("output", {})
                     if isinstance(output, dict):
                         current_state.update(output)
 
+                        # Stream each draft annotation as soon as it is generated
+                        if name == "annotate" and output.get("current_annotation"):
+                            yield _sse_event(
+                                "annotation", {"annotation": output["current_annotation"]}
+                            )
+
                         # Send validation result events
                         if name == "validate":
                             is_valid = output.get("is_valid", False)
                             errors = output.get("validation_errors", [])
                             if is_valid:
-                                yield send_event(
+                                yield _sse_event(
                                     "validation",
                                     {
                                         "valid": True,
@@ -1086,7 +1505,7 @@ async def annotate_stream(
                                 }
                                 if tag_suggestions:
                                     validation_data["tag_suggestions"] = tag_suggestions
-                                yield send_event("validation", validation_data)
+                                yield _sse_event("validation", validation_data)
 
             # Send final result
             is_valid = (
@@ -1108,25 +1527,26 @@ async def annotate_stream(
                 "status": status,
             }
 
-            yield send_event("result", result)
-            yield send_event("done", {"message": "Workflow completed"})
+            yield _sse_event("result", result)
+            yield _sse_event("done", {"message": "Workflow completed"})
 
         except asyncio.CancelledError:
             raise
         except Exception:
             # Log the actual error for debugging, but return a generic message
             logging.exception("Streaming workflow error")
-            yield send_event("error", {"message": "An error occurred during annotation processing"})
-            yield send_event("done", {"message": "Workflow ended with error"})
+            yield _sse_event("error", {"message": "An error occurred during annotation processing"})
+            yield _sse_event("done", {"message": "Workflow ended with error"})
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
         headers={
-            "Cache-Control": "no-cache",
+            "Cache-Control": "no-cache, no-transform",  # Keep proxies from merging frames
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "X-Content-Type-Options": "nosniff",  # Prevent MIME-type sniffing; helps Safari trust text/event-stream
+            # X-Content-Type-Options: nosniff (helps Safari trust text/event-stream)
+            # is added by SecurityHeadersMiddleware
         },
     )
 
@@ -1156,8 +1576,6 @@ async def annotate_from_image_stream(
     Raises:
         HTTPException: If workflow or vision agent fails or authentication fails
     """
-    from src.agents.state import create_initial_state
-
     # Determine which workflow and vision agent to use (same logic as /annotate-from-image)
     model_override = request.model or req.headers.get("x-openrouter-model")
     vision_model_override = request.vision_model or req.headers.get("x-openrouter-vision-model")
@@ -1206,8 +1624,8 @@ async def annotate_from_image_stream(
                 detail="Server not configured for model overrides (missing OPENROUTER_API_KEY)",
             )
         try:
-            active_workflow = create_openrouter_workflow(
-                api_key=server_api_key,
+            active_workflow = get_openrouter_workflow(
+                server_api_key,
                 annotation_model=model_override,
                 annotation_provider=provider_override,
                 eval_model=eval_model_override,
@@ -1243,34 +1661,18 @@ async def annotate_from_image_stream(
         active_workflow = workflow
         active_vision_agent = vision_agent
 
-    # Node name to user-friendly stage mapping
-    node_stage_map = {
-        "annotate": ("annotating", "Generating HED annotation..."),
-        "validate": ("validating", "Validating HED annotation..."),
-        "summarize_feedback": ("refining", "Processing validation feedback..."),
-        "evaluate": ("evaluating", "Evaluating annotation faithfulness..."),
-        "assess": ("assessing", "Running final assessment..."),
-    }
-
     async def event_generator():
         """Generate SSE events for image annotation workflow progress."""
 
-        def send_event(event_type: str, data: dict) -> str:
-            return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
-
         # SSE padding comment to force Safari to open the stream
-        yield ": stream opened\n\n"
+        yield SSE_STREAM_OPENED
 
         try:
             # Send initial start event
-            yield send_event(
-                "progress", {"stage": "starting", "message": "Initializing image annotation..."}
-            )
+            yield SSE_IMAGE_ANNOTATION_STARTED
 
             # Step 1: Generate image description using vision model
-            yield send_event(
-                "progress", {"stage": "vision", "message": "Analyzing image with vision model..."}
-            )
+            yield SSE_VISION_STARTED
 
             vision_result = await active_vision_agent.describe_image(
                 image_data=request.image,
@@ -1281,7 +1683,7 @@ async def annotate_from_image_stream(
             image_metadata = vision_result["metadata"]
 
             # Send image description event
-            yield send_event(
+            yield _sse_event(
                 "image_description",
                 {"description": image_description, "metadata": image_metadata},
             )
@@ -1309,8 +1711,8 @@ async def annotate_from_image_stream(
                 name = event.get("name", "")
 
                 # Handle node start events
-                if event_type == "on_chain_start" and name in node_stage_map:
-                    stage, message = node_stage_map[name]
+                if event_type == "on_chain_start" and name in SSE_NODE_STAGES:
+                    stage, message = SSE_NODE_STAGES[name]
 
                     # Track validation attempts
                     if name == "validate":
@@ -1325,20 +1727,26 @@ async def annotate_from_image_stream(
                         }
                         if name == "validate":
                             progress_data["attempt"] = validation_attempt
-                        yield send_event("progress", progress_data)
+                        yield _sse_event("progress", progress_data)
 
                 # Handle node end events to get intermediate state
-                if event_type == "on_chain_end" and name in node_stage_map:
+                if event_type == "on_chain_end" and name in SSE_NODE_STAGES:
                     output = event.get("data", {}).get("output", {})
                     if isinstance(output, dict):
                         current_state.update(output)
 
+                        # Stream each draft annotation as soon as it is generated
+                        if name == "annotate" and output.get("current_annotation"):
+                            yield _sse_event(
+                                "annotation", {"annotation": output["current_annotation"]}
+                            )
+
                         # Send validation result events
                         if name == "validate":
                             is_valid = output.get("is_valid", False)
                             errors = output.get("validation_errors", [])
                             if is_valid:
-                                yield send_event(
+                                yield _sse_event(
                                     "validation",
                                     {
                                         "valid": True,
@@ -1356,7 +1764,7 @@ async def annotate_from_image_stream(
                                 }
                                 if tag_suggestions:
                                     validation_data["tag_suggestions"] = tag_suggestions
-                                yield send_event("validation", validation_data)
+                                yield _sse_event("validation", validation_data)
 
             # Send final result
             is_valid = (
@@ -1380,29 +1788,74 @@ async def annotate_from_image_stream(
                 "image_metadata": image_metadata,
             }
 
-            yield send_event("result", result)
-            yield send_event("done", {"message": "Workflow completed"})
+            yield _sse_event("result", result)
+            yield _sse_event("done", {"message": "Workflow completed"})
 
         except asyncio.CancelledError:
             raise
         except Exception:
             # Log the actual error for debugging, but return a generic message
             logging.exception("Streaming image annotation workflow error")
-            yield send_event("error", {"message": "An error occurred during image annotation"})
-            yield send_event("done", {"message": "Workflow ended with error"})
+            yield _sse_event("error", {"message": "An error occurred during image annotation"})
+            yield _sse_event("done", {"message": "Workflow ended with error"})
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
         headers={
-            "Cache-Control": "no-cache",
+            "Cache-Control": "no-cache, no-transform",  # Keep proxies from merging frames
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "X-Content-Type-Options": "nosniff",  # Prevent MIME-type sniffing; helps Safari trust text/event-stream
+            # X-Content-Type-Options: nosniff (helps Safari trust text/event-stream)
+            # is added by SecurityHeadersMiddleware
         },
     )
 
 
+def get_python_validator(schema_version: str) -> HedPythonValidator:
+    """Get the shared Python validator for a schema version, creating it once.
+
+    Args:
+        schema_version: HED schema version to validate against
+
+    Returns:
+        Validator reused by every /validate request for this version
+    """
+    validator = _python_validators.get(schema_version)
+    if validator is None:
+        schema = schema_loader.load_schema(schema_version)
+        validator = _python_validators[schema_version] = HedPythonValidator(schema)
+    return validator
+
+
+def _validate_hed_string(schema_version: str, hed_string: str) -> ValidationResult:
+    """Validate a HED string with the shared validator for its schema version."""
+    return get_python_validator(schema_version).validate(hed_string)
+
+
+def _validate_hed_strings(schema_version: str, hed_strings: list[str]) -> list[ValidationResult]:
+    """Validate several HED strings, looking up the shared validator once."""
+    validator = get_python_validator(schema_version)
+    return [validator.validate(hed_string) for hed_string in hed_strings]
+
+
+def _to_validation_response(result: ValidationResult) -> ValidationResponse:
+    """Convert a validator result to the API response model."""
+    return ValidationResponse.model_construct(
+        is_valid=result.is_valid,
+        errors=[f"[{e.code}] {e.message}" for e in result.errors],
+        warnings=[f"[{w.code}] {w.message}" for w in result.warnings],
+        parsed_string=result.parsed_string,
+    )
+
+
+def _cache_validation_response(key: tuple[str, str], response: ValidationResponse) -> None:
+    """Store a /validate response, evicting the least recently used entries."""
+    _validation_results[key] = response
+    while len(_validation_results) > VALIDATION_CACHE_SIZE:
+        _validation_results.popitem(last=False)
+
+
 @app.post("/validate", response_model=ValidationResponse)
 async def validate(
     request: ValidationRequest, api_key: str = Depends(api_key_auth)
@@ -1425,20 +1878,24 @@ async def validate(
         raise HTTPException(status_code=503, detail="Schema loader not initialized")
 
     try:
-        # Load schema
-        schema = schema_loader.load_schema(request.schema_version)
-
-        # Validate using Python validator
-        validator = HedPythonValidator(schema)
-        result = validator.validate(request.hed_string)
-
-        return ValidationResponse(
-            is_valid=result.is_valid,
-            errors=[f"[{e.code}] {e.message}" for e in result.errors],
-            warnings=[f"[{w.code}] {w.message}" for w in result.warnings],
-            parsed_string=result.parsed_string,
+        key = (request.schema_version, request.hed_string)
+        cached = _validation_results.get(key)
+        if cached is not None:
+            _validation_results.move_to_end(key)
+            return cached
+
+        # Schema loading and validation are synchronous; run them off the event loop
+        result = await anyio.to_thread.run_sync(
+            _validate_hed_string,
+            request.schema_version,
+            request.hed_string,
+            limiter=_validation_limiter,
         )
 
+        response = _to_validation_response(result)
+        _cache_validation_response(key, response)
+        return response
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1446,6 +1903,64 @@ async def validate(
         ) from e
 
 
+@app.post("/validate/batch", response_model=BatchValidationResponse)
+async def validate_batch(
+    request: BatchValidationRequest, api_key: str = Depends(api_key_auth)
+) -> BatchValidationResponse:
+    """Validate many HED annotation strings in one request.
+
+    Uncached strings are validated together in a single worker thread, so a
+    whole events file costs one request and one validator lookup.
+    Requires API key authentication via X-API-Key header.
+
+    Args:
+        request: Batch validation request with HED strings
+        api_key: API key for authentication (injected by dependency)
+
+    Returns:
+        Validation results in the same order as the request strings
+
+    Raises:
+        HTTPException: If validation fails or authentication fails
+    """
+    if schema_loader is None:
+        raise HTTPException(status_code=503, detail="Schema loader not initialized")
+
+    schema_version = request.schema_version
+    responses: dict[str, ValidationResponse] = {}
+    for hed_string in request.hed_strings:
+        cached = _validation_results.get((schema_version, hed_string))
+        if cached is not None:
+            _validation_results.move_to_end((schema_version, hed_string))
+            responses[hed_string] = cached
+
+    # Each distinct uncached string is validated once
+    pending = [s for s in dict.fromkeys(request.hed_strings) if s not in responses]
+
+    try:
+        if pending:
+            results = await anyio.to_thread.run_sync(
+                _validate_hed_strings,
+                schema_version,
+                pending,
+                limiter=_validation_limiter,
+            )
+            for hed_string, result in zip(pending, results, strict=True):
+                response = _to_validation_response(result)
+                _cache_validation_response((schema_version, hed_string), response)
+                responses[hed_string] = response
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Validation failed: {str(e)}",
+        ) from e
+
+    return BatchValidationResponse.model_construct(
+        results=[responses[hed_string] for hed_string in request.hed_strings]
+    )
+
+
 @app.post("/feedback", response_model=FeedbackResponse)
 async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
     """Submit user feedback about an annotation.
@@ -1598,7 +2113,7 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
 
 
 @app.get("/version")
-async def get_version():
+async def get_version() -> dict[str, str]:
     """Get API version information.
 
     Returns:
@@ -1611,7 +2126,7 @@ async def get_version():
 
 
 @app.get("/")
-async def root():
+async def root() -> dict[str, Any]:
     """Root endpoint with API information.
 
     Returns:
@@ -1625,8 +2140,10 @@ async def root():
             "POST /annotate": "Generate HED annotation from description",
             "POST /annotate/stream": "Generate HED annotation with streaming progress",
             "POST /annotate-from-image": "Generate HED annotation from image",
+            "POST /annotate-from-image/raw": "Generate HED annotation from uploaded image file",
             "POST /annotate-from-image/stream": "Generate HED annotation from image with streaming",
             "POST /validate": "Validate HED annotation string",
+            "POST /validate/batch": "Validate many HED annotation strings",
             "POST /feedback": "Submit user feedback about annotation",
             "GET /health": "Health check",
             "GET /version": "Get version information",
@@ -1637,9 +2154,13 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
+    # Reload is for development only and runs a single process; otherwise use
+    # API_WORKERS processes. uvicorn picks uvloop/httptools when installed.
+    reload = os.getenv("API_RELOAD", "false").lower() == "true"
     uvicorn.run(
         "src.api.main:app",
-        host="0.0.0.0",
-        port=38427,
-        reload=True,
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "38427")),
+        reload=reload,
+        workers=None if reload else int(os.getenv("API_WORKERS", "1")),
     )
@@ -1,7 +1,12 @@
 """Pydantic models for API requests and responses."""
 
+from typing import Annotated
+
 from pydantic import BaseModel, Field
 
+# Max HED strings accepted by one /validate/batch request
+MAX_BATCH_VALIDATION_SIZE = 1000
+
 
 class AnnotationRequest(BaseModel):
     """Request model for HED annotation generation.
@@ -124,6 +129,36 @@ class ValidationResponse(BaseModel):
     parsed_string: str | None = Field(default=None)
 
 
+class BatchValidationRequest(BaseModel):
+    """Request model for validating many HED strings in one call.
+
+    Attributes:
+        hed_strings: HED annotation strings to validate (e.g. rows of an events file)
+        schema_version: HED schema version used for every string
+    """
+
+    hed_strings: list[Annotated[str, Field(min_length=1)]] = Field(
+        ...,
+        description="HED annotation strings",
+        min_length=1,
+        max_length=MAX_BATCH_VALIDATION_SIZE,
+    )
+    schema_version: str = Field(
+        default="8.4.0",
+        description="HED schema version",
+    )
+
+
+class BatchValidationResponse(BaseModel):
+    """Response model for batch HED validation.
+
+    Attributes:
+        results: Validation result for each input string, in request order
+    """
+
+    results: list[ValidationResponse]
+
+
 class ImageAnnotationRequest(BaseModel):
     """Request model for image-based HED annotation generation.
 
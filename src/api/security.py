@@ -4,13 +4,17 @@ This module provides authentication, authorization, and audit logging
 for API endpoints to ensure compliance with security best practices.
 """
 
+import atexit
 import logging
 import os
+import queue
 import secrets
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import HTTPException, Request, Security, status
 from fastapi.security import APIKeyHeader
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,6 +26,62 @@ OPENROUTER_KEY_HEADER = APIKeyHeader(name="X-OpenRouter-Key", auto_error=False)
 # Audit log format
 AUDIT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [AUDIT] %(message)s"
 
+# Audit records waiting for the background writer; beyond this they are dropped
+AUDIT_QUEUE_SIZE = 10_000
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# Headers added to every HTTP response, pre-encoded for the ASGI send path
+SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+)
+
+
+class SecurityHeadersMiddleware:
+    """ASGI middleware that appends SECURITY_HEADERS to every HTTP response.
+
+    Works on the raw ``http.response.start`` message, so no header
+    re-encoding or MutableHeaders bookkeeping happens per response.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Wrap an ASGI application.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.extend(SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
 
 class APIKeyAuth:
     """API Key authentication handler.
@@ -169,19 +229,38 @@ class AuditLogger:
         """Initialize audit logger."""
         self.logger = logging.getLogger("hedit.audit")
         self.enabled = os.getenv("ENABLE_AUDIT_LOG", "true").lower() == "true"
+        self.queue_handler: _DroppingQueueHandler | None = None
+        self._listener: QueueListener | None = None
 
         # Configure audit log file if enabled
         if self.enabled:
             log_file = os.getenv("AUDIT_LOG_FILE", "/var/log/hedit/audit.log")
             try:
-                handler = logging.FileHandler(log_file)
+                handler: logging.Handler = logging.FileHandler(log_file)
                 handler.setFormatter(logging.Formatter(AUDIT_LOG_FORMAT))
-                self.logger.addHandler(handler)
                 self.logger.setLevel(logging.INFO)
             except (PermissionError, FileNotFoundError) as e:
                 logger.warning(f"Could not configure audit log file: {e}")
                 # Fall back to console logging
-                self.logger.addHandler(logging.StreamHandler())
+                handler = logging.StreamHandler()
+
+            # Writes happen on a listener thread so request handlers never block on log I/O
+            self.queue_handler = _DroppingQueueHandler(queue.Queue(maxsize=AUDIT_QUEUE_SIZE))
+            self._listener = QueueListener(self.queue_handler.queue, handler)
+            self._listener.start()
+            atexit.register(self.close)
+            self.logger.addHandler(self.queue_handler)
+
+    def close(self) -> None:
+        """Flush queued audit records and stop the background writer."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    @property
+    def dropped_records(self) -> int:
+        """Number of audit records dropped because the write queue was full."""
+        return self.queue_handler.dropped if self.queue_handler else 0
 
     def log_request(
         self,
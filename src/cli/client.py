@@ -198,7 +198,7 @@ class HEDitClient:
 
         Yields:
             Tuple of (event_type, event_data) for each SSE event.
-            Event types: "progress", "validation", "result", "error", "done"
+            Event types: "progress", "annotation", "validation", "result", "error", "done"
         """
         with httpx.Client(timeout=self.timeout) as client:
             with client.stream(
@@ -288,7 +288,8 @@ class HEDitClient:
 
         Yields:
             Tuple of (event_type, event_data) for each SSE event.
-            Event types: "progress", "image_description", "validation", "result", "error", "done"
+            Event types: "progress", "image_description", "annotation", "validation",
+            "result", "error", "done"
         """
         image_uri = self._encode_image(image_path)
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +25,15 @@ if TYPE_CHECKING:
 _STANDALONE_AVAILABLE: bool | None = None
 
 
+def _uvloop_requested() -> bool:
+    """Check whether the workflow should run on uvloop (HED_USE_UVLOOP env var).
+
+    uvloop lowers task scheduling overhead for the many small awaits in the
+    LangGraph workflow. It is only available on Linux and macOS.
+    """
+    return os.environ.get("HED_USE_UVLOOP", "").lower() in ("1", "true")
+
+
 def _check_standalone_deps() -> bool:
     """Check if standalone mode dependencies are installed."""
     global _STANDALONE_AVAILABLE
@@ -234,6 +244,13 @@ class LocalExecutionBackend(ExecutionBackend):
             nest_asyncio.apply()
             return asyncio.get_event_loop().run_until_complete(coro)
         else:
+            if _uvloop_requested():
+                try:
+                    import uvloop
+                except ImportError:
+                    pass
+                else:
+                    return uvloop.run(coro)
             return asyncio.run(coro)
 
     def annotate(
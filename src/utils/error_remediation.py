@@ -398,28 +398,24 @@ Patterns:
         Returns:
             Tuple of (augmented_errors, augmented_warnings)
         """
-        augmented_errors = []
-        augmented_warnings = []
-
-        for error in errors:
-            # Extract error code from message (assumes format "[CODE] message")
-            code = self._extract_error_code(error)
-            if code:
-                remediation = self.get_remediation(code, error)
-                augmented_errors.append(f"{error}{remediation}")
-            else:
-                augmented_errors.append(error)
-
-        if warnings:
-            for warning in warnings:
-                code = self._extract_error_code(warning)
-                if code:
-                    remediation = self.get_remediation(code, warning)
-                    augmented_warnings.append(f"{warning}{remediation}")
-                else:
-                    augmented_warnings.append(warning)
-
-        return augmented_errors, augmented_warnings or []
+        augmented_errors = [self._augment_message(error) for error in errors]
+        augmented_warnings = [self._augment_message(warning) for warning in warnings or ()]
+
+        return augmented_errors, augmented_warnings
+
+    def _augment_message(self, message: str) -> str:
+        """Append remediation guidance to a single validation message.
+
+        Args:
+            message: Validation error/warning message
+
+        Returns:
+            Message with guidance appended, or unchanged if it has no error code
+        """
+        code = self._extract_error_code(message)
+        if code:
+            return message + self.get_remediation(code, message)
+        return message
 
     def _extract_error_code(self, message: str) -> str | None:
         """Extract error code from a validation message.
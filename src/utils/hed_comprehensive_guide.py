@@ -1000,13 +1000,14 @@ def get_comprehensive_hed_guide(
     hints_section = _format_semantic_hints(semantic_hints) if semantic_hints else ""
     no_extend_warning = _build_no_extend_warning() if no_extend else ""
 
-    # Assemble guide from modular sections
+    # Assemble guide from modular sections. Per-description hints go last so the
+    # schema-dependent rest of the guide is an identical prefix across requests,
+    # which provider-side prompt caches can reuse.
     sections = [
         "# HED ANNOTATION GUIDE\n",
         no_extend_warning,
         _build_vocabulary_check_section(),
         _build_correction_workflow_section(),
-        hints_section,
         _build_semantic_rules_section(),
         _build_relation_tags_section(),
         _build_event_agent_section(),
@@ -1020,6 +1021,7 @@ def get_comprehensive_hed_guide(
         _build_vocabulary_section(vocab_str, extend_str),
         _build_common_errors_section(),
         _build_output_format_section(),
+        f"\n---\n\n{hints_section}" if hints_section else "",
     ]
 
     return "".join(sections)
@@ -5,6 +5,7 @@ with support for tag extension rules.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -129,6 +130,9 @@ class HedJsonSchemaLoader:
 def load_latest_schema(schema_dir: Path | str) -> HedJsonSchemaLoader:
     """Load the latest HED standard schema.
 
+    The parsed schema is cached per file and shared by all callers (loaders
+    are read-only), so agents and workflows do not each parse it again.
+
     Args:
         schema_dir: Directory containing JSON schemas (required)
 
@@ -145,5 +149,11 @@ def load_latest_schema(schema_dir: Path | str) -> HedJsonSchemaLoader:
         )
 
     schema_dir = Path(schema_dir)
-    latest_schema = schema_dir / "HEDLatest.json"
-    return HedJsonSchemaLoader(latest_schema)
+    latest_schema = schema_dir.resolve() / "HEDLatest.json"
+    return _load_schema_file(latest_schema)
+
+
+@lru_cache(maxsize=4)
+def _load_schema_file(schema_path: Path) -> HedJsonSchemaLoader:
+    """Parse a JSON schema file once per path."""
+    return HedJsonSchemaLoader(schema_path)
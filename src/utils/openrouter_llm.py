@@ -8,6 +8,7 @@ Cache control is automatically enabled for Anthropic models, reducing costs by u
 import os
 from typing import Any
 
+from langchain_core.caches import BaseCache
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 
@@ -20,6 +21,7 @@ def create_openrouter_llm(
     provider: str | None = None,
     user_id: str | None = None,
     enable_caching: bool | None = None,
+    response_cache: BaseCache | None = None,
 ) -> BaseChatModel:
     """Create an OpenRouter LLM instance with optional prompt caching.
 
@@ -36,6 +38,9 @@ def create_openrouter_llm(
         user_id: User identifier for cache optimization (sticky routing)
         enable_caching: Enable Anthropic prompt caching. If None (default),
             auto-enables for Anthropic Claude models.
+        response_cache: Optional LangChain cache for full responses. Identical
+            prompts are answered locally without an API call, so only use it
+            for agents whose output should be reproducible (not annotation).
 
     Returns:
         LLM instance configured for OpenRouter
@@ -69,6 +74,7 @@ def create_openrouter_llm(
         temperature=temperature,
         max_tokens=max_tokens,
         model_kwargs=model_kwargs,
+        cache=response_cache,
     )
 
     # Determine if caching should be enabled
@@ -19,6 +19,7 @@ from src.validation.hed_lsp import (
     HedSuggestion,
     HedSuggestResult,
     get_hed_suggestions,
+    get_shared_hed_lsp_client,
     is_hed_lsp_available,
     suggest_tags_for_keywords,
 )
@@ -47,6 +48,7 @@ __all__ = [
     "HedSuggestion",
     "HedSuggestResult",
     "get_hed_suggestions",
+    "get_shared_hed_lsp_client",
     "is_hed_lsp_available",
     "suggest_tags_for_keywords",
 ]
@@ -14,13 +14,26 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
 from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# Number of successful hed-suggest outputs each client keeps, keyed by command line
+SUGGEST_CACHE_SIZE = 256
+
+# Maximum sentence chunks sent to hed-suggest for one description
+MAX_DESCRIPTION_CHUNKS = 16
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
 def is_hed_lsp_available() -> bool:
     """Check if hed-suggest CLI is available in PATH.
@@ -59,10 +72,26 @@ def get_default_max_results() -> int:
     try:
         return int(value)
     except ValueError:
-        logger.warning(f"Invalid HED_LSP_MAX_RESULTS value '{value}', using default of 10")
+        logger.warning("Invalid HED_LSP_MAX_RESULTS value '%s', using default of 10", value)
         return 10
 
 
+def split_description(description: str, max_chunks: int = MAX_DESCRIPTION_CHUNKS) -> list[str]:
+    """Split a description into sentences for separate tag suggestion queries.
+
+    Args:
+        description: Natural language event description
+        max_chunks: Maximum number of chunks; extra sentences join the last chunk
+
+    Returns:
+        Non-empty sentence chunks in order
+    """
+    chunks = [chunk for chunk in _SENTENCE_BOUNDARY.split(description.strip()) if chunk]
+    if len(chunks) > max_chunks:
+        chunks = chunks[: max_chunks - 1] + [" ".join(chunks[max_chunks - 1 :])]
+    return chunks
+
+
 @dataclass
 class HedSuggestion:
     """A suggested HED tag from the hed-lsp CLI.
@@ -93,6 +122,31 @@ class HedSuggestResult:
     error: str | None = None
 
 
+def _parse_suggestion_items(items: list) -> list[HedSuggestion]:
+    """Convert raw hed-suggest items (strings or dicts) to HedSuggestion objects.
+
+    Args:
+        items: Items from the CLI JSON output
+
+    Returns:
+        Parsed suggestions (may include empty tags from malformed output)
+    """
+    suggestions = []
+    for item in items:
+        if isinstance(item, str):
+            suggestions.append(HedSuggestion(tag=item))
+        elif isinstance(item, dict):
+            tag = item.get("tag") or item.get("name") or ""
+            suggestions.append(
+                HedSuggestion(
+                    tag=tag,
+                    score=item.get("score"),
+                    description=item.get("description"),
+                )
+            )
+    return suggestions
+
+
 class HedLspClient:
     """Client for interacting with hed-lsp CLI tools.
 
@@ -133,12 +187,22 @@ class HedLspClient:
         self.use_semantic = use_semantic if use_semantic is not None else get_default_use_semantic()
         self.max_results = max_results if max_results is not None else get_default_max_results()
 
-    def suggest(self, *queries: str, use_semantic: bool | None = None) -> HedSuggestResult:
+        # hed-suggest output is deterministic for a given command line
+        self._output_cache: OrderedDict[tuple[str, ...], object] = OrderedDict()
+        self._output_cache_lock = threading.Lock()
+
+    def suggest(
+        self,
+        *queries: str,
+        use_semantic: bool | None = None,
+        max_results: int | None = None,
+    ) -> HedSuggestResult:
         """Suggest HED tags for one or more natural language descriptions.
 
         Args:
             *queries: One or more natural language descriptions to convert to HED tags
             use_semantic: Override instance semantic setting for this call (thread-safe)
+            max_results: Override instance maximum suggestions for this call
 
         Returns:
             HedSuggestResult with suggested tags or error information
@@ -150,7 +214,118 @@ class HedLspClient:
                 error="No queries provided",
             )
 
+        output, error = self._run_cli(queries, use_semantic, max_results)
+        if error is not None:
+            return HedSuggestResult(success=False, suggestions=[], error=error)
+
+        suggestions: list[HedSuggestion] = []
+
+        # Handle different output formats
+        if isinstance(output, list):
+            # List of suggestions
+            suggestions.extend(_parse_suggestion_items(output))
+        elif isinstance(output, dict):
+            # Handle hed-suggest output format: {"query": ["tag1", "tag2", ...]}
+            # First check for explicit suggestions/results keys
+            items = output.get("suggestions") or output.get("results")
+            if items is not None:
+                suggestions.extend(_parse_suggestion_items(items))
+            else:
+                # Handle format where keys are query terms
+                # e.g., {"button press": ["Button", "Response-button", ...]}
+                for _query_key, tag_list in output.items():
+                    if isinstance(tag_list, list):
+                        suggestions.extend(_parse_suggestion_items(tag_list))
+
+        # Filter out any empty-tag entries from malformed CLI output
+        suggestions = [s for s in suggestions if s.tag]
+
+        return HedSuggestResult(
+            success=True,
+            suggestions=suggestions,
+        )
+
+    def suggest_per_query(
+        self,
+        *queries: str,
+        use_semantic: bool | None = None,
+        max_results: int | None = None,
+    ) -> dict[str, list[str]] | None:
+        """Suggest HED tags for several queries with a single CLI invocation.
+
+        hed-suggest reports results keyed by query term when given multiple
+        queries, so one process (and one schema load) serves all of them.
+
+        Args:
+            *queries: Natural language queries or keywords
+            use_semantic: Override instance semantic setting for this call
+            max_results: Override instance maximum suggestions for this call
+
+        Returns:
+            Mapping of each query to its suggested tags, or None if the CLI
+            failed or its output was not keyed by query
+        """
+        per_query = self._suggest_items_per_query(queries, use_semantic, max_results)
+        if per_query is None:
+            return None
+        return {query: [s.tag for s in items] for query, items in per_query.items()}
+
+    def _suggest_items_per_query(
+        self,
+        queries: tuple[str, ...],
+        use_semantic: bool | None,
+        max_results: int | None = None,
+    ) -> dict[str, list[HedSuggestion]] | None:
+        """Run one hed-suggest call for several queries, keeping full suggestions.
+
+        Args:
+            queries: Natural language queries or keywords
+            use_semantic: Override instance semantic setting for this call
+            max_results: Override instance maximum suggestions for this call
+
+        Returns:
+            Mapping of each query to its suggestions (with scores), or None if
+            the CLI failed or its output was not keyed by query
+        """
+        if not queries:
+            return {}
+
+        output, error = self._run_cli(queries, use_semantic, max_results)
+        if error is not None:
+            logger.warning("hed-suggest batch call failed: %s", error)
+            return None
+        if not isinstance(output, dict) or not all(q in output for q in queries):
+            return None
+
+        per_query: dict[str, list[HedSuggestion]] = {}
+        for query in queries:
+            tag_list = output[query]
+            items = _parse_suggestion_items(tag_list) if isinstance(tag_list, list) else []
+            per_query[query] = [s for s in items if s.tag]
+        return per_query
+
+    def _run_cli(
+        self,
+        queries: tuple[str, ...],
+        use_semantic: bool | None,
+        max_results: int | None = None,
+    ) -> tuple[object, str | None]:
+        """Run hed-suggest and decode its JSON output.
+
+        Successful outputs are cached per client and keyed by the full command
+        line (queries, result limit, and search mode), so repeated descriptions
+        or keywords do not start another CLI process.
+
+        Args:
+            queries: Query terms to pass to the CLI
+            use_semantic: Override instance semantic setting for this call
+            max_results: Override instance maximum suggestions for this call
+
+        Returns:
+            Tuple of (decoded JSON output, error message or None)
+        """
         effective_semantic = self.use_semantic if use_semantic is None else use_semantic
+        effective_max_results = self.max_results if max_results is None else max_results
 
         # Build command
         cmd = [
@@ -159,7 +334,7 @@ class HedLspClient:
             "--schema",
             self.schema_version,
             "--top",
-            str(self.max_results),
+            str(effective_max_results),
         ]
 
         if effective_semantic:
@@ -168,6 +343,12 @@ class HedLspClient:
         # Add all query terms
         cmd.extend(queries)
 
+        key = tuple(cmd)
+        with self._output_cache_lock:
+            if key in self._output_cache:
+                self._output_cache.move_to_end(key)
+                return self._output_cache[key], None
+
         try:
             result = subprocess.run(
                 cmd,
@@ -177,93 +358,24 @@ class HedLspClient:
             )
 
             if result.returncode != 0:
-                return HedSuggestResult(
-                    success=False,
-                    suggestions=[],
-                    error=result.stderr or f"Command failed with exit code {result.returncode}",
-                )
+                return None, (result.stderr or f"Command failed with exit code {result.returncode}")
 
             # Parse JSON output
             output = json.loads(result.stdout)
-            suggestions = []
-
-            # Handle different output formats
-            if isinstance(output, list):
-                # List of suggestions
-                for item in output:
-                    if isinstance(item, str):
-                        suggestions.append(HedSuggestion(tag=item))
-                    elif isinstance(item, dict):
-                        tag = item.get("tag") or item.get("name") or ""
-                        suggestions.append(
-                            HedSuggestion(
-                                tag=tag,
-                                score=item.get("score"),
-                                description=item.get("description"),
-                            )
-                        )
-            elif isinstance(output, dict):
-                # Handle hed-suggest output format: {"query": ["tag1", "tag2", ...]}
-                # First check for explicit suggestions/results keys
-                items = output.get("suggestions") or output.get("results")
-                if items is not None:
-                    for item in items:
-                        if isinstance(item, str):
-                            suggestions.append(HedSuggestion(tag=item))
-                        elif isinstance(item, dict):
-                            tag = item.get("tag") or item.get("name") or ""
-                            suggestions.append(
-                                HedSuggestion(
-                                    tag=tag,
-                                    score=item.get("score"),
-                                    description=item.get("description"),
-                                )
-                            )
-                else:
-                    # Handle format where keys are query terms
-                    # e.g., {"button press": ["Button", "Response-button", ...]}
-                    for _query_key, tag_list in output.items():
-                        if isinstance(tag_list, list):
-                            for item in tag_list:
-                                if isinstance(item, str):
-                                    suggestions.append(HedSuggestion(tag=item))
-                                elif isinstance(item, dict):
-                                    tag = item.get("tag") or item.get("name") or ""
-                                    suggestions.append(
-                                        HedSuggestion(
-                                            tag=tag,
-                                            score=item.get("score"),
-                                            description=item.get("description"),
-                                        )
-                                    )
-
-            # Filter out any empty-tag entries from malformed CLI output
-            suggestions = [s for s in suggestions if s.tag]
-
-            return HedSuggestResult(
-                success=True,
-                suggestions=suggestions,
-            )
-
         except subprocess.TimeoutExpired:
-            return HedSuggestResult(
-                success=False,
-                suggestions=[],
-                error="Command timed out after 30 seconds",
-            )
+            return None, "Command timed out after 30 seconds"
         except json.JSONDecodeError as e:
-            return HedSuggestResult(
-                success=False,
-                suggestions=[],
-                error=f"Failed to parse JSON output: {e}",
-            )
+            return None, f"Failed to parse JSON output: {e}"
         except Exception as e:
             logger.warning("hed-suggest command failed unexpectedly: %s", e, exc_info=True)
-            return HedSuggestResult(
-                success=False,
-                suggestions=[],
-                error=f"Command failed: {e}",
-            )
+            return None, f"Command failed: {e}"
+
+        # Only successful outputs are cached, so failures are retried
+        with self._output_cache_lock:
+            self._output_cache[key] = output
+            if len(self._output_cache) > SUGGEST_CACHE_SIZE:
+                self._output_cache.popitem(last=False)
+        return output, None
 
     def suggest_for_description(
         self,
@@ -272,8 +384,10 @@ class HedLspClient:
     ) -> HedSuggestResult:
         """Suggest HED tags for a natural language event description.
 
-        This is a convenience method that processes a full event description,
-        potentially breaking it down into components for better suggestions.
+        Multi-sentence descriptions are split into sentences and sent to
+        hed-suggest in one call, so each sentence gets focused suggestions.
+        The per-sentence lists are interleaved (best first) and deduplicated;
+        a tag suggested for several sentences keeps its best score.
 
         Args:
             description: Natural language description of an event
@@ -290,9 +404,63 @@ class HedLspClient:
         else:
             use_semantic = None  # use instance default
 
+        chunks = split_description(description)
+        if len(chunks) > 1:
+            per_chunk = self._suggest_items_per_query(tuple(chunks), use_semantic)
+            if per_chunk is not None:
+                # Round-robin over sentences keeps each sentence's best tags first
+                merged: dict[str, HedSuggestion] = {}
+                for items in zip_longest(*per_chunk.values()):
+                    for suggestion in items:
+                        if suggestion is None:
+                            continue
+                        best = merged.get(suggestion.tag)
+                        if best is None or (suggestion.score or 0.0) > (best.score or 0.0):
+                            # Reassigning an existing key keeps its first position
+                            merged[suggestion.tag] = suggestion
+                return HedSuggestResult(success=True, suggestions=list(merged.values()))
+
         return self.suggest(description, use_semantic=use_semantic)
 
 
+@lru_cache(maxsize=1)
+def get_shared_hed_lsp_client() -> HedLspClient | None:
+    """Get the process-wide HED-LSP client with default settings.
+
+    Availability is checked once, and workflows created per request share
+    the client and its output cache.
+
+    Returns:
+        Shared HedLspClient, or None if hed-suggest is not installed
+    """
+    try:
+        return HedLspClient()
+    except RuntimeError as e:
+        logger.warning("hed-lsp CLI not available: %s", e)
+        return None
+
+
+def _client_for(schema_version: str | None) -> HedLspClient:
+    """Get the shared client, or a dedicated one for another schema version.
+
+    The result limit is passed per call, so callers asking for a different
+    number of suggestions still share the shared client's output cache.
+
+    Args:
+        schema_version: Requested schema version (None for the default)
+
+    Returns:
+        HED-LSP client configured for the request
+
+    Raises:
+        RuntimeError: If hed-suggest CLI is not available
+    """
+    shared = get_shared_hed_lsp_client()
+    if shared is not None and schema_version in (None, shared.schema_version):
+        return shared
+    return HedLspClient(schema_version=schema_version)
+
+
 def get_hed_suggestions(
     description: str,
     schema_version: str | None = None,
@@ -301,8 +469,8 @@ def get_hed_suggestions(
 ) -> list[str]:
     """Get HED tag suggestions for a natural language description.
 
-    This is a convenience function that creates a client and returns
-    just the tag strings.
+    This is a convenience function that returns just the tag strings. It uses
+    the shared client (and its output cache) unless another schema version is requested.
 
     Args:
         description: Natural language description to convert to HED tags
@@ -316,12 +484,8 @@ def get_hed_suggestions(
     Raises:
         RuntimeError: If hed-suggest CLI is not available
     """
-    client = HedLspClient(
-        schema_version=schema_version,
-        use_semantic=use_semantic,
-        max_results=max_results,
-    )
-    result = client.suggest(description)
+    client = _client_for(schema_version)
+    result = client.suggest(description, use_semantic=use_semantic, max_results=max_results)
 
     if not result.success:
         raise RuntimeError(f"HED suggestion failed: {result.error}")
@@ -355,24 +519,28 @@ def suggest_tags_for_keywords(
     if not keywords:
         return {}
 
-    client = HedLspClient(
-        schema_version=schema_version,
-        use_semantic=use_semantic,
-        max_results=max_results,
-    )
+    client = _client_for(schema_version)
+
+    # One CLI invocation for all keywords when the output can be split per keyword
+    if len(keywords) > 1:
+        batched = client.suggest_per_query(
+            *keywords, use_semantic=use_semantic, max_results=max_results
+        )
+        if batched is not None:
+            return batched
 
     results = {}
     failed_keywords = []
     for keyword in keywords:
-        result = client.suggest(keyword)
+        result = client.suggest(keyword, use_semantic=use_semantic, max_results=max_results)
         if result.success:
             results[keyword] = [s.tag for s in result.suggestions]
         else:
-            logger.warning(f"hed-lsp suggestion failed for keyword '{keyword}': {result.error}")
+            logger.warning("hed-lsp suggestion failed for keyword '%s': %s", keyword, result.error)
             results[keyword] = []
             failed_keywords.append(keyword)
 
     if failed_keywords:
-        logger.warning(f"Failed to get suggestions for {len(failed_keywords)} keywords")
+        logger.warning("Failed to get suggestions for %d keywords", len(failed_keywords))
 
     return results
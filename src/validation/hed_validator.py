@@ -9,11 +9,14 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
 import shutil
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import IO, Literal
 
 from hed import HedString
 from hed.errors import get_printable_issue_string
@@ -22,8 +25,116 @@ from hed.validator import HedValidator
 
 logger = logging.getLogger(__name__)
 
+# JSON crossing the Node.js boundary uses orjson when installed (api extra)
+try:
+    import orjson
+
+    def _json_dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Seconds to wait for the JavaScript validator before restarting its worker
+JS_VALIDATION_TIMEOUT_SECONDS = 30
+
+# Node.js worker: reads one JSON request per line on stdin and writes one JSON
+# result per line on stdout, echoing the request id. The entry point of
+# hed-javascript is argv[1]. Schemas are built once per version and reused.
+_JS_WORKER_SCRIPT = """
+// stdout carries results only; library logging goes to stderr
+console.log = console.info = console.debug = console.error;
+
+const readline = require('readline');
+const { parseHedString, buildSchemasFromVersion } = require(process.argv[1]);
+
+const schemaCache = new Map();
+
+function loadSchemas(version) {
+    if (!schemaCache.has(version)) {
+        const pending = buildSchemasFromVersion(version);
+        schemaCache.set(version, pending);
+        pending.catch(() => schemaCache.delete(version));
+    }
+    return schemaCache.get(version);
+}
+
+// Warnings that indicate invalid/malformed HED and should be reported as errors
+// Based on HED validator source
+const errorCodes = new Set([
+    'TAG_INVALID',                    // Invalid tag - doesn't exist in schema
+    'TAG_NAMESPACE_PREFIX_INVALID',   // Invalid tag prefix
+    'TAG_NOT_UNIQUE',                 // Multiple unique tags
+    'TAG_REQUIRES_CHILD',             // Child/value required
+    'TAG_EXTENSION_INVALID',          // Invalid extension
+    'TAG_EMPTY',                      // Empty tag
+    'UNITS_INVALID',                  // Invalid units
+    'VALUE_INVALID',                  // Invalid value
+]);
+
+async function validate(hedString, schemaVersion) {
+    try {
+        const schemas = await loadSchemas(schemaVersion);
+        const [parsed, errors, warnings] = parseHedString(
+            hedString,
+            schemas,
+            false,  // no definitions
+            false,  // no placeholders
+            true    // full validation
+        );
+        const actualErrors = [];
+        const actualWarnings = [];
+
+        // Process errors
+        errors.forEach(e => {
+            actualErrors.push({
+                code: e.hedCode || e.internalCode,
+                message: e.message,
+                tag: e.parameters?.tag,
+                level: 'error'
+            });
+        });
+
+        // Process warnings - promote critical ones to errors
+        warnings.forEach(w => {
+            const code = w.hedCode || w.internalCode;
+            const isError = errorCodes.has(code);
+            const issue = {
+                code: code,
+                message: w.message,
+                tag: w.parameters?.tag,
+                level: isError ? 'error' : 'warning'
+            };
+            (isError ? actualErrors : actualWarnings).push(issue);
+        });
+
+        return {
+            isValid: actualErrors.length === 0,
+            parsed: parsed ? parsed.toString() : null,
+            errors: actualErrors,
+            warnings: actualWarnings
+        };
+    } catch (error) {
+        return {
+            isValid: false,
+            errors: [{ code: 'VALIDATOR_ERROR', message: error.message, level: 'error' }],
+            warnings: []
+        };
+    }
+}
+
+readline.createInterface({ input: process.stdin }).on('line', async (line) => {
+    const request = JSON.parse(line);
+    const result = await validate(request.hedString, request.schemaVersion);
+    result.id = request.id;
+    process.stdout.write(JSON.stringify(result) + '\\n');
+});
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a single validation issue (error or warning).
 
@@ -42,7 +153,7 @@ class ValidationIssue:
     context: dict | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of HED string validation.
 
@@ -205,11 +316,26 @@ class HedPythonValidator:
             return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
 
 
+def _pump_lines(stream: IO[str], lines: queue.Queue[str | None]) -> None:
+    """Forward lines from a worker's stdout to a queue, then None at EOF."""
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def _log_lines(stream: IO[str]) -> None:
+    """Log lines a worker writes to stderr until EOF."""
+    for line in stream:
+        logger.warning("JavaScript validator: %s", line.rstrip())
+
+
 class HedJavaScriptValidator:
     """Validates HED strings using the JavaScript HED validator.
 
     This provides more detailed feedback than the Python validator.
-    Requires Node.js and the hed-javascript package.
+    Requires Node.js and the hed-javascript package. Validation runs in a
+    persistent Node.js worker, so the validator library and schemas are
+    loaded once rather than for every string.
     """
 
     def __init__(
@@ -226,6 +352,12 @@ class HedJavaScriptValidator:
         self.validator_path = Path(validator_path)
         self.schema_version = schema_version
         self._check_installation()
+        # Persistent Node.js worker, started on first use; one request at a time
+        self._process: subprocess.Popen[str] | None = None
+        self._responses: queue.Queue[str | None] = queue.Queue()
+        self._lock = threading.Lock()
+        # Echoed back by the worker so a result is never matched to the wrong request
+        self._request_id = 0
 
     def _check_installation(self) -> None:
         """Verify that Node.js and hed-validator are available."""
@@ -244,6 +376,94 @@ class HedJavaScriptValidator:
         if not self.validator_path.exists():
             raise RuntimeError(f"HED JavaScript validator not found at {self.validator_path}")
 
+    def _start_worker(self) -> None:
+        """Start the Node.js worker and threads that collect its output lines."""
+        entry_point = self.validator_path / "dist" / "commonjs" / "index.js"
+        self._process = subprocess.Popen(
+            ["node", "-e", _JS_WORKER_SCRIPT, str(entry_point)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        # Each worker gets its own queue so output of a stopped worker is never read
+        self._responses = queue.Queue()
+        threading.Thread(
+            target=_pump_lines,
+            args=(self._process.stdout, self._responses),
+            name="hed-js-validator-output",
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=_log_lines,
+            args=(self._process.stderr,),
+            name="hed-js-validator-stderr",
+            daemon=True,
+        ).start()
+
+    def _request(self, hed_string: str) -> dict:
+        """Send one validation request to the worker and wait for its result.
+
+        The worker is (re)started when needed and stopped after any failure,
+        so the next request starts from a clean process.
+
+        Output lines that are not the result for this request (stray library
+        output on stdout) are logged and skipped.
+
+        Raises:
+            subprocess.TimeoutExpired: If no result arrives in time
+            subprocess.CalledProcessError: If the worker exits
+        """
+        with self._lock:
+            self._request_id += 1
+            request_id = self._request_id
+            request = _json_dumps(
+                {"id": request_id, "hedString": hed_string, "schemaVersion": self.schema_version}
+            )
+            if self._process is None or self._process.poll() is not None:
+                self._start_worker()
+            try:
+                self._process.stdin.write(request + "\n")
+                self._process.stdin.flush()
+                deadline = time.monotonic() + JS_VALIDATION_TIMEOUT_SECONDS
+                while True:
+                    try:
+                        line = self._responses.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        raise subprocess.TimeoutExpired(
+                            self._process.args, JS_VALIDATION_TIMEOUT_SECONDS
+                        ) from None
+                    if line is None:
+                        raise subprocess.CalledProcessError(
+                            self._process.wait(), self._process.args
+                        )
+                    try:
+                        response = _json_loads(line)
+                    except ValueError:
+                        response = None
+                    if isinstance(response, dict) and response.get("id") == request_id:
+                        return response
+                    logger.warning("Ignoring unexpected JavaScript validator output: %.200s", line)
+            except BaseException:
+                self._stop_worker()
+                raise
+
+    def _stop_worker(self) -> None:
+        """Stop the Node.js worker if it is running."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        process.kill()
+        process.wait()
+        if process.stdin:
+            process.stdin.close()
+
+    def close(self) -> None:
+        """Stop the Node.js worker process."""
+        with self._lock:
+            self._stop_worker()
+
     def validate(self, hed_string: str) -> ValidationResult:
         """Validate a HED string using JavaScript validator.
 
@@ -253,96 +473,8 @@ class HedJavaScriptValidator:
         Returns:
             ValidationResult with detailed errors and warnings
         """
-        # Create validation script
-        script = f"""
-        const {{ parseHedString, buildSchemasFromVersion }} = require('{self.validator_path}/dist/commonjs/index.js');
-
-        async function validate() {{
-            try {{
-                const schemas = await buildSchemasFromVersion('{self.schema_version}');
-                const hedString = `{hed_string}`;
-                const [parsed, errors, warnings] = parseHedString(
-                    hedString,
-                    schemas,
-                    false,  // no definitions
-                    false,  // no placeholders
-                    true    // full validation
-                );
-
-                // Reclassify warnings that should actually be errors
-                // Based on HED validator source: these indicate invalid/malformed HED
-                const errorCodes = [
-                    'TAG_INVALID',                    // Invalid tag - doesn't exist in schema
-                    'TAG_NAMESPACE_PREFIX_INVALID',   // Invalid tag prefix
-                    'TAG_NOT_UNIQUE',                 // Multiple unique tags
-                    'TAG_REQUIRES_CHILD',             // Child/value required
-                    'TAG_EXTENSION_INVALID',          // Invalid extension
-                    'TAG_EMPTY',                      // Empty tag
-                    'UNITS_INVALID',                  // Invalid units
-                    'VALUE_INVALID',                  // Invalid value
-                ];
-                const actualErrors = [];
-                const actualWarnings = [];
-
-                // Process errors
-                errors.forEach(e => {{
-                    actualErrors.push({{
-                        code: e.hedCode || e.internalCode,
-                        message: e.message,
-                        tag: e.parameters?.tag,
-                        level: 'error'
-                    }});
-                }});
-
-                // Process warnings - promote critical ones to errors
-                warnings.forEach(w => {{
-                    const code = w.hedCode || w.internalCode;
-                    const issue = {{
-                        code: code,
-                        message: w.message,
-                        tag: w.parameters?.tag,
-                        level: errorCodes.includes(code) ? 'error' : 'warning'
-                    }};
-
-                    if (errorCodes.includes(code)) {{
-                        actualErrors.push(issue);
-                    }} else {{
-                        actualWarnings.push(issue);
-                    }}
-                }});
-
-                const result = {{
-                    isValid: actualErrors.length === 0,
-                    parsed: parsed ? parsed.toString() : null,
-                    errors: actualErrors,
-                    warnings: actualWarnings
-                }};
-
-                console.log(JSON.stringify(result));
-            }} catch (error) {{
-                console.log(JSON.stringify({{
-                    isValid: false,
-                    errors: [{{ code: 'VALIDATOR_ERROR', message: error.message, level: 'error' }}],
-                    warnings: []
-                }}));
-            }}
-        }}
-
-        validate();
-        """
-
         try:
-            # Run Node.js validation
-            result = subprocess.run(
-                ["node", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-
-            # Parse result
-            output = json.loads(result.stdout)
+            output = self._request(hed_string)
 
             errors = [
                 ValidationIssue(
@@ -372,7 +504,9 @@ class HedJavaScriptValidator:
             )
 
         except subprocess.TimeoutExpired:
-            logger.warning("JavaScript validation timed out after 30s")
+            logger.warning(
+                "JavaScript validation timed out after %ss", JS_VALIDATION_TIMEOUT_SECONDS
+            )
             return ValidationResult(
                 is_valid=False,
                 errors=[
@@ -4,6 +4,8 @@ These tests verify the pure functions in AnnotationAgent without requiring
 an LLM or API calls.
 """
 
+from unittest.mock import MagicMock, patch
+
 from src.agents.annotation_agent import AnnotationAgent
 
 
@@ -249,3 +251,52 @@ class TestPromptSections:
         ]
         for section in expected_sections:
             assert section in guide, f"Missing section: {section}"
+
+
+class TestLoadVocabulary:
+    """Tests for load_vocabulary caching."""
+
+    def test_vocabulary_is_cached_per_schema_version(self):
+        """The schema should only be read once per version."""
+        agent = AnnotationAgent(llm=None, schema_dir=None)
+        loader = MagicMock()
+        loader.get_schema_vocabulary.return_value = ["Event", "Red"]
+
+        with patch("src.utils.schema_loader.get_schema_loader", return_value=loader):
+            first = agent.load_vocabulary("8.4.0")
+            second = agent.load_vocabulary("8.4.0")
+
+        assert first == second == (["Event", "Red"], [])
+        loader.load_schema.assert_called_once_with("8.4.0")
+
+
+class TestSystemPromptCache:
+    """Tests for get_system_prompt reuse."""
+
+    def _agent(self) -> AnnotationAgent:
+        agent = AnnotationAgent(llm=None, schema_dir=None)
+        agent._vocabularies["8.4.0"] = (["Event", "Red"], ["Event"])
+        return agent
+
+    def test_hint_free_prompt_is_built_once(self):
+        """Prompts without hints are reused per schema version and no_extend."""
+        agent = self._agent()
+
+        with patch.object(agent, "_build_system_prompt", return_value="prompt") as build:
+            agent.get_system_prompt("8.4.0")
+            agent.get_system_prompt("8.4.0", [])
+            agent.get_system_prompt("8.4.0", no_extend=True)
+
+        assert build.call_count == 2
+
+    def test_prompts_with_hints_are_not_cached(self):
+        """Semantic hints vary per description, so those prompts are rebuilt."""
+        agent = self._agent()
+        hints = [{"tag": "Red", "score": 0.9}]
+
+        first = agent.get_system_prompt("8.4.0", hints)
+        second = agent.get_system_prompt("8.4.0", hints)
+
+        assert first == second
+        assert "Red" in first
+        assert agent._system_prompts == {}
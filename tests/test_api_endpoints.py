@@ -6,9 +6,11 @@ IMPORTANT: These tests modify environment variables temporarily.
 App is imported inside the fixture to avoid polluting global state.
 """
 
+import base64
 import importlib
+import json
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -73,6 +75,54 @@ class TestHealthEndpoint:
         assert "llm_available" in data
         assert "validator_available" in data
 
+    def test_health_serves_cached_snapshot(self, client):
+        """Health returns the last background probe result without probing."""
+        from src.api import main
+
+        with patch.object(main, "_cached_health", main._health_body(True, True)):
+            data = client.get("/health").json()
+        assert data["status"] == "healthy"
+        assert data["llm_available"] is True
+        assert data["validator_available"] is True
+
+    async def test_check_health_reports_unreachable_llm(self):
+        """An initialized workflow is not enough if the LLM server is down."""
+        import httpx
+
+        from src.api import main
+
+        http_client = MagicMock()
+        http_client.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        loader = MagicMock()
+        with (
+            patch.object(main, "workflow", MagicMock()),
+            patch.object(main, "schema_loader", loader),
+        ):
+            body = await main._check_health(http_client, "http://llm/api/tags")
+
+        data = json.loads(body)
+        assert data["status"] == "degraded"
+        assert data["llm_available"] is False
+        assert data["validator_available"] is True
+        loader.load_schema.assert_called_once_with(main.HEALTH_SCHEMA_VERSION)
+
+    async def test_check_health_reports_schema_failure(self):
+        """A schema that cannot be loaded marks the validator unavailable."""
+        from src.api import main
+
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value=MagicMock(is_success=True))
+        loader = MagicMock()
+        loader.load_schema.side_effect = ValueError("no schema")
+        with (
+            patch.object(main, "workflow", MagicMock()),
+            patch.object(main, "schema_loader", loader),
+        ):
+            data = json.loads(await main._check_health(http_client, "http://llm/api/tags"))
+
+        assert data["llm_available"] is True
+        assert data["validator_available"] is False
+
 
 class TestVersionEndpoint:
     """Tests for version endpoint."""
@@ -201,6 +251,28 @@ class TestCORSHeaders:
         # OPTIONS should be handled by CORS middleware
         assert response.status_code in [200, 204, 405]
 
+    def test_cors_preflight_is_cacheable(self, client):
+        """Preflights advertise only the methods in use and a day-long max age."""
+        response = client.options(
+            "/validate",
+            headers={
+                "Origin": "https://hedit.pages.dev",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type, x-api-key",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-methods"] == "GET, POST"
+        assert response.headers["access-control-max-age"] == "86400"
+
+    def test_cors_origin_matching(self, client):
+        """Only configured origins are echoed back."""
+        allowed = client.get("/health", headers={"Origin": "https://hedit.pages.dev"})
+        assert allowed.headers.get("access-control-allow-origin") == "https://hedit.pages.dev"
+
+        denied = client.get("/health", headers={"Origin": "https://evil.example.com"})
+        assert "access-control-allow-origin" not in denied.headers
+
 
 class TestSecurityHeaders:
     """Tests for security headers."""
@@ -213,6 +285,21 @@ class TestSecurityHeaders:
         # X-Content-Type-Options should be present
         assert "x-content-type-options" in headers
 
+    def test_all_security_headers_set_once(self, client):
+        """Every security header is present exactly once with its expected value."""
+        response = client.get("/health")
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
+        assert response.headers.get_list("x-xss-protection") == ["1; mode=block"]
+        assert response.headers["strict-transport-security"] == (
+            "max-age=31536000; includeSubDomains"
+        )
+
+    def test_security_headers_on_error_response(self, client):
+        """Error responses carry the security headers too."""
+        response = client.get("/does-not-exist")
+        assert response.status_code == 404
+        assert response.headers["x-content-type-options"] == "nosniff"
+
 
 class TestRequestValidation:
     """Tests for request validation."""
@@ -255,6 +342,7 @@ class TestRootEndpoint:
         endpoints = data["endpoints"]
         assert "POST /annotate" in endpoints
         assert "POST /validate" in endpoints
+        assert "POST /annotate-from-image/raw" in endpoints
         assert "GET /health" in endpoints
         assert "GET /version" in endpoints
 
@@ -594,6 +682,81 @@ class TestStreamingWithMockedWorkflow:
         if response.status_code == 200:
             assert response.headers.get("x-content-type-options") == "nosniff"
 
+    def test_stream_reports_refining_during_validation(self, client_with_workflow):
+        """Retry feedback summarized inside validate is reported as the refining stage."""
+        from src.api import main
+
+        async def retry_events(*args, **kwargs):
+            yield {"event": "on_chain_start", "name": "validate", "data": {}}
+            yield {"event": "on_chain_start", "name": "summarize_feedback", "data": {}}
+            yield {
+                "event": "on_chain_end",
+                "name": "summarize_feedback",
+                "data": {"output": {"validation_errors_augmented": ["summary"]}},
+            }
+            yield {
+                "event": "on_chain_end",
+                "name": "validate",
+                "data": {"output": {"is_valid": False, "validation_errors": ["bad tag"]}},
+            }
+            yield {"event": "on_chain_start", "name": "annotate", "data": {}}
+            yield {"event": "on_chain_start", "name": "validate", "data": {}}
+
+        main.workflow.graph.astream_events = retry_events
+        request_data = {
+            "description": "A red circle appears",
+            "schema_version": "8.3.0",
+        }
+        response = client_with_workflow.post(
+            "/annotate/stream", json=request_data, headers=TEST_AUTH_HEADERS
+        )
+
+        assert response.status_code == 200
+        stages = [
+            json.loads(frame.split("data: ", 1)[1])["stage"]
+            for frame in response.text.split("\n\n")
+            if frame.startswith("event: progress")
+        ]
+        assert stages[1:] == ["validating", "refining", "annotating", "validating"]
+
+    def test_stream_emits_draft_annotation_before_validation(self, client_with_workflow):
+        """Each generated annotation is streamed before its validation result."""
+        request_data = {
+            "description": "A red circle appears",
+            "schema_version": "8.3.0",
+        }
+        response = client_with_workflow.post(
+            "/annotate/stream", json=request_data, headers=TEST_AUTH_HEADERS
+        )
+        assert response.status_code == 200
+        assert "no-transform" in response.headers["cache-control"]
+        assert "content-encoding" not in response.headers  # frames are never gzip-batched
+        body = response.text
+        annotation_frame = 'event: annotation\ndata: {"annotation":"Sensory-event, Visual"}'
+        assert annotation_frame in body
+        assert body.index(annotation_frame) < body.index("event: validation")
+
+
+class TestSseEventEncoding:
+    """Tests for Server-Sent Event frame encoding."""
+
+    def test_frame_format(self):
+        """Frames carry the event name and a JSON payload, ending with a blank line."""
+        import json
+
+        from src.api.main import _sse_event
+
+        frame = _sse_event("validation", {"valid": False, "errors": ["[TAG_INVALID] 'Föo'"]})
+
+        assert isinstance(frame, bytes)
+        header, data_line, *rest = frame.decode().split("\n")
+        assert header == "event: validation"
+        assert json.loads(data_line.removeprefix("data: ")) == {
+            "valid": False,
+            "errors": ["[TAG_INVALID] 'Föo'"],
+        }
+        assert rest == ["", ""]
+
 
 class TestModelOverrideWithEnv:
     """Tests for model override with environment variables set."""
@@ -841,3 +1004,554 @@ class TestTelemetryCollectorIntegration:
 
         assert event.source == "api-image"
         assert event.model.provider == "deepinfra/fp8"
+
+
+class TestRequestWorkflowReuse:
+    """Tests for reusing BYOK/model-override workflows across requests."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from src.api import main
+
+        main._request_workflows.clear()
+        yield
+        main._request_workflows.clear()
+
+    def test_same_settings_share_workflow(self):
+        """Requests with the same key and settings reuse one workflow."""
+        from src.api import main
+
+        with patch.object(main, "create_openrouter_workflow", side_effect=lambda **_: MagicMock()):
+            first = main.get_openrouter_workflow("key-1", annotation_model="m", temperature=0.1)
+            second = main.get_openrouter_workflow("key-1", temperature=0.1, annotation_model="m")
+
+        assert first is second
+
+    def test_llm_concurrency_comes_from_settings(self):
+        """Workflows get the configured (server-wide) LLM concurrency limit."""
+        from src.api import main
+
+        with (
+            patch.object(main, "LLM_MAX_CONCURRENCY", 48),
+            patch.object(main, "create_openrouter_llm"),
+            patch.object(main, "HedAnnotationWorkflow") as workflow_class,
+        ):
+            main.create_openrouter_workflow(api_key="key-1", use_js_validator=False)
+
+        assert workflow_class.call_args.kwargs["max_llm_concurrency"] == 48
+
+    def test_different_settings_get_own_workflow(self):
+        """Different keys or settings build separate workflows."""
+        from src.api import main
+
+        with patch.object(main, "create_openrouter_workflow", side_effect=lambda **_: MagicMock()):
+            base = main.get_openrouter_workflow("key-1", annotation_model="m")
+            other_key = main.get_openrouter_workflow("key-2", annotation_model="m")
+            other_model = main.get_openrouter_workflow("key-1", annotation_model="n")
+
+        assert base is not other_key
+        assert base is not other_model
+
+    def test_cache_is_bounded(self):
+        """The least recently used workflow is dropped beyond the cache size."""
+        from src.api import main
+
+        with (
+            patch.object(main, "REQUEST_WORKFLOW_CACHE_SIZE", 2),
+            patch.object(main, "create_openrouter_workflow", side_effect=lambda **_: MagicMock()),
+        ):
+            first = main.get_openrouter_workflow("key-1")
+            main.get_openrouter_workflow("key-2")
+            main.get_openrouter_workflow("key-3")
+            assert main.get_openrouter_workflow("key-1") is not first
+
+
+class TestPythonValidatorReuse:
+    """Tests for sharing one /validate validator per schema version."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from src.api import main
+
+        main._python_validators.clear()
+        main._validation_results.clear()
+        yield
+        main._python_validators.clear()
+        main._validation_results.clear()
+
+    def test_validator_built_once_per_version(self):
+        """Repeated lookups for a version reuse the same validator."""
+        from src.api import main
+
+        loader = MagicMock()
+        with (
+            patch.object(main, "schema_loader", loader),
+            patch.object(main, "HedPythonValidator", side_effect=lambda _: MagicMock()),
+        ):
+            first = main.get_python_validator("8.3.0")
+            second = main.get_python_validator("8.3.0")
+            other = main.get_python_validator("8.4.0")
+
+        assert first is second
+        assert first is not other
+        assert loader.load_schema.call_count == 2
+
+    def test_validate_runs_off_event_loop(self, client):
+        """/validate performs validation in a worker thread from its own limiter."""
+        import threading
+
+        from src.api import main
+        from src.validation.hed_validator import ValidationResult
+
+        threads = []
+        borrowed = []
+
+        def fake_validate(hed_string):
+            threads.append(threading.current_thread())
+            borrowed.append(main._validation_limiter.borrowed_tokens)
+            return ValidationResult(is_valid=True, errors=[], warnings=[], parsed_string=hed_string)
+
+        validator = MagicMock()
+        validator.validate.side_effect = fake_validate
+        with (
+            patch.object(main, "schema_loader", MagicMock()),
+            patch.object(main, "get_python_validator", return_value=validator),
+        ):
+            response = client.post(
+                "/validate",
+                json={"hed_string": "Event", "schema_version": "8.3.0"},
+                headers=TEST_AUTH_HEADERS,
+            )
+
+        assert response.status_code == 200
+        assert response.json()["parsed_string"] == "Event"
+        assert threads and threads[0] is not threading.main_thread()
+        assert borrowed == [1]
+
+
+class TestBatchValidation:
+    """Tests for the /validate/batch endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from src.api import main
+
+        main._validation_results.clear()
+        yield
+        main._validation_results.clear()
+
+    @staticmethod
+    def _validator():
+        from src.validation.hed_validator import ValidationIssue, ValidationResult
+
+        def fake_validate(hed_string):
+            if hed_string == "Bad":
+                issue = ValidationIssue(code="TAG_INVALID", level="error", message="bad tag")
+                return ValidationResult(is_valid=False, errors=[issue], warnings=[])
+            return ValidationResult(is_valid=True, errors=[], warnings=[], parsed_string=hed_string)
+
+        validator = MagicMock()
+        validator.validate.side_effect = fake_validate
+        return validator
+
+    def test_results_follow_request_order(self, client):
+        """Each string gets its own result, in request order, from one validator lookup."""
+        from src.api import main
+
+        validator = self._validator()
+        with (
+            patch.object(main, "schema_loader", MagicMock()),
+            patch.object(main, "get_python_validator", return_value=validator) as lookup,
+        ):
+            response = client.post(
+                "/validate/batch",
+                json={"hed_strings": ["Event", "Bad", "Event"], "schema_version": "8.3.0"},
+                headers=TEST_AUTH_HEADERS,
+            )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["is_valid"] for r in results] == [True, False, True]
+        assert results[1]["errors"] == ["[TAG_INVALID] bad tag"]
+        assert validator.validate.call_count == 2  # duplicate validated once
+        lookup.assert_called_once_with("8.3.0")
+
+    def test_shares_cache_with_single_validate(self, client):
+        """Strings already validated through /validate are not validated again."""
+        from src.api import main
+
+        validator = self._validator()
+        with (
+            patch.object(main, "schema_loader", MagicMock()),
+            patch.object(main, "get_python_validator", return_value=validator),
+        ):
+            client.post(
+                "/validate",
+                json={"hed_string": "Event", "schema_version": "8.3.0"},
+                headers=TEST_AUTH_HEADERS,
+            )
+            response = client.post(
+                "/validate/batch",
+                json={"hed_strings": ["Event", "Bad"], "schema_version": "8.3.0"},
+                headers=TEST_AUTH_HEADERS,
+            )
+
+        assert response.status_code == 200
+        assert [c.args[0] for c in validator.validate.call_args_list] == ["Event", "Bad"]
+
+    def test_large_response_is_compressed(self, client):
+        """Large JSON bodies are gzipped for clients that accept it."""
+        from src.api import main
+
+        with (
+            patch.object(main, "schema_loader", MagicMock()),
+            patch.object(main, "get_python_validator", return_value=self._validator()),
+        ):
+            response = client.post(
+                "/validate/batch",
+                json={"hed_strings": [f"Event/{i}" for i in range(50)]},
+                headers={**TEST_AUTH_HEADERS, "Accept-Encoding": "gzip"},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert len(response.json()["results"]) == 50
+
+    def test_rejects_empty_batch(self, client):
+        """An empty list or empty string is a request validation error."""
+        for hed_strings in ([], ["Event", ""]):
+            response = client.post(
+                "/validate/batch",
+                json={"hed_strings": hed_strings},
+                headers=TEST_AUTH_HEADERS,
+            )
+            assert response.status_code == 422
+
+    def test_requires_auth(self, client):
+        """Batch validation needs an API key like /validate."""
+        response = client.post("/validate/batch", json={"hed_strings": ["Event"]})
+        assert response.status_code == 401
+
+
+class TestImageAnnotationWarmUp:
+    """Tests for preparing the workflow while the vision model runs."""
+
+    def test_workflow_warmed_up_for_requested_schema(self, client):
+        """The workflow's schema caches are loaded alongside image description."""
+        from src.agents.state import create_initial_state
+        from src.api import main
+
+        final_state = create_initial_state("A red square", "8.3.0")
+        final_state.update(current_annotation="Red, Square", is_valid=True)
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(return_value=final_state)
+        mock_vision = MagicMock()
+        mock_vision.describe_image = AsyncMock(
+            return_value={"description": "A red square", "metadata": {}}
+        )
+
+        with (
+            patch.object(main, "workflow", mock_workflow),
+            patch.object(main, "vision_agent", mock_vision),
+        ):
+            response = client.post(
+                "/annotate-from-image",
+                json={
+                    "image": "data:image/png;base64,iVBORw0KGgo=",
+                    "schema_version": "8.3.0",
+                    "telemetry_enabled": False,
+                },
+                headers=TEST_AUTH_HEADERS,
+            )
+
+        assert response.status_code == 200
+        assert response.json()["annotation"] == "Red, Square"
+        mock_workflow.warm_up.assert_called_once_with("8.3.0")
+
+
+class TestInflightRunCoalescing:
+    """Tests for sharing one workflow run between identical concurrent requests."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        from src.api import main
+
+        main._annotation_results.clear()
+        yield
+        main._annotation_results.clear()
+
+    def _request(self, description: str = "A red circle appears"):
+        from src.api.models import AnnotationRequest
+
+        return AnnotationRequest(description=description, schema_version="8.3.0")
+
+    async def test_identical_concurrent_requests_share_one_run(self):
+        """Concurrent identical requests await a single workflow run."""
+        import asyncio
+
+        from src.api import main
+
+        release = asyncio.Event()
+
+        async def slow_run(**kwargs):
+            await release.wait()
+            return {"current_annotation": kwargs["input_description"]}
+
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(side_effect=slow_run)
+
+        first = asyncio.create_task(main.run_workflow_coalesced(mock_workflow, self._request(), {}))
+        second = asyncio.create_task(
+            main.run_workflow_coalesced(mock_workflow, self._request(), {})
+        )
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first is await second
+        assert mock_workflow.run.await_count == 1
+        assert main._inflight_runs == {}
+
+    async def test_different_requests_run_separately(self):
+        """Different descriptions are not coalesced."""
+        import asyncio
+
+        from src.api import main
+
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(return_value={})
+
+        await asyncio.gather(
+            main.run_workflow_coalesced(mock_workflow, self._request("A"), {}),
+            main.run_workflow_coalesced(mock_workflow, self._request("B"), {}),
+        )
+
+        assert mock_workflow.run.await_count == 2
+
+
+class TestResultCaches:
+    """Tests for reusing completed /annotate and /validate results."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self, monkeypatch):
+        from src.api import main
+
+        # The completed-run cache is opt-in
+        monkeypatch.setattr(main, "ANNOTATION_CACHE_SIZE", 256)
+        main._annotation_results.clear()
+        main._validation_results.clear()
+        yield
+        main._annotation_results.clear()
+        main._validation_results.clear()
+
+    def _request(self, description: str = "A red circle appears"):
+        from src.api.models import AnnotationRequest
+
+        return AnnotationRequest(description=description, schema_version="8.3.0")
+
+    async def test_completed_run_is_reused(self):
+        """A repeat request within the TTL gets the cached final state."""
+        from src.api import main
+
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(return_value={"current_annotation": "Red"})
+
+        first = await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+        second = await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+
+        assert first is second
+        assert mock_workflow.run.await_count == 1
+
+    async def test_completed_runs_are_not_reused_when_disabled(self):
+        """With ANNOTATION_CACHE_SIZE=0 (the default) every request runs the workflow."""
+        from src.api import main
+
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(return_value={"current_annotation": "Red"})
+
+        with patch.object(main, "ANNOTATION_CACHE_SIZE", 0):
+            await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+            await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+
+        assert mock_workflow.run.await_count == 2
+        assert main._annotation_results == {}
+
+    async def test_expired_run_is_repeated(self):
+        """Entries older than the TTL are discarded."""
+        from src.api import main
+
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(return_value={})
+
+        with patch.object(main, "ANNOTATION_CACHE_TTL_S", 0):
+            await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+            await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+
+        assert mock_workflow.run.await_count == 2
+
+    async def test_failed_run_is_not_cached(self):
+        """Errors are not remembered, so the next request retries."""
+        from src.api import main
+
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(side_effect=[RuntimeError("boom"), {}])
+
+        with pytest.raises(RuntimeError):
+            await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+        await main.run_workflow_coalesced(mock_workflow, self._request(), {})
+
+        assert mock_workflow.run.await_count == 2
+
+    async def test_annotation_cache_is_bounded(self):
+        """The least recently used run is evicted beyond the cache size."""
+        from src.api import main
+
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(return_value={})
+
+        with patch.object(main, "ANNOTATION_CACHE_SIZE", 1):
+            await main.run_workflow_coalesced(mock_workflow, self._request("A"), {})
+            await main.run_workflow_coalesced(mock_workflow, self._request("B"), {})
+
+        assert len(main._annotation_results) == 1
+
+    async def test_cached_run_does_not_keep_request_workflow_alive(self):
+        """Request workflow runs are keyed on settings, not on the workflow object."""
+        import gc
+        import weakref
+
+        from src.api import main
+
+        def build(**kwargs):
+            request_workflow = MagicMock()
+            request_workflow.run = AsyncMock(return_value={"current_annotation": "Red"})
+            return request_workflow
+
+        main._request_workflows.clear()
+        with patch.object(main, "create_openrouter_workflow", side_effect=build):
+            first = main.get_openrouter_workflow("key-1", annotation_model="m")
+            result = await main.run_workflow_coalesced(first, self._request(), {})
+            first_ref = weakref.ref(first)
+            main._request_workflows.clear()
+            del first
+            gc.collect()
+
+            assert first_ref() is None
+            rebuilt = main.get_openrouter_workflow("key-1", annotation_model="m")
+            assert await main.run_workflow_coalesced(rebuilt, self._request(), {}) is result
+            rebuilt.run.assert_not_awaited()
+        main._request_workflows.clear()
+
+    def test_repeat_validation_is_served_from_cache(self, client):
+        """Identical /validate requests validate only once."""
+        from src.api import main
+        from src.validation.hed_validator import ValidationResult
+
+        validator = MagicMock()
+        validator.validate.return_value = ValidationResult(
+            is_valid=True, errors=[], warnings=[], parsed_string="Event"
+        )
+        body = {"hed_string": "Event", "schema_version": "8.3.0"}
+        with (
+            patch.object(main, "schema_loader", MagicMock()),
+            patch.object(main, "get_python_validator", return_value=validator),
+        ):
+            first = client.post("/validate", json=body, headers=TEST_AUTH_HEADERS)
+            second = client.post("/validate", json=body, headers=TEST_AUTH_HEADERS)
+
+        assert first.json() == second.json()
+        assert validator.validate.call_count == 1
+
+
+class TestRawImageUpload:
+    """Tests for the multipart /annotate-from-image/raw endpoint."""
+
+    PNG_BYTES = base64.b64decode(
+        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+    )
+
+    def _mocks(self):
+        from src.agents.state import create_initial_state
+
+        final_state = create_initial_state("A red pixel", "8.3.0")
+        final_state.update(current_annotation="Red", is_valid=True)
+        mock_workflow = MagicMock()
+        mock_workflow.run = AsyncMock(return_value=final_state)
+        mock_vision = MagicMock()
+        mock_vision.describe_image = AsyncMock(
+            return_value={"description": "A red pixel", "metadata": {}}
+        )
+        return mock_workflow, mock_vision
+
+    def test_uploaded_file_is_annotated(self, client):
+        """The file is passed to the vision agent as a data URI with its MIME type."""
+        from src.api import main
+
+        mock_workflow, mock_vision = self._mocks()
+        with (
+            patch.object(main, "workflow", mock_workflow),
+            patch.object(main, "vision_agent", mock_vision),
+        ):
+            response = client.post(
+                "/annotate-from-image/raw",
+                files={"image": ("pixel.png", self.PNG_BYTES, "image/png")},
+                data={"schema_version": "8.3.0", "telemetry_enabled": "false"},
+                headers=TEST_AUTH_HEADERS,
+            )
+
+        assert response.status_code == 200
+        assert response.json()["annotation"] == "Red"
+        image_data = mock_vision.describe_image.await_args.kwargs["image_data"]
+        assert image_data.startswith("data:image/png;base64,iVBORw0KGgo")
+        assert mock_workflow.run.await_args.kwargs["schema_version"] == "8.3.0"
+
+    def test_oversized_upload_is_rejected(self, client):
+        """Files above the image size limit get 413 before any decoding."""
+        from src.api import main
+
+        with patch.object(main, "MAX_IMAGE_SIZE_BYTES", 10):
+            response = client.post(
+                "/annotate-from-image/raw",
+                files={"image": ("pixel.png", self.PNG_BYTES, "image/png")},
+                headers=TEST_AUTH_HEADERS,
+            )
+
+        assert response.status_code == 413
+
+    def test_upload_read_is_bounded(self, client):
+        """Only one byte past the size limit is read from an oversized upload."""
+        from starlette.datastructures import UploadFile
+
+        from src.api import main
+
+        original_read = UploadFile.read
+        read_sizes = []
+
+        async def recording_read(self, size=-1):
+            data = await original_read(self, size)
+            read_sizes.append((size, len(data)))
+            return data
+
+        with (
+            patch.object(main, "MAX_IMAGE_SIZE_BYTES", 10),
+            patch.object(UploadFile, "read", recording_read),
+        ):
+            response = client.post(
+                "/annotate-from-image/raw",
+                files={"image": ("pixel.png", self.PNG_BYTES, "image/png")},
+                headers=TEST_AUTH_HEADERS,
+            )
+
+        assert response.status_code == 413
+        assert read_sizes == [(11, 11)]
+
+    def test_invalid_form_field_is_rejected(self, client):
+        """Form fields are validated like the JSON request body."""
+        response = client.post(
+            "/annotate-from-image/raw",
+            files={"image": ("pixel.png", self.PNG_BYTES, "image/png")},
+            data={"max_validation_attempts": "50"},
+            headers=TEST_AUTH_HEADERS,
+        )
+
+        assert response.status_code == 422
@@ -64,6 +64,20 @@ class TestComprehensiveGuide:
         # Check confidence indicators
         assert "high" in guide.lower() or "0.95" in guide
 
+    def test_semantic_hints_follow_shared_prefix(self):
+        """Hints are appended, so the guide without hints is a prefix of the hinted one."""
+        vocabulary = ["Event", "Reward"]
+        extendable_tags = ["Label"]
+        semantic_hints = [{"tag": "Reward", "prefix": "", "score": 0.95, "source": "keyword"}]
+
+        base = get_comprehensive_hed_guide(vocabulary, extendable_tags)
+        hinted = get_comprehensive_hed_guide(
+            vocabulary, extendable_tags, semantic_hints=semantic_hints
+        )
+
+        assert hinted.startswith(base)
+        assert "POTENTIALLY RELEVANT TAGS" in hinted[len(base) :]
+
     def test_guide_with_semantic_hints_and_no_extend(self):
         """Test guide with both semantic hints and no_extend."""
         vocabulary = ["Event", "Visual-presentation"]
@@ -0,0 +1,59 @@
+"""Tests for evaluation agent caching and decision parsing.
+
+These tests use a fake chat model, so no API calls are made.
+"""
+
+from langchain_core.language_models import FakeListChatModel
+
+from src.agents.evaluation_agent import EvaluationAgent
+from src.agents.state import create_initial_state
+
+
+def _state(annotation: str) -> dict:
+    state = create_initial_state("A red circle appears")
+    state["current_annotation"] = annotation
+    return state
+
+
+class TestEvaluationCache:
+    """Tests for reusing evaluations of unchanged annotations."""
+
+    async def test_same_annotation_is_evaluated_once(self):
+        """A repeated annotation reuses the earlier verdict without an LLM call."""
+        llm = FakeListChatModel(responses=["DECISION: ACCEPT", "DECISION: REFINE"])
+        agent = EvaluationAgent(llm)
+
+        first = await agent.evaluate(_state("Sensory-event, Red"))
+        second = await agent.evaluate(_state("Sensory-event, Red"))
+
+        assert first["is_faithful"] is True
+        assert second["is_faithful"] is True
+        assert second["evaluation_feedback"] == "DECISION: ACCEPT"
+        assert len(first["messages"]) == 3
+        assert second["messages"] == []
+
+    async def test_changed_annotation_is_evaluated_again(self):
+        """A different annotation gets a fresh evaluation."""
+        llm = FakeListChatModel(responses=["DECISION: ACCEPT", "DECISION: REFINE"])
+        agent = EvaluationAgent(llm)
+
+        await agent.evaluate(_state("Sensory-event, Red"))
+        second = await agent.evaluate(_state("Sensory-event, Red, Circle"))
+
+        assert second["is_faithful"] is False
+        assert len(second["messages"]) == 3
+
+
+class TestParseDecision:
+    """Tests for _parse_decision."""
+
+    def test_explicit_decision(self):
+        """An explicit DECISION line decides the outcome."""
+        agent = object.__new__(EvaluationAgent)
+        assert agent._parse_decision("Some notes\nDECISION: ACCEPT") is True
+        assert agent._parse_decision("Some notes\nDECISION: REFINE") is False
+
+    def test_partial_faithfulness_is_accepted(self):
+        """FAITHFUL: partial counts as good enough."""
+        agent = object.__new__(EvaluationAgent)
+        assert agent._parse_decision("FAITHFUL: partial") is True
@@ -4,6 +4,7 @@ These tests verify the hed-lsp CLI wrapper functionality without
 requiring the full HED tools stack (hedtools) to be installed.
 """
 
+import json
 import subprocess
 from unittest.mock import MagicMock, patch
 
@@ -17,7 +18,9 @@ from src.validation.hed_lsp import (
     get_default_schema_version,
     get_default_use_semantic,
     get_hed_suggestions,
+    get_shared_hed_lsp_client,
     is_hed_lsp_available,
+    split_description,
     suggest_tags_for_keywords,
 )
 
@@ -36,6 +39,31 @@ class TestIsHedLspAvailable:
             assert is_hed_lsp_available() is True
 
 
+class TestSharedHedLspClient:
+    """Tests for the process-wide HED-LSP client."""
+
+    def setup_method(self):
+        get_shared_hed_lsp_client.cache_clear()
+
+    def teardown_method(self):
+        get_shared_hed_lsp_client.cache_clear()
+
+    def test_availability_is_checked_once(self):
+        """The PATH lookup should happen once and the client should be shared."""
+        with patch("shutil.which", return_value="/usr/local/bin/hed-suggest") as which:
+            first = get_shared_hed_lsp_client()
+            second = get_shared_hed_lsp_client()
+
+        assert isinstance(first, HedLspClient)
+        assert first is second
+        assert which.call_count == 1
+
+    def test_returns_none_when_not_installed(self):
+        """Without hed-suggest, no client should be created."""
+        with patch("shutil.which", return_value=None):
+            assert get_shared_hed_lsp_client() is None
+
+
 class TestEnvironmentDefaults:
     """Tests for environment variable defaults."""
 
@@ -232,10 +260,51 @@ class TestHedLspClient:
             assert result.success is False
             assert "invalid schema" in result.error
 
+    def test_suggest_reuses_cached_output(self):
+        """Should not rerun the CLI for a repeated query."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = '{"button press": ["Button"]}'
+        mock_result.stderr = ""
+
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            client = HedLspClient()
+            first = client.suggest("button press")
+            second = client.suggest("button press")
+
+            assert mock_run.call_count == 1
+            assert [s.tag for s in second.suggestions] == [s.tag for s in first.suggestions]
+
+    def test_suggest_does_not_cache_failures(self):
+        """Should retry the CLI after a failed call."""
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stdout = ""
+        mock_result.stderr = "Error: invalid schema"
+
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            client = HedLspClient()
+            client.suggest("test")
+            client.suggest("test")
+
+            assert mock_run.call_count == 2
+
 
 class TestGetHedSuggestions:
     """Tests for get_hed_suggestions convenience function."""
 
+    def setup_method(self):
+        get_shared_hed_lsp_client.cache_clear()
+
+    def teardown_method(self):
+        get_shared_hed_lsp_client.cache_clear()
+
     def test_returns_tag_strings(self):
         """Should return list of tag strings."""
         mock_output = '["Event/Sensory-event", "Event/Agent-action"]'
@@ -256,10 +325,68 @@ class TestGetHedSuggestions:
             with pytest.raises(RuntimeError, match="hed-suggest CLI not found"):
                 get_hed_suggestions("test")
 
+    def test_repeat_calls_reuse_shared_client_cache(self):
+        """Default-settings calls share one client, so repeats skip the CLI."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = '["Event/Sensory-event"]'
+
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            get_hed_suggestions("button press")
+            get_hed_suggestions("button press")
+            suggest_tags_for_keywords(["button press"])
+
+        assert mock_run.call_count == 1
+
+    def test_other_settings_use_dedicated_client(self):
+        """A non-default schema version gets its own client and command line."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = '["Event"]'
+
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            get_hed_suggestions("button press")
+            get_hed_suggestions("button press", schema_version="8.2.0")
+
+        assert mock_run.call_count == 2
+        assert "8.2.0" in mock_run.call_args[0][0]
+
+    def test_result_limit_shares_client_cache(self):
+        """Another result limit reuses the shared client, keyed by the limit."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = '["Event"]'
+
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            suggest_tags_for_keywords(["button press"], max_results=5)
+            suggest_tags_for_keywords(["button press"], max_results=5)
+            get_hed_suggestions("button press")
+
+        # One call per distinct limit; the repeat is served from the cache
+        assert mock_run.call_count == 2
+        first_cmd = mock_run.call_args_list[0][0][0]
+        assert first_cmd[first_cmd.index("--top") + 1] == "5"
+        assert len(get_shared_hed_lsp_client()._output_cache) == 2
+
 
 class TestSuggestTagsForKeywords:
     """Tests for suggest_tags_for_keywords function."""
 
+    def setup_method(self):
+        get_shared_hed_lsp_client.cache_clear()
+
+    def teardown_method(self):
+        get_shared_hed_lsp_client.cache_clear()
+
     def test_returns_empty_for_empty_keywords(self):
         """Should return empty dict for empty keywords list."""
         with patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True):
@@ -281,6 +408,22 @@ class TestSuggestTagsForKeywords:
             assert "button" in result
             assert "press" in result
 
+    def test_batches_keywords_into_one_call(self):
+        """Should use a single CLI call when output is keyed by keyword."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = '{"button": ["Button"], "press": ["Press", "Push"]}'
+
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            result = suggest_tags_for_keywords(["button", "press"])
+
+            assert result == {"button": ["Button"], "press": ["Press", "Push"]}
+            assert mock_run.call_count == 1
+            assert mock_run.call_args[0][0][-2:] == ["button", "press"]
+
 
 class TestSuggestForDescription:
     """Tests for suggest_for_description method."""
@@ -335,6 +478,77 @@ class TestSuggestForDescription:
             client.suggest_for_description("button press", mode="semantic")
             assert client.use_semantic is False  # unchanged
 
+    def test_sentences_are_batched_into_one_call(self):
+        """Multi-sentence descriptions should be queried per sentence in one CLI call."""
+        stdout = '{"A red circle.": ["Red", "Circle"], "A tone plays.": ["Tone", "Red"]}'
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=self._make_mock_run(stdout)) as mock_run,
+        ):
+            client = HedLspClient()
+            result = client.suggest_for_description("A red circle. A tone plays.")
+
+        assert mock_run.call_count == 1
+        assert "A red circle." in mock_run.call_args[0][0]
+        assert result.success
+        assert [s.tag for s in result.suggestions] == ["Red", "Tone", "Circle"]
+
+    def test_sentence_scores_are_kept(self):
+        """Each tag keeps its best hed-lsp score across sentences."""
+        stdout = json.dumps(
+            {
+                "A red circle.": [
+                    {"tag": "Red", "score": 0.6},
+                    {"tag": "Circle", "score": 0.8},
+                ],
+                "It turns red.": [{"tag": "Red", "score": 0.9}, {"tag": "Change", "score": 0.3}],
+            }
+        )
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=self._make_mock_run(stdout)),
+        ):
+            client = HedLspClient()
+            result = client.suggest_for_description("A red circle. It turns red.")
+
+        assert [(s.tag, s.score) for s in result.suggestions] == [
+            ("Red", 0.9),
+            ("Circle", 0.8),
+            ("Change", 0.3),
+        ]
+
+    def test_falls_back_to_whole_description(self):
+        """Output not keyed by sentence should fall back to a single query."""
+        with (
+            patch("src.validation.hed_lsp.is_hed_lsp_available", return_value=True),
+            patch("subprocess.run", return_value=self._make_mock_run()) as mock_run,
+        ):
+            client = HedLspClient()
+            result = client.suggest_for_description("A red circle. A tone plays.")
+
+        assert mock_run.call_count == 2
+        assert [s.tag for s in result.suggestions] == ["Event"]
+
+
+class TestSplitDescription:
+    """Tests for splitting descriptions into sentence queries."""
+
+    def test_splits_on_sentence_boundaries(self):
+        """Sentences ending in ., ! or ? should become separate chunks."""
+        assert split_description("A red circle. Press now!  Then what?") == [
+            "A red circle.",
+            "Press now!",
+            "Then what?",
+        ]
+
+    def test_single_sentence_is_one_chunk(self):
+        """A description without sentence breaks should stay whole."""
+        assert split_description("red circle on screen") == ["red circle on screen"]
+
+    def test_extra_sentences_join_last_chunk(self):
+        """Sentences beyond max_chunks should be merged into the last chunk."""
+        assert split_description("One. Two. Three.", max_chunks=2) == ["One.", "Two. Three."]
+
 
 class TestSuggestEmptyTagFiltering:
     """Tests for empty-tag filtering in suggest()."""
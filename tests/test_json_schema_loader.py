@@ -191,6 +191,10 @@ class TestLoadLatestSchema:
         loader = load_latest_schema(str(schema_dir))
         assert isinstance(loader, HedJsonSchemaLoader)
 
+    def test_load_latest_schema_is_shared(self, schema_dir):
+        """Test that the parsed schema is reused for the same directory."""
+        assert load_latest_schema(schema_dir) is load_latest_schema(str(schema_dir))
+
     def test_load_latest_schema_none_raises(self):
         """Test that None schema_dir raises ValueError."""
         with pytest.raises(ValueError, match="schema_dir is required"):
@@ -148,6 +148,32 @@ class TestCreateOpenRouterLLM:
 
         assert isinstance(llm, CachingLLMWrapper)
 
+    def test_response_cache_is_attached_to_base_llm(self):
+        """Test that a response cache is set on the underlying LiteLLM model."""
+        from langchain_core.caches import InMemoryCache
+
+        from src.utils.openrouter_llm import CachingLLMWrapper, create_openrouter_llm
+
+        cache = InMemoryCache()
+        plain = create_openrouter_llm(
+            model="openai/gpt-oss-120b", api_key="test-key", response_cache=cache
+        )
+        wrapped = create_openrouter_llm(
+            model="anthropic/claude-haiku-4.5", api_key="test-key", response_cache=cache
+        )
+
+        assert plain.cache is cache
+        assert isinstance(wrapped, CachingLLMWrapper)
+        assert wrapped.llm.cache is cache
+
+    def test_no_response_cache_by_default(self):
+        """Test that responses are not cached unless a cache is provided."""
+        from src.utils.openrouter_llm import create_openrouter_llm
+
+        llm = create_openrouter_llm(model="openai/gpt-oss-120b", api_key="test-key")
+
+        assert llm.cache is None
+
 
 class TestCachingLLMWrapper:
     """Tests for CachingLLMWrapper."""
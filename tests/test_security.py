@@ -256,6 +256,40 @@ class TestAuditLogger:
         request = create_test_request()
         logger.log_error(request, error=ValueError("test error"), api_key_hash="abc")
 
+    def test_records_are_written_by_background_listener(self, monkeypatch, tmp_path):
+        """Queued audit records reach the log file once the listener drains them."""
+        log_file = tmp_path / "audit.log"
+        monkeypatch.setenv("ENABLE_AUDIT_LOG", "true")
+        monkeypatch.setenv("AUDIT_LOG_FILE", str(log_file))
+
+        logger = AuditLogger()
+        logger.log_response(create_test_request(), status_code=201, processing_time_ms=1.0)
+        logger.close()
+
+        assert "status=201" in log_file.read_text()
+        logger.logger.removeHandler(logger.queue_handler)
+
+    def test_full_queue_drops_records(self, monkeypatch):
+        """Records are counted and dropped rather than blocking when the queue is full."""
+        import queue
+
+        from src.api import security
+
+        monkeypatch.setattr(security, "AUDIT_QUEUE_SIZE", 1)
+        monkeypatch.setenv("ENABLE_AUDIT_LOG", "true")
+        monkeypatch.setenv("AUDIT_LOG_FILE", "/nonexistent/path/audit.log")
+
+        logger = AuditLogger()
+        logger.close()
+        logger.queue_handler.queue = queue.Queue(maxsize=1)
+
+        request = create_test_request()
+        logger.log_request(request)
+        logger.log_request(request)
+
+        assert logger.dropped_records == 1
+        logger.logger.removeHandler(logger.queue_handler)
+
 
 class TestGenerateAPIKey:
     """Tests for API key generation."""
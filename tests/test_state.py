@@ -61,3 +61,17 @@ def test_create_initial_state_semantic_hints():
     assert state["semantic_hints"] == semantic_hints
     assert len(state["semantic_hints"]) == 1
     assert state["semantic_hints"][0]["tag"] == "Visual-presentation"
+
+
+def test_create_initial_state_fresh_containers():
+    """Test that states with the same configuration do not share mutable fields."""
+    first = create_initial_state("First event")
+    second = create_initial_state("Second event")
+
+    first["validation_errors"].append("error")
+    first["tag_suggestions"]["Foo"] = ["Bar"]
+
+    assert second["validation_errors"] == []
+    assert second["tag_suggestions"] == {}
+    assert first["messages"] is not second["messages"]
+    assert second["input_description"] == "Second event"
@@ -1,5 +1,8 @@
 """Tests for HED validation."""
 
+import logging
+import shutil
+import time
 from pathlib import Path
 
 import pytest
@@ -180,6 +183,110 @@ class TestHedJavaScriptValidator:
         assert result.is_valid is False or len(result.errors) > 0 or len(result.warnings) > 0
 
 
+# Stand-in for hed-javascript that counts schema builds
+_FAKE_HED_JS = """
+let builds = 0;
+exports.buildSchemasFromVersion = async (version) => { builds += 1; return { version }; };
+exports.parseHedString = (hedString, schemas) => {
+    if (hedString === 'Noisy') {
+        process.stdout.write('{"isValid": false, "errors": [], "warnings": []}\\n');
+        console.log('loading schema');
+    }
+    const warnings = hedString === 'Bad'
+        ? [{ hedCode: 'TAG_INVALID', message: 'bad tag', parameters: { tag: 'Bad' } }]
+        : [];
+    return [`${hedString}@${schemas.version}#${builds}`, [], warnings];
+};
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not installed")
+class TestHedJavaScriptValidatorWorker:
+    """Tests for the persistent Node.js validation worker."""
+
+    @pytest.fixture
+    def validator(self, tmp_path):
+        """JavaScript validator backed by a fake hed-javascript package."""
+        entry_point = tmp_path / "dist" / "commonjs" / "index.js"
+        entry_point.parent.mkdir(parents=True)
+        entry_point.write_text(_FAKE_HED_JS)
+        validator = HedJavaScriptValidator(validator_path=tmp_path, schema_version="8.4.0")
+        yield validator
+        validator.close()
+
+    def test_worker_and_schemas_are_reused(self, validator):
+        """Consecutive validations should share one process and one schema build."""
+        first = validator.validate("Event")
+        pid = validator._process.pid
+        second = validator.validate("Red")
+
+        assert first.parsed_string == "Event@8.4.0#1"
+        assert second.parsed_string == "Red@8.4.0#1"
+        assert validator._process.pid == pid
+
+    def test_critical_warnings_become_errors(self, validator):
+        """TAG_INVALID warnings should be reported as errors."""
+        result = validator.validate("Bad")
+
+        assert result.is_valid is False
+        assert [e.code for e in result.errors] == ["TAG_INVALID"]
+        assert result.errors[0].tag == "Bad"
+
+    def test_stray_output_is_not_taken_as_a_result(self, validator, caplog):
+        """JSON lines without the request id are skipped, and later results stay matched."""
+        with caplog.at_level(logging.WARNING, logger="src.validation.hed_validator"):
+            noisy = validator.validate("Noisy")
+            after = validator.validate("Event")
+
+        assert noisy.is_valid is True
+        assert noisy.parsed_string == "Noisy@8.4.0#1"
+        assert after.parsed_string == "Event@8.4.0#1"
+        assert "Ignoring unexpected JavaScript validator output" in caplog.text
+
+    def test_worker_stderr_is_logged(self, validator, caplog):
+        """Library console output goes to stderr and is logged instead of discarded."""
+        with caplog.at_level(logging.WARNING, logger="src.validation.hed_validator"):
+            validator.validate("Noisy")
+            deadline = time.monotonic() + 5
+            while "loading schema" not in caplog.text and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert "JavaScript validator: loading schema" in caplog.text
+
+    def test_worker_restarts_after_exit(self, validator):
+        """A worker that exited should be replaced on the next validation."""
+        validator.validate("Event")
+        validator._process.kill()
+        validator._process.wait()
+
+        result = validator.validate("Event")
+
+        assert result.is_valid is True
+        assert result.parsed_string == "Event@8.4.0#1"
+
+    def test_agent_warm_up_starts_worker_and_loads_schema(self, validator):
+        """Warm-up leaves a running worker that has already built its schema."""
+        agent = ValidationAgent(
+            HedSchemaLoader(),
+            use_javascript=True,
+            validator_path=validator.validator_path,
+            use_hed_lsp=False,
+        )
+        try:
+            agent.warm_up("8.4.0")
+            js_validator = agent._validators["8.4.0"]
+            warm_pid = js_validator._process.pid
+
+            result = js_validator.validate("Event")
+            pid = js_validator._process.pid
+        finally:
+            agent.close()
+
+        # Same worker, and its schema was built by the warm-up request
+        assert pid == warm_pid
+        assert result.parsed_string == "Event@8.4.0#1"
+
+
 def test_validate_valid_string(validator):
     """Test validation of a valid HED string."""
     result = validator.validate("Sensory-event, Visual-presentation")
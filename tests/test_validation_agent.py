@@ -1,10 +1,23 @@
 """Tests for validation agent functionality."""
 
-import pytest
+from unittest.mock import MagicMock
 
-from src.agents.validation_agent import ValidationAgent, strip_extensions
+import pytest
+from hed.schema import load_schema_version
+
+from src.agents.validation_agent import (
+    ValidationAgent,
+    close_shared_validation_agents,
+    get_shared_validation_agent,
+    strip_extensions,
+)
 from src.utils.schema_loader import HedSchemaLoader
-from src.validation.hed_validator import HedPythonValidator, ValidationIssue, ValidationResult
+from src.validation.hed_validator import (
+    HedJavaScriptValidator,
+    HedPythonValidator,
+    ValidationIssue,
+    ValidationResult,
+)
 
 
 class TestStripExtensions:
@@ -92,6 +105,34 @@ class TestStripExtensions:
         # Only the matching case should be stripped
         assert result == "(Animal, animal/marmoset)"
 
+    def test_only_whole_tags_are_stripped(self):
+        """A tag that merely starts with an extended tag is left alone."""
+        annotation = "Animal/Marmoset-like, (Animal/Marmoset)"
+        extended_tags = ["Animal/Marmoset"]
+
+        result = strip_extensions(annotation, extended_tags)
+
+        assert result == "Animal/Marmoset-like, (Animal)"
+
+    def test_preserves_irregular_whitespace(self):
+        """Whitespace around stripped tags is kept as written."""
+        annotation = "(  Animal/Marmoset ,Building/Maze)"
+        extended_tags = ["Animal/Marmoset", "Building/Maze"]
+
+        result = strip_extensions(annotation, extended_tags)
+
+        assert result == "(  Animal ,Building)"
+
+    def test_overlapping_extended_tags(self):
+        """A tag that extends another extended tag is stripped as a whole."""
+        annotation = "(Animal/Marmoset, Animal/Marmoset/Adult)"
+        extended_tags = ["Animal/Marmoset", "Animal/Marmoset/Adult"]
+
+        result = strip_extensions(annotation, extended_tags)
+
+        assert result == "(Animal, Animal)"
+        assert "Adult" not in result
+
 
 class TestValidationAgentExtraction:
     """Tests for extracting extended tags from validation results."""
@@ -224,6 +265,73 @@ class TestValidationAgentNoExtend:
         assert "Animal" in stripped
         assert "Building" in stripped
 
+    def test_reuse_result_after_strip(self, validation_agent):
+        """An error-free result is reused unless stripping creates duplicates."""
+        clean = ValidationResult(is_valid=True, errors=[], warnings=[])
+        failed = ValidationResult(
+            is_valid=False,
+            errors=[ValidationIssue(code="TAG_INVALID", level="error", message="bad")],
+            warnings=[],
+        )
+
+        schema = load_schema_version("8.4.0")
+
+        assert validation_agent._can_reuse_result_after_strip(
+            clean, "(Animal-agent, Animal/Marmoset)", ["Animal/Marmoset"], schema
+        )
+        assert not validation_agent._can_reuse_result_after_strip(
+            failed, "(Animal-agent, Animal/Marmoset)", ["Animal/Marmoset"], schema
+        )
+        assert not validation_agent._can_reuse_result_after_strip(
+            clean, "Animal, Animal/Marmoset", ["Animal/Marmoset"], schema
+        )
+
+    def test_value_tags_are_revalidated(self, validation_agent):
+        """Stripping a value leaves a tag that needs one, so the result is not reused."""
+        clean = ValidationResult(is_valid=True, errors=[], warnings=[])
+        schema = load_schema_version("8.4.0")
+
+        assert not validation_agent._can_reuse_result_after_strip(
+            clean, "Label/Foo, Sensory-event", ["Label/Foo"], schema
+        )
+        assert not validation_agent._can_reuse_result_after_strip(
+            clean, "Duration/2 s, Sensory-event", ["Duration/2 s"], schema
+        )
+
+    def test_multi_level_tags_are_revalidated(self, validation_agent):
+        """Base tags are compared by schema node, not by first path segment."""
+        clean = ValidationResult(is_valid=True, errors=[], warnings=[])
+        schema = load_schema_version("8.4.0")
+
+        # Stripping keeps "Item", which is not the node "Foo" extends
+        assert not validation_agent._can_reuse_result_after_strip(
+            clean, "Item/Object/Foo, Sensory-event", ["Item/Object/Foo"], schema
+        )
+        # A long-form tag is the same node as its short form
+        assert not validation_agent._can_reuse_result_after_strip(
+            clean,
+            "Item/Biological-item/Organism/Animal, Animal/Marmoset",
+            ["Animal/Marmoset"],
+            schema,
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_extend_value_tag_is_revalidated(self, validation_agent):
+        """A value tag stripped of its value is validated again and reported."""
+        state = {
+            "current_annotation": "Duration/2 s, Sensory-event",
+            "schema_version": "8.4.0",
+            "validation_attempts": 0,
+            "max_validation_attempts": 3,
+            "no_extend": True,
+        }
+
+        result = await validation_agent.validate(state)
+
+        assert result["current_annotation"] == "Duration, Sensory-event"
+        issues = result["validation_errors"] + result["validation_warnings"]
+        assert any("TAG_REQUIRES_CHILD" in issue for issue in issues)
+
     @pytest.mark.asyncio
     async def test_no_extend_with_no_extensions(self, validation_agent):
         """No change when annotation has no extensions."""
@@ -259,6 +367,96 @@ class TestValidationAgentNoExtend:
         assert not any("TAG_EXTENDED" in w for w in result["validation_warnings"])
 
 
+class TestValidationAgentResultCache:
+    """Tests for reusing validation outcomes of unchanged annotations."""
+
+    @pytest.fixture
+    def validation_agent(self):
+        loader = HedSchemaLoader()
+        return ValidationAgent(loader, use_javascript=False, use_hed_lsp=False)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_annotation_reuses_outcome(self, validation_agent):
+        """Repeating an annotation reuses its outcome but still counts attempts."""
+        state = {
+            "current_annotation": "Sensory-event, Red, Circle",
+            "schema_version": "8.4.0",
+            "validation_attempts": 0,
+            "max_validation_attempts": 3,
+        }
+
+        first = await validation_agent.validate(state)
+        second = await validation_agent.validate({**state, "validation_attempts": 1})
+
+        assert len(validation_agent._result_cache) == 1
+        assert second["validation_warnings"] == first["validation_warnings"]
+        assert second["validation_warnings"] is not first["validation_warnings"]
+        assert second["is_valid"] == first["is_valid"]
+        assert second["validation_attempts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_validator_failures_are_not_cached(self, validation_agent, monkeypatch):
+        """A validator failure is retried instead of being returned again."""
+        results = iter(
+            [
+                ValidationResult(
+                    is_valid=False,
+                    errors=[ValidationIssue(code="TIMEOUT", level="error", message="timed out")],
+                    warnings=[],
+                ),
+                ValidationResult(is_valid=True, errors=[], warnings=[]),
+            ]
+        )
+        monkeypatch.setattr(
+            ValidationAgent, "_run_validation", lambda self, annotation, version: next(results)
+        )
+        state = {
+            "current_annotation": "Sensory-event, Red, Circle",
+            "schema_version": "8.4.0",
+            "validation_attempts": 0,
+            "max_validation_attempts": 3,
+        }
+
+        first = await validation_agent.validate(state)
+        second = await validation_agent.validate({**state, "validation_attempts": 1})
+
+        assert first["is_valid"] is False
+        assert second["is_valid"] is True
+        assert len(validation_agent._result_cache) == 1
+
+
+class TestSharedValidationAgent:
+    """Tests for the process-wide validation agent."""
+
+    def test_same_configuration_shares_agent(self):
+        """Workflows with the same validator configuration share one agent."""
+        first = get_shared_validation_agent(use_javascript=False)
+        second = get_shared_validation_agent(use_javascript=False)
+
+        assert first is second
+        assert isinstance(first, ValidationAgent)
+        assert first.use_javascript is False
+
+    def test_invalid_configuration_does_not_replace_agent(self):
+        """A failing configuration raises without affecting the shared agent."""
+        python_agent = get_shared_validation_agent(use_javascript=False)
+
+        with pytest.raises(ValueError, match="validator_path required"):
+            get_shared_validation_agent(use_javascript=True)
+
+        assert get_shared_validation_agent(use_javascript=False) is python_agent
+
+    def test_close_stops_javascript_workers(self, monkeypatch):
+        """Closing the shared agents stops their JavaScript validator workers."""
+        agent = get_shared_validation_agent(use_javascript=False)
+        js_validator = MagicMock(spec=HedJavaScriptValidator)
+        monkeypatch.setitem(agent._validators, "8.4.0", js_validator)
+
+        close_shared_validation_agents()
+
+        js_validator.close.assert_called_once_with()
+
+
 class TestValidationAgentTagSuggestions:
     """Tests for tag_suggestions field in validate() return dict."""
 
@@ -346,6 +544,24 @@ class TestDetectExtensionsViaRegex:
         )
         assert len(extended) == 0
 
+    def test_repeated_detection_uses_cached_lookup(self, validation_agent, hed_schema):
+        """Repeated base tags are resolved once and give the same result."""
+        first = validation_agent._detect_extensions_via_regex(
+            "Animal/Marmoset, Animal/Dolphin", hed_schema
+        )
+        second = validation_agent._detect_extensions_via_regex("Animal/Marmoset", hed_schema)
+
+        assert first == ["Animal/Marmoset", "Animal/Dolphin"]
+        assert second == ["Animal/Marmoset"]
+        assert validation_agent._extension_allowed_cache == {(id(hed_schema), "Animal"): True}
+
+    def test_stops_at_max_extensions(self, validation_agent, hed_schema):
+        """Scanning stops once max_extensions extended tags have been found."""
+        extended = validation_agent._detect_extensions_via_regex(
+            "Animal/Marmoset, Animal/Dolphin, Building/Maze", hed_schema, max_extensions=2
+        )
+        assert extended == ["Animal/Marmoset", "Animal/Dolphin"]
+
 
 class TestExtractProblematicTagsHashPlaceholder:
     """Tests for _extract_problematic_tags handling # placeholder in tag names."""
@@ -394,37 +610,149 @@ class TestExtractProblematicTagsHashPlaceholder:
         tags = validation_agent._extract_problematic_tags(result.errors, result.warnings)
         assert len(tags) == 0
 
+    def test_deduplicates_tags_preserving_order(self, validation_agent):
+        """Repeated tags across errors and warnings are reported once, in order."""
+        from src.validation.hed_validator import ValidationIssue
+
+        errors = [
+            ValidationIssue(code="TAG_INVALID", level="error", message="", tag="Item/Foo"),
+            ValidationIssue(code="TAG_INVALID", level="error", message="", tag="Bar"),
+            ValidationIssue(code="SIDECAR_INVALID", level="error", message="", tag="Baz"),
+        ]
+        warnings = [
+            ValidationIssue(code="TAG_EXTENSION_INVALID", level="warning", message="", tag="Foo"),
+        ]
+        tags = validation_agent._extract_problematic_tags(errors, warnings)
+        assert tags == ["Foo", "Bar"]
 
-class TestGetOrCreateValidatorSchemaVersionWarning:
-    """Tests for schema version mismatch warning in _get_or_create_validator."""
+
+class TestGetOrCreateValidatorSchemaVersions:
+    """Tests for keeping one validator per schema version in _get_or_create_validator."""
 
     @pytest.fixture
     def validation_agent(self):
         loader = HedSchemaLoader()
         return ValidationAgent(loader, use_javascript=False)
 
-    def test_warns_on_schema_version_mismatch(self, validation_agent, caplog):
-        """Should log a warning when validator is reused with a different schema version."""
-        import logging
+    def test_each_schema_version_gets_its_own_validator(self, validation_agent):
+        """A shared agent validates against the schema version each request asks for."""
+        first = validation_agent._get_or_create_validator("8.4.0")
+        other = validation_agent._get_or_create_validator("8.3.0")
+
+        assert first is not other
+        assert first.schema.version == "8.4.0"
+        assert other.schema.version == "8.3.0"
 
-        # First call creates and caches the validator for 8.4.0
-        validation_agent._get_or_create_validator("8.4.0")
+    def test_same_schema_version_reuses_validator(self, validation_agent):
+        """Repeated requests for one schema version share its validator."""
+        first = validation_agent._get_or_create_validator("8.4.0")
 
-        # Second call with a different version should warn
-        with caplog.at_level(logging.WARNING, logger="src.agents.validation_agent"):
-            validation_agent._get_or_create_validator("8.3.0")
+        assert validation_agent._get_or_create_validator("8.4.0") is first
 
-        assert any(
-            "8.4.0" in record.message and "8.3.0" in record.message for record in caplog.records
+    def test_javascript_validators_follow_schema_version(self, monkeypatch, tmp_path):
+        """JavaScript validators are created per schema version as well."""
+        monkeypatch.setattr(HedJavaScriptValidator, "_check_installation", lambda self: None)
+        agent = ValidationAgent(
+            HedSchemaLoader(), use_javascript=True, validator_path=tmp_path, use_hed_lsp=False
         )
 
-    def test_no_warning_on_same_schema_version(self, validation_agent, caplog):
-        """Should not warn when reusing validator for same schema version."""
-        import logging
+        default = agent._get_or_create_validator("8.4.0")
+        other = agent._get_or_create_validator("8.3.0")
+
+        assert default.schema_version == "8.4.0"
+        assert other.schema_version == "8.3.0"
+        assert agent._get_or_create_validator("8.3.0") is other
+
+
+class TestGetOrCreateValidatorConcurrency:
+    """Tests for building the validator once when first calls race."""
+
+    def test_concurrent_first_calls_build_one_validator(self, monkeypatch):
+        """Warm-up threads and request calls racing on a new agent share one validator."""
+        import threading
+        import time
+
+        from src.agents import validation_agent as module
 
-        validation_agent._get_or_create_validator("8.4.0")
+        built = []
 
-        with caplog.at_level(logging.WARNING, logger="src.agents.validation_agent"):
-            validation_agent._get_or_create_validator("8.4.0")
+        def slow_get_validator(**kwargs):
+            time.sleep(0.05)
+            validator = MagicMock()
+            built.append(validator)
+            return validator
 
-        assert not any("reusing cached" in record.message for record in caplog.records)
+        monkeypatch.setattr(module, "get_validator", slow_get_validator)
+        agent = ValidationAgent(HedSchemaLoader(), use_javascript=False, use_hed_lsp=False)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(agent._get_or_create_validator("8.4.0")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(result is built[0] for result in results)
+
+
+class TestValidatorWarmUp:
+    """Tests for preparing the validator before the first validation."""
+
+    def test_warm_up_primes_javascript_worker(self, monkeypatch):
+        """The JavaScript worker is started with a request, so it loads its schema."""
+        agent = ValidationAgent(HedSchemaLoader(), use_javascript=False, use_hed_lsp=False)
+        js_validator = MagicMock(spec=HedJavaScriptValidator)
+        monkeypatch.setitem(agent._validators, "8.4.0", js_validator)
+
+        agent.warm_up("8.4.0")
+
+        js_validator.validate.assert_called_once_with("")
+
+    def test_warm_up_creates_python_validator(self):
+        """The Python validator is created (and its schema loaded) ahead of time."""
+        agent = ValidationAgent(HedSchemaLoader(), use_javascript=False, use_hed_lsp=False)
+
+        agent.warm_up("8.4.0")
+
+        assert "8.4.0" in agent._validators
+
+
+class TestTagSuggestionCache:
+    """Tests for the bounded hed-lsp suggestion cache."""
+
+    @pytest.fixture
+    def validation_agent(self, monkeypatch):
+        from src.agents import validation_agent as module
+
+        self.queried = []
+
+        def fake_suggest(keywords, **kwargs):
+            self.queried.append(list(keywords))
+            return {tag: [f"{tag}-suggestion"] for tag in keywords}
+
+        monkeypatch.setattr(module, "suggest_tags_for_keywords", fake_suggest)
+        monkeypatch.setattr(module, "SUGGESTION_CACHE_SIZE", 2)
+        agent = ValidationAgent(HedSchemaLoader(), use_javascript=False, use_hed_lsp=False)
+        agent.use_hed_lsp = True
+        return agent
+
+    def test_cached_tags_are_not_queried_again(self, validation_agent):
+        """Tags seen before are answered from the cache."""
+        validation_agent._get_tag_suggestions(["Foo"], "8.4.0")
+        result = validation_agent._get_tag_suggestions(["Foo", "Bar"], "8.4.0")
+
+        assert result == {"Foo": ["Foo-suggestion"], "Bar": ["Bar-suggestion"]}
+        assert self.queried == [["Foo"], ["Bar"]]
+
+    def test_least_recently_used_tag_is_evicted(self, validation_agent):
+        """The cache keeps at most SUGGESTION_CACHE_SIZE entries, dropping the oldest use."""
+        validation_agent._get_tag_suggestions(["Foo"], "8.4.0")
+        validation_agent._get_tag_suggestions(["Bar"], "8.4.0")
+        validation_agent._get_tag_suggestions(["Foo"], "8.4.0")  # Foo is now most recent
+        result = validation_agent._get_tag_suggestions(["Baz"], "8.4.0")
+
+        assert result == {"Baz": ["Baz-suggestion"]}
+        assert list(validation_agent._suggestion_cache) == [("Foo", "8.4.0"), ("Baz", "8.4.0")]
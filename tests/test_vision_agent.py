@@ -0,0 +1,47 @@
+"""Tests for the vision agent.
+
+These tests use a fake chat model, so no API calls are made.
+"""
+
+import threading
+from unittest.mock import patch
+
+from langchain_core.language_models import FakeListChatModel
+
+from src.agents.vision_agent import VisionAgent
+from src.utils.image_processing import prepare_image_for_vision_model
+
+# 1x1 red PNG
+PNG_DATA_URI = (
+    "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQ"
+    "DwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+
+
+class TestDescribeImage:
+    """Tests for describe_image."""
+
+    async def test_returns_description_and_metadata(self):
+        """The model's reply and the decoded image metadata are returned."""
+        agent = VisionAgent(FakeListChatModel(responses=["  A red square.  "]))
+
+        result = await agent.describe_image(PNG_DATA_URI)
+
+        assert result["description"] == "A red square."
+        assert result["prompt_used"] == agent.default_prompt
+        assert result["metadata"]["format"] == "PNG"
+
+    async def test_image_is_prepared_off_the_event_loop(self):
+        """Image decoding runs in a worker thread, not on the loop thread."""
+        agent = VisionAgent(FakeListChatModel(responses=["A red square."]))
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def prepare(image_data):
+            threads.append(threading.current_thread())
+            return prepare_image_for_vision_model(image_data)
+
+        with patch("src.agents.vision_agent.prepare_image_for_vision_model", side_effect=prepare):
+            await agent.describe_image(PNG_DATA_URI, custom_prompt="Describe it")
+
+        assert threads and threads[0] is not loop_thread
@@ -0,0 +1,719 @@
+"""Tests for HedAnnotationWorkflow graph construction and routing."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+import src.agents.workflow as workflow_module  # noqa: E402
+from src.agents.validation_agent import ValidationAgent  # noqa: E402
+from src.agents.workflow import (  # noqa: E402
+    _COMPILED_GRAPHS,
+    WORKFLOW_CONFIG_KEY,
+    HedAnnotationWorkflow,
+    _route_after_preprocess,
+    _route_entry,
+)
+from src.utils.schema_loader import HedSchemaLoader  # noqa: E402
+from src.validation.hed_lsp import HedSuggestion, HedSuggestResult  # noqa: E402
+
+
+def _mock_agent(*async_methods: str) -> MagicMock:
+    """Create an agent mock whose listed methods are coroutines."""
+    agent = MagicMock()
+    for name in async_methods:
+        setattr(agent, name, AsyncMock())
+    return agent
+
+
+@pytest.fixture
+def make_workflow(monkeypatch):
+    """Build workflows through the real constructor, with every agent mocked.
+
+    Returns:
+        Factory taking HedAnnotationWorkflow keyword arguments
+    """
+    monkeypatch.setattr(workflow_module, "AnnotationAgent", lambda *a, **k: _mock_agent("annotate"))
+    monkeypatch.setattr(workflow_module, "EvaluationAgent", lambda *a, **k: _mock_agent("evaluate"))
+    monkeypatch.setattr(workflow_module, "AssessmentAgent", lambda *a, **k: _mock_agent("assess"))
+    monkeypatch.setattr(
+        workflow_module, "FeedbackSummarizer", lambda *a, **k: _mock_agent("summarize")
+    )
+    monkeypatch.setattr(
+        workflow_module, "get_shared_validation_agent", lambda **k: _mock_agent("validate")
+    )
+    monkeypatch.setattr(workflow_module, "get_shared_hed_lsp_client", MagicMock)
+
+    def make(**kwargs) -> HedAnnotationWorkflow:
+        kwargs.setdefault("enable_semantic_search", False)
+        return HedAnnotationWorkflow(llm=MagicMock(), use_js_validator=False, **kwargs)
+
+    return make
+
+
+class TestGraphCompilation:
+    """Tests for sharing the compiled graph across workflow instances."""
+
+    def test_compiled_graph_is_shared(self, make_workflow):
+        """Workflows with the same structure should reuse one compiled graph."""
+        first = make_workflow()
+        second = make_workflow()
+
+        assert first.graph.nodes.keys() == second.graph.nodes.keys()
+        assert first.graph.builder is _COMPILED_GRAPHS[False].builder
+        assert second.graph.builder is _COMPILED_GRAPHS[False].builder
+
+    def test_graph_is_bound_to_its_workflow(self, make_workflow):
+        """Each workflow's graph should dispatch nodes to that workflow."""
+        first = make_workflow()
+        second = make_workflow()
+
+        assert first.graph.config["configurable"][WORKFLOW_CONFIG_KEY] is first
+        assert second.graph.config["configurable"][WORKFLOW_CONFIG_KEY] is second
+
+    def test_semantic_search_adds_preprocess_node(self, make_workflow):
+        """Semantic search should compile a separate graph with preprocessing."""
+        with_semantic = make_workflow(enable_semantic_search=True).graph
+        without_semantic = make_workflow().graph
+
+        assert "semantic_preprocess" in with_semantic.nodes
+        assert "semantic_preprocess" not in without_semantic.nodes
+
+
+class TestRouteEntry:
+    """Tests for the conditional entry into semantic preprocessing."""
+
+    def test_new_state_is_preprocessed(self):
+        """A state that has not been annotated yet should be preprocessed."""
+        assert _route_entry({"total_iterations": 0}) == "semantic_preprocess"
+
+    def test_resumed_state_skips_preprocessing(self):
+        """A state that was already annotated should go straight to annotation."""
+        assert _route_entry({"total_iterations": 2}) == "annotate"
+
+
+class TestRouteAfterPreprocess:
+    """Tests for routing after semantic preprocessing."""
+
+    def test_annotates_when_no_draft_was_kept(self):
+        """Without a kept draft, preprocessing should be followed by annotation."""
+        assert _route_after_preprocess({"total_iterations": 0}) == "annotate"
+
+    def test_validates_kept_draft(self):
+        """A draft kept during preprocessing should go straight to validation."""
+        assert _route_after_preprocess({"total_iterations": 1}) == "validate"
+
+
+class TestErrorsNeedSummary:
+    """Tests for deciding whether validation feedback is summarized."""
+
+    def test_few_short_errors_skip_summary(self):
+        """One or two short errors should be passed on as-is."""
+        state = {"validation_errors_augmented": ["[TAG_INVALID] 'Foo'"]}
+        assert not HedAnnotationWorkflow._errors_need_summary(state)
+
+    def test_many_errors_are_summarized(self):
+        """More than two errors should be summarized."""
+        state = {"validation_errors_augmented": ["error 1", "error 2", "error 3"]}
+        assert HedAnnotationWorkflow._errors_need_summary(state)
+
+    def test_long_errors_are_summarized(self):
+        """Long error guidance should be summarized."""
+        state = {"validation_errors_augmented": ["x" * 600]}
+        assert HedAnnotationWorkflow._errors_need_summary(state)
+
+
+class TestRouteAfterValidation:
+    """Tests for routing after validation."""
+
+    def _state(self, errors: list[str]) -> dict:
+        return {
+            "validation_status": "invalid",
+            "validation_attempts": 1,
+            "max_validation_attempts": 5,
+            "validation_errors_augmented": errors,
+        }
+
+    def test_invalid_routes_back_to_annotate(self, make_workflow):
+        """Invalid annotations go straight back to annotation (feedback is summarized in validate)."""
+        workflow = make_workflow()
+        state = self._state(["error 1", "error 2", "error 3"])
+        assert workflow._route_after_validation(state) == "annotate"
+
+    def test_max_attempts_routes_to_end(self, make_workflow):
+        """Exhausted validation attempts should end the workflow."""
+        workflow = make_workflow()
+        state = {**self._state(["error"]), "validation_status": "max_attempts_reached"}
+        assert workflow._route_after_validation(state) == "end"
+
+    def test_valid_routes_to_evaluate(self, make_workflow):
+        """Valid annotations should proceed to evaluation."""
+        workflow = make_workflow()
+        assert workflow._route_after_validation({"validation_status": "valid"}) == "evaluate"
+
+    def test_valid_with_speculative_evaluation_uses_evaluation_route(self, make_workflow):
+        """With evaluation done during validation, valid results route like evaluate."""
+        workflow = make_workflow(speculative_evaluation=True)
+        state = {
+            "validation_status": "valid",
+            "is_faithful": False,
+            "is_valid": True,
+            "run_assessment": False,
+            "total_iterations": 1,
+            "max_total_iterations": 10,
+        }
+
+        assert workflow._route_after_validation(state) == "summarize_feedback"
+        state["is_faithful"] = True
+        assert workflow._route_after_validation(state) == "end"
+
+
+class TestRouteAfterEvaluation:
+    """Tests for routing after evaluation."""
+
+    def _state(self, **overrides) -> dict:
+        state = {
+            "is_faithful": True,
+            "is_valid": True,
+            "run_assessment": False,
+            "total_iterations": 1,
+            "max_total_iterations": 10,
+        }
+        state.update(overrides)
+        return state
+
+    def test_faithful_ends_without_assessment(self, make_workflow):
+        """Faithful annotations end when assessment is not requested."""
+        workflow = make_workflow()
+        assert workflow._route_after_evaluation(self._state()) == "end"
+
+    def test_faithful_with_assessment_requested(self, make_workflow):
+        """Faithful annotations go to assessment when requested, valid or not."""
+        workflow = make_workflow()
+        assert workflow._route_after_evaluation(self._state(run_assessment=True)) == "assess"
+        state = self._state(run_assessment=True, is_valid=False)
+        assert workflow._route_after_evaluation(state) == "assess"
+
+    def test_unfaithful_is_refined(self, make_workflow):
+        """Unfaithful annotations are refined with summarized feedback."""
+        workflow = make_workflow()
+        state = self._state(is_faithful=False, run_assessment=True)
+        assert workflow._route_after_evaluation(state) == "summarize_feedback"
+
+    def test_fused_feedback_skips_summarization(self, make_workflow):
+        """With fused feedback, unfaithful annotations go straight back to annotation."""
+        workflow = make_workflow(fuse_feedback_summary=True)
+        assert workflow._route_after_evaluation(self._state(is_faithful=False)) == "annotate"
+        assert workflow._route_after_evaluation(self._state()) == "end"
+
+    def test_max_iterations_stops_refinement(self, make_workflow):
+        """Reaching max iterations finishes the loop even if unfaithful."""
+        workflow = make_workflow()
+        state = self._state(is_faithful=False, total_iterations=10)
+        assert workflow._route_after_evaluation(state) == "end"
+        state["run_assessment"] = True
+        assert workflow._route_after_evaluation(state) == "assess"
+
+
+class TestAnnotationFromTopHint:
+    """Tests for using a high-confidence semantic hint as the first annotation."""
+
+    def test_high_score_hint_becomes_annotation(self, make_workflow):
+        """A top hint at or above the threshold is used directly."""
+        workflow = make_workflow(enable_semantic_search=True, hint_shortcut_score=0.95)
+        hints = [{"tag": "Sensory-event", "score": 0.97}, {"tag": "Red", "score": 0.5}]
+
+        update = workflow._annotation_from_top_hint({"total_iterations": 0}, hints)
+
+        assert update == {"current_annotation": "Sensory-event", "total_iterations": 1}
+
+    def test_low_score_hint_is_ignored(self, make_workflow):
+        """A top hint below the threshold leaves annotation to the LLM."""
+        workflow = make_workflow(enable_semantic_search=True, hint_shortcut_score=0.95)
+        hints = [{"tag": "Sensory-event", "score": 0.5}]
+
+        assert workflow._annotation_from_top_hint({"total_iterations": 0}, hints) == {}
+
+    def test_disabled_by_default(self, make_workflow):
+        """Without a threshold, hints are never used as annotations."""
+        workflow = make_workflow(enable_semantic_search=True)
+        hints = [{"tag": "Sensory-event", "score": 1.0}]
+
+        assert workflow._annotation_from_top_hint({"total_iterations": 0}, hints) == {}
+
+    def test_grouped_hint_is_ignored(self, make_workflow):
+        """Hints that are not a single plain tag are not used."""
+        workflow = make_workflow(enable_semantic_search=True, hint_shortcut_score=0.5)
+        hints = [{"tag": "(Red, Circle)", "score": 0.99}]
+
+        assert workflow._annotation_from_top_hint({"total_iterations": 0}, hints) == {}
+
+
+class TestLimitedLlmCalls:
+    """Tests for bounding concurrent agent LLM calls."""
+
+    async def test_bounds_concurrent_calls(self, make_workflow):
+        """No more than max_llm_concurrency calls should run at once."""
+        workflow = make_workflow(max_llm_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def fake_call(value: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value
+
+        results = await asyncio.gather(*(workflow._limited(fake_call(i)) for i in range(5)))
+
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 2
+
+
+class TestFusedFeedbackSummary:
+    """Tests for skipping the feedback summarization call."""
+
+    async def test_validate_passes_raw_errors_on(self, make_workflow):
+        """Invalid results keep their raw errors instead of being summarized."""
+        workflow = make_workflow(fuse_feedback_summary=True)
+        errors = ["error 1", "error 2", "error 3"]
+        workflow.validation_agent.validate.return_value = {
+            "validation_status": "invalid",
+            "is_valid": False,
+            "validation_errors_augmented": errors,
+        }
+
+        result = await workflow._validate_node({"current_annotation": "Foo"})
+
+        assert result["validation_errors_augmented"] == errors
+        workflow.feedback_summarizer.summarize.assert_not_called()
+
+
+class TestRetryFeedbackSummary:
+    """Tests for summarizing retry feedback inside the validate node."""
+
+    async def test_summary_is_streamed_within_validate(self, make_workflow):
+        """The summary shows up as a summarize_feedback run nested in validate."""
+        from src.agents.state import create_initial_state
+
+        workflow = make_workflow()
+        workflow.annotation_agent.annotate.return_value = {"current_annotation": "Red"}
+        workflow.validation_agent.validate.side_effect = [
+            {
+                "validation_status": "invalid",
+                "is_valid": False,
+                "validation_attempts": 1,
+                "validation_errors_augmented": ["error 1", "error 2", "error 3"],
+            },
+            {"validation_status": "valid", "is_valid": True, "validation_attempts": 2},
+        ]
+        workflow.feedback_summarizer.summarize.return_value = {
+            "validation_errors_augmented": ["summary"]
+        }
+        workflow.evaluation_agent.evaluate.return_value = {"is_faithful": True, "messages": []}
+        nodes = {"annotate", "validate", "summarize_feedback", "evaluate"}
+
+        events = [
+            (event["event"], event["name"])
+            async for event in workflow.graph.astream_events(
+                create_initial_state("A red light.", "8.4.0"), version="v2"
+            )
+            if event["event"] in ("on_chain_start", "on_chain_end") and event["name"] in nodes
+        ]
+
+        assert events[2:6] == [
+            ("on_chain_start", "validate"),
+            ("on_chain_start", "summarize_feedback"),
+            ("on_chain_end", "summarize_feedback"),
+            ("on_chain_end", "validate"),
+        ]
+        second_annotation = workflow.annotation_agent.annotate.await_args_list[1].args[0]
+        assert second_annotation["validation_errors_augmented"] == ["summary"]
+
+
+class TestValidatorWarmUp:
+    """Tests for setting up the validator during the first annotation."""
+
+    @pytest.fixture
+    def workflow(self, make_workflow) -> HedAnnotationWorkflow:
+        workflow = make_workflow(max_llm_concurrency=1)
+        workflow.annotation_agent.annotate.return_value = {"current_annotation": "Red"}
+        return workflow
+
+    async def test_first_annotation_warms_up_validator(self, workflow):
+        """The validator is set up while the first annotation is generated."""
+        state = {"validation_attempts": 0, "total_iterations": 0, "schema_version": "8.4.0"}
+
+        result = await workflow._annotate_node(state)
+
+        assert result == {"current_annotation": "Red", "total_iterations": 1}
+        workflow.validation_agent.warm_up.assert_called_once_with("8.4.0")
+
+    async def test_retries_skip_warm_up(self, workflow):
+        """Later annotations do not set up the validator again."""
+        state = {"validation_attempts": 1, "total_iterations": 1, "schema_version": "8.4.0"}
+
+        await workflow._annotate_node(state)
+
+        workflow.validation_agent.warm_up.assert_not_called()
+
+    async def test_warm_up_errors_do_not_fail_annotation(self, workflow):
+        """Setup failures are left for the validate node to report."""
+        workflow.validation_agent.warm_up.side_effect = RuntimeError("no validator")
+        state = {"validation_attempts": 0, "total_iterations": 0, "schema_version": "8.4.0"}
+
+        result = await workflow._annotate_node(state)
+
+        assert result["current_annotation"] == "Red"
+
+    def test_workflow_warm_up_loads_vocabulary_and_validator(self, workflow):
+        """Workflow-level warm-up prepares the system prompt and the validator."""
+        workflow.warm_up("8.4.0")
+
+        workflow.annotation_agent.get_system_prompt.assert_called_once_with("8.4.0")
+        workflow.validation_agent.warm_up.assert_called_once_with("8.4.0")
+
+
+class TestValidateStateWrites:
+    """Tests for leaving unchanged empty validation containers out of updates."""
+
+    @pytest.fixture
+    def workflow(self, make_workflow) -> HedAnnotationWorkflow:
+        workflow = make_workflow()
+        workflow.validation_agent.validate.return_value = {
+            "validation_status": "valid",
+            "is_valid": True,
+            "validation_errors": [],
+            "validation_warnings": ["[TAG_EXTENDED] Animal/Marmoset"],
+            "validation_errors_augmented": [],
+            "validation_warnings_augmented": [],
+            "tag_suggestions": {},
+        }
+        return workflow
+
+    async def test_empty_containers_are_not_rewritten(self, workflow):
+        """Containers that were and stay empty are not part of the update."""
+        state = {"current_annotation": "Animal/Marmoset", "validation_errors": []}
+
+        result = await workflow._validate_node(state)
+
+        assert "validation_errors" not in result
+        assert "tag_suggestions" not in result
+        assert result["validation_warnings"] == ["[TAG_EXTENDED] Animal/Marmoset"]
+
+    async def test_previous_errors_are_cleared(self, workflow):
+        """Errors from an earlier attempt are cleared when validation passes."""
+        state = {
+            "current_annotation": "Animal/Marmoset",
+            "validation_errors": ["[TAG_INVALID] Marmoset"],
+            "tag_suggestions": {"Marmoset": ["Animal"]},
+        }
+
+        result = await workflow._validate_node(state)
+
+        assert result["validation_errors"] == []
+        assert result["tag_suggestions"] == {}
+
+
+class TestSpeculativeEvaluation:
+    """Tests for evaluating an annotation while it is being validated."""
+
+    async def test_evaluation_starts_before_validation_finishes(self, make_workflow, monkeypatch):
+        """Validation runs off the event loop, so the evaluation task gets to start."""
+        evaluation_started = threading.Event()
+        overlapped: list[bool] = []
+
+        def validate_annotation(self, annotation: str, schema_version: str, no_extend: bool):
+            # Blocks like a real validator until evaluation has started (or times out)
+            overlapped.append(evaluation_started.wait(timeout=5))
+            return {
+                "is_valid": True,
+                "validation_errors": [],
+                "validation_warnings": [],
+                "validation_errors_augmented": [],
+                "validation_warnings_augmented": [],
+                "tag_suggestions": {},
+                "validator_failed": False,
+            }
+
+        async def evaluate(state):
+            evaluation_started.set()
+            return {"is_faithful": True, "messages": []}
+
+        monkeypatch.setattr(ValidationAgent, "_validate_annotation", validate_annotation)
+        workflow = make_workflow(speculative_evaluation=True)
+        workflow.validation_agent = ValidationAgent(
+            HedSchemaLoader(), use_javascript=False, use_hed_lsp=False
+        )
+        workflow.evaluation_agent.evaluate.side_effect = evaluate
+        state = {
+            "current_annotation": "Sensory-event",
+            "schema_version": "8.4.0",
+            "validation_attempts": 0,
+            "max_validation_attempts": 5,
+        }
+
+        result = await workflow._validate_node(state)
+
+        assert overlapped == [True]
+        assert result["validation_status"] == "valid"
+        assert result["is_faithful"] is True
+
+
+class TestSuggestSemanticHints:
+    """Tests for turning hed-lsp suggestions into semantic hints."""
+
+    async def test_duplicate_tags_are_merged(self, make_workflow):
+        """Each tag appears once, at its first position, with its best score."""
+        workflow = make_workflow(enable_semantic_search=True)
+        workflow.hed_lsp_client.suggest_for_description.return_value = HedSuggestResult(
+            success=True,
+            suggestions=[
+                HedSuggestion(tag="Item/Object", score=0.4),
+                HedSuggestion(tag="Red", score=0.9),
+                HedSuggestion(tag="Item/Object", score=0.7),
+                HedSuggestion(tag="Red"),
+            ],
+        )
+
+        update = await workflow._suggest_semantic_hints("A red object.")
+
+        assert [(h["tag"], h["score"]) for h in update["semantic_hints"]] == [
+            ("Item/Object", 0.7),
+            ("Red", 0.9),
+        ]
+        assert update["extracted_keywords"] == ["Object", "Red"]
+
+
+class TestSpeculativeAnnotation:
+    """Tests for sampling several annotation candidates at once."""
+
+    STATE = {"validation_attempts": 0, "schema_version": "8.4.0"}
+
+    @pytest.fixture
+    def workflow(self, make_workflow) -> HedAnnotationWorkflow:
+        workflow = make_workflow(speculative_annotations=3)
+
+        async def validate(state: dict) -> dict:
+            return {"is_valid": state["current_annotation"].startswith("Valid")}
+
+        workflow.validation_agent.validate.side_effect = validate
+        return workflow
+
+    @staticmethod
+    def _candidates(workflow: HedAnnotationWorkflow, *timed: tuple[str, float]) -> list[str]:
+        """Make successive annotate calls return each annotation after its delay.
+
+        Returns:
+            Annotations whose generation was cancelled, filled in as it happens
+        """
+        calls = iter(timed)
+        cancelled: list[str] = []
+
+        async def annotate(state: dict) -> dict:
+            annotation, delay = next(calls)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(annotation)
+                raise
+            if annotation == "Error":
+                raise RuntimeError("LLM call failed")
+            return {"current_annotation": annotation}
+
+        workflow.annotation_agent.annotate.side_effect = annotate
+        return cancelled
+
+    async def test_first_valid_candidate_wins(self, workflow):
+        """The first valid candidate is returned and the others are cancelled."""
+        cancelled = self._candidates(
+            workflow, ("Invalid-fast", 0.0), ("Valid-middle", 0.01), ("Valid-slow", 1.0)
+        )
+
+        result = await workflow._annotate_speculatively(self.STATE)
+
+        assert result == {"current_annotation": "Valid-middle"}
+        assert cancelled == ["Valid-slow"]
+
+    async def test_falls_back_to_first_finished_candidate(self, workflow):
+        """Without a valid candidate, the first one to finish is returned."""
+        self._candidates(workflow, ("Invalid-slow", 0.02), ("Invalid-fast", 0.0), ("Error", 0.0))
+
+        result = await workflow._annotate_speculatively(self.STATE)
+
+        assert result == {"current_annotation": "Invalid-fast"}
+
+    async def test_all_candidates_failing_raises(self, workflow):
+        """If every candidate fails, annotation fails."""
+        self._candidates(workflow, ("Error", 0.0), ("Error", 0.01), ("Error", 0.0))
+
+        with pytest.raises(RuntimeError, match="All speculative annotation attempts failed"):
+            await workflow._annotate_speculatively(self.STATE)
+
+        assert workflow.annotation_agent.annotate.await_count == 3
+
+    async def test_pending_validation_is_cancelled(self, workflow):
+        """Candidates are validated as they finish; losing validations are cancelled."""
+        cancelled: list[str] = []
+
+        async def validate(state: dict) -> dict:
+            if state["current_annotation"] == "Invalid-slow-check":
+                try:
+                    await asyncio.sleep(1.0)
+                except asyncio.CancelledError:
+                    cancelled.append(state["current_annotation"])
+                    raise
+            return {"is_valid": state["current_annotation"].startswith("Valid")}
+
+        workflow.validation_agent.validate.side_effect = validate
+        self._candidates(
+            workflow, ("Invalid-slow-check", 0.0), ("Valid-fast", 0.01), ("Valid-slow", 1.0)
+        )
+
+        result = await workflow._annotate_speculatively(self.STATE)
+
+        assert result == {"current_annotation": "Valid-fast"}
+        assert cancelled == ["Invalid-slow-check"]
+
+    async def test_chosen_candidate_is_not_validated_again(self, make_workflow, monkeypatch):
+        """The validate node reuses the outcome computed for the chosen candidate."""
+        validated: list[str] = []
+
+        def validate_annotation(self, annotation: str, schema_version: str, no_extend: bool):
+            validated.append(annotation)
+            return {
+                "is_valid": annotation == "Red",
+                "validation_errors": [] if annotation == "Red" else ["[TAG_INVALID] Redd"],
+                "validation_warnings": [],
+                "validation_errors_augmented": [],
+                "validation_warnings_augmented": [],
+                "tag_suggestions": {},
+                "validator_failed": False,
+            }
+
+        monkeypatch.setattr(ValidationAgent, "_validate_annotation", validate_annotation)
+        workflow = make_workflow(speculative_annotations=2)
+        workflow.validation_agent = ValidationAgent(
+            HedSchemaLoader(), use_javascript=False, use_hed_lsp=False
+        )
+        self._candidates(workflow, ("Redd", 0.0), ("Red", 0.01))
+        state = {**self.STATE, "max_validation_attempts": 5}
+
+        chosen = await workflow._annotate_speculatively(state)
+        result = await workflow._validate_node({**state, **chosen})
+
+        assert chosen == {"current_annotation": "Red"}
+        assert result["validation_status"] == "valid"
+        assert validated == ["Redd", "Red"]
+
+
+class TestRunBatch:
+    """Tests for annotating several descriptions in one call."""
+
+    async def test_results_keep_input_order_within_concurrency(self, make_workflow):
+        """Results follow the input order and at most max_concurrency runs overlap."""
+        workflow = make_workflow()
+        running = 0
+        peak = 0
+
+        async def annotate(state: dict) -> dict:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later descriptions finish first
+            await asyncio.sleep(0.05 / len(state["input_description"]))
+            running -= 1
+            return {"current_annotation": state["input_description"]}
+
+        workflow.annotation_agent.annotate.side_effect = annotate
+        workflow.validation_agent.validate.return_value = {
+            "validation_status": "valid",
+            "is_valid": True,
+            "validation_attempts": 1,
+        }
+        workflow.evaluation_agent.evaluate.return_value = {"is_faithful": True, "messages": []}
+        descriptions = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        results = await workflow.arun_batch(descriptions, max_concurrency=2)
+
+        assert [r["current_annotation"] for r in results] == descriptions
+        assert all(r["is_complete"] for r in results)
+        assert peak == 2
+
+
+class TestPreprocessWithDraft:
+    """Tests for drafting a first annotation while semantic hints are fetched."""
+
+    STATE = {
+        "input_description": "A red circle appears.",
+        "validation_attempts": 0,
+        "total_iterations": 0,
+        "schema_version": "8.4.0",
+    }
+    HINTS = {"extracted_keywords": ["Red"], "semantic_hints": [{"tag": "Red", "score": 0.9}]}
+
+    @pytest.fixture
+    def workflow(self, make_workflow) -> HedAnnotationWorkflow:
+        return make_workflow(enable_semantic_search=True, parallel_first_turn=True)
+
+    def _timings(
+        self, workflow: HedAnnotationWorkflow, monkeypatch, hints_delay: float, draft_delay: float
+    ) -> list[str]:
+        """Delay the hints and the draft annotation.
+
+        Returns:
+            Names of the tasks that were cancelled, filled in as it happens
+        """
+        cancelled: list[str] = []
+
+        async def delayed(name: str, delay: float, value: dict) -> dict:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return value
+
+        async def suggest(description: str) -> dict:
+            return await delayed("hints", hints_delay, self.HINTS)
+
+        async def annotate(state: dict) -> dict:
+            return await delayed("draft", draft_delay, {"current_annotation": "Red, Circle"})
+
+        monkeypatch.setattr(workflow, "_suggest_semantic_hints", suggest)
+        workflow.annotation_agent.annotate.side_effect = annotate
+        return cancelled
+
+    async def test_hints_first_cancel_draft(self, workflow, monkeypatch):
+        """When the hints arrive first, the draft is cancelled."""
+        cancelled = self._timings(workflow, monkeypatch, hints_delay=0.0, draft_delay=1.0)
+
+        update = await workflow._preprocess_with_draft(self.STATE)
+
+        assert update == self.HINTS
+        assert cancelled == ["draft"]
+        workflow.validation_agent.validate.assert_not_called()
+
+    async def test_valid_draft_is_kept(self, workflow, monkeypatch):
+        """A valid draft that finishes first is kept alongside the hints."""
+        self._timings(workflow, monkeypatch, hints_delay=0.02, draft_delay=0.0)
+        workflow.validation_agent.validate.return_value = {"is_valid": True}
+
+        update = await workflow._preprocess_with_draft(self.STATE)
+
+        assert update == {**self.HINTS, "current_annotation": "Red, Circle", "total_iterations": 1}
+
+    async def test_invalid_draft_is_discarded(self, workflow, monkeypatch):
+        """An invalid draft is dropped and only the hints are returned."""
+        self._timings(workflow, monkeypatch, hints_delay=0.02, draft_delay=0.0)
+        workflow.validation_agent.validate.return_value = {"is_valid": False}
+
+        update = await workflow._preprocess_with_draft(self.STATE)
+
+        assert update == self.HINTS
+        workflow.validation_agent.validate.assert_awaited_once()